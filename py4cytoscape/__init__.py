@@ -42,12 +42,13 @@ from .style_dependencies import *
 from .style_bypasses import *
 from .py4cytoscape_utils import *
 from .cy_ndex import *
+from .cytoscape_pool import *
 from .decorators import *
 from .py4cytoscape_notebook import get_browser_client_js, get_browser_client_channel, get_jupyter_bridge_url, get_notebook_is_running, set_notebook_is_running
 from .py4cytoscape_logger import set_summary_logger
 from .sandbox import *
 from .py4cytoscape_sandbox import *
-from .py4cytoscape_tuning import set_catchup_filter_secs, set_catchup_network_secs, set_model_propagation_secs
+from .py4cytoscape_tuning import set_catchup_filter_secs, set_catchup_network_secs, set_model_propagation_secs, set_network_cache_secs
 from ._version import __version__
 from .notebook import *
 
@@ -0,0 +1,394 @@
+# -*- coding: utf-8 -*-
+
+"""Asynchronous versions of the CyREST and Commands primitives.
+
+These functions mirror ``cyrest_get``, ``cyrest_post``, ``cyrest_put``, ``cyrest_delete`` and ``commands_post``, but
+return coroutines so that many independent requests (possibly to several Cytoscape instances) can be in flight at
+once. They report errors exactly as the synchronous functions do, and they initialize the sandbox the same way.
+They also wait for Cytoscape as the synchronous functions do: each call accepts a ``timeout``, calls without one use
+the timeout set by ``set_request_timeout``, and a ``deadline`` set around the event loop limits them all (as one set
+within a task limits that task's calls).
+
+This module requires the ``aiohttp`` package (``pip install py4cytoscape[aio]``), and is not imported by
+``import py4cytoscape`` ... use ``import py4cytoscape.aio``.
+
+Examples:
+    >>> import asyncio
+    >>> import py4cytoscape.aio as cyaio
+    >>> async def views(net_suid, suids):
+    ...     return await asyncio.gather(*[cyaio.cyrest_get(f'networks/{net_suid}/nodes/{suid}') for suid in suids])
+    >>> asyncio.run(views(52, [1022, 1023]))
+    [{'SUID': 1022, ...}, {'SUID': 1023, ...}]
+"""
+
+"""Copyright 2020 The Cytoscape Consortium
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit
+persons to whom the Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+
+# External library imports
+import asyncio
+import functools
+import json
+import sys
+import aiohttp
+import requests
+from yarl import URL
+
+# Internal module imports
+from . import commands
+
+# Internal module convenience imports
+from .py4cytoscape_utils import DEFAULT_BASE_URL, build_url
+from .py4cytoscape_logger import log_http_request, log_http_result
+from .py4cytoscape_notebook import do_request_remote, SpoofResponse
+from .exceptions import CyError, CyTimeoutError
+
+# print(f'Starting {__name__} module')
+
+
+DEFAULT_CONNECTION_LIMIT = 100
+
+_connection_limit = DEFAULT_CONNECTION_LIMIT
+_sessions = {}  # (event loop, base_url) -> aiohttp.ClientSession
+
+
+# ==============================================================================
+# I. CyREST API functions
+# ------------------------------------------------------------------------------
+
+async def cyrest_delete(operation=None, parameters=None, base_url=DEFAULT_BASE_URL, require_json=True, timeout=None):
+    """Construct a query, make DELETE call and process the result.
+
+    Args:
+        operation (str): A string to be converted to the REST query namespace
+        parameters (dict): A named list of values to be converted to REST query parameters
+        base_url (str): Ignore unless you need to specify a custom domain,
+            port or version to connect to the CyREST API. Default is http://127.0.0.1:1234
+            and the latest version of the CyREST API supported by this version of py4cytoscape.
+        require_json (bool): True if only JSON is accepted as a response; otherwise, return non-JSON if response is non-JSON
+        timeout (float or tuple or None): seconds to wait for Cytoscape, either as one value or as a (connect, read) tuple; None uses the timeout set by ``set_request_timeout``
+
+    Returns:
+        str or dict: a dict if result was JSON; otherwise a string
+
+    Raises:
+        ValueError: if JSON is expected and response is not JSON
+        CyTimeoutError: if the timeout elapses or a ``deadline`` passes before Cytoscape replies
+        requests.exceptions.RequestException: if can't connect to Cytoscape or Cytoscape returns an error
+
+    Examples:
+        >>> await cyrest_delete('networks/51/views', require_json=False) # deletes views for network 51
+        ''
+    """
+    try:
+        url = build_url(base_url, operation)
+        r = await _do_request('DELETE', url, params=parameters, base_url=base_url, timeout=timeout)
+        r.raise_for_status()
+        try:
+            return r.json()
+        except ValueError as e:
+            if require_json:
+                raise
+            else:
+                return r.text
+    except requests.exceptions.RequestException as e:
+        commands._handle_error(e)
+
+
+async def cyrest_get(operation=None, parameters=None, base_url=DEFAULT_BASE_URL, require_json=True, timeout=None):
+    """Construct a query, make GET call and process the result.
+
+    Args:
+        operation (str): A string to be converted to the REST query namespace
+        parameters (dict): A named list of values to be converted to REST query parameters
+        base_url (str): Ignore unless you need to specify a custom domain,
+            port or version to connect to the CyREST API. Default is http://127.0.0.1:1234
+            and the latest version of the CyREST API supported by this version of py4cytoscape.
+        require_json (bool): True if only JSON is accepted as a response; otherwise, return non-JSON if response is non-JSON
+        timeout (float or tuple or None): seconds to wait for Cytoscape, either as one value or as a (connect, read) tuple; None uses the timeout set by ``set_request_timeout``
+
+    Returns:
+        str or dict: a dict if result was JSON; otherwise a string
+
+    Raises:
+        ValueError: if JSON is expected and response is not JSON
+        CyTimeoutError: if the timeout elapses or a ``deadline`` passes before Cytoscape replies
+        requests.exceptions.RequestException: if can't connect to Cytoscape or Cytoscape returns an error
+
+    Examples:
+        >>> await cyrest_get('version') # fetches CyREST version
+        {'apiVersion': 'v1', 'cytoscapeVersion': '3.8.0'}
+    """
+    try:
+        url = build_url(base_url, operation)
+        r = await _do_request('GET', url, params=parameters, base_url=base_url, timeout=timeout)
+        r.raise_for_status()
+        try:
+            return r.json()
+        except ValueError as e:
+            if require_json:
+                raise
+            else:
+                return r.text
+    except requests.exceptions.RequestException as e:
+        commands._handle_error(e)
+
+
+async def cyrest_post(operation=None, parameters=None, body=None, base_url=DEFAULT_BASE_URL, require_json=True, timeout=None):
+    """Construct a query and body, make POST call and process the result.
+
+    Args:
+        operation (str): A string to be converted to the REST query namespace
+        parameters (dict): A named list of values to be converted to REST query parameters
+        body (dict): A named list of values to be converted to JSON
+        base_url (str): Ignore unless you need to specify a custom domain,
+            port or version to connect to the CyREST API. Default is http://127.0.0.1:1234
+            and the latest version of the CyREST API supported by this version of py4cytoscape.
+        require_json (bool): True if only JSON is accepted as a response; otherwise, return non-JSON if response is non-JSON
+        timeout (float or tuple or None): seconds to wait for Cytoscape, either as one value or as a (connect, read) tuple; None uses the timeout set by ``set_request_timeout``
+
+    Returns:
+        str or dict: a dict if result was JSON; otherwise a string
+
+    Raises:
+        ValueError: if JSON is expected and response is not JSON
+        CyTimeoutError: if the timeout elapses or a ``deadline`` passes before Cytoscape replies
+        requests.exceptions.RequestException: if can't connect to Cytoscape or Cytoscape returns an error
+
+    Examples:
+        >>> await cyrest_post('networks/51/views') # Add a view to a network
+        {'networkViewSUID': '52'}
+    """
+    try:
+        url = build_url(base_url, operation)
+        r = await _do_request('POST', url, params=parameters, json=body, headers={'Content-Type': 'application/json'}, base_url=base_url, timeout=timeout)
+        r.raise_for_status()
+        try:
+            return r.json()
+        except ValueError as e:
+            if require_json:
+                raise
+            else:
+                return r.text
+    except requests.exceptions.RequestException as e:
+        commands._handle_error(e)
+
+
+async def cyrest_put(operation=None, parameters=None, body=None, base_url=DEFAULT_BASE_URL, require_json=True, timeout=None):
+    """Construct a query and body, make PUT call and process the result.
+
+    Args:
+        operation (str): A string to be converted to the REST query namespace
+        parameters (dict): A named list of values to be converted to REST query parameters
+        body (dict): A named list of values to be converted to JSON
+        base_url (str): Ignore unless you need to specify a custom domain,
+            port or version to connect to the CyREST API. Default is http://127.0.0.1:1234
+            and the latest version of the CyREST API supported by this version of py4cytoscape.
+        require_json (bool): True if only JSON is accepted as a response; otherwise, return non-JSON if response is non-JSON
+        timeout (float or tuple or None): seconds to wait for Cytoscape, either as one value or as a (connect, read) tuple; None uses the timeout set by ``set_request_timeout``
+
+    Returns:
+        str or dict: a dict if result was JSON; otherwise a string
+
+    Raises:
+        ValueError: if JSON is expected and response is not JSON
+        CyTimeoutError: if the timeout elapses or a ``deadline`` passes before Cytoscape replies
+        requests.exceptions.RequestException: if can't connect to Cytoscape or Cytoscape returns an error
+
+    Examples:
+        >>> await cyrest_put('networks/views/currentNetworkView', body={'networkViewSUID': view}) # Make a view the current view
+        {'data': {}, 'errors': '[]}
+    """
+    try:
+        url = build_url(base_url, operation)
+        r = await _do_request('PUT', url, params=parameters, json=body, headers={'Content-Type': 'application/json'}, base_url=base_url, timeout=timeout)
+        r.raise_for_status()
+        try:
+            return r.json()
+        except ValueError as e:
+            if require_json:
+                raise
+            else:
+                return r.text
+    except requests.exceptions.RequestException as e:
+        commands._handle_error(e)
+
+
+# ==============================================================================
+# II. Commands API functions
+# ------------------------------------------------------------------------------
+
+async def commands_post(cmd, base_url=DEFAULT_BASE_URL, timeout=None):
+    """Commands POST.
+
+    Using the same syntax as Cytoscape's Command Line Dialog, this function converts a command string into a CyREST
+    query URL, executes a POST request, and parses the result content into a dict object.
+
+    Args:
+        cmd_string (str): command
+        base_url (str): Ignore unless you need to specify a custom domain,
+            port or version to connect to the CyREST API. Default is http://127.0.0.1:1234
+            and the latest version of the CyREST API supported by this version of py4cytoscape.
+        timeout (float or tuple or None): seconds to wait for Cytoscape, either as one value or as a (connect, read) tuple; None uses the timeout set by ``set_request_timeout``
+
+    Returns:
+        dict or list: a structured command reply
+
+    Raises:
+        CyError: if command has an error
+        CyTimeoutError: if the timeout elapses or a ``deadline`` passes before Cytoscape replies
+        requests.exceptions.RequestException: if can't connect to Cytoscape or Cytoscape returns an error
+
+    Examples:
+        >>> await commands_post('apps status app="Network Merge"')
+        {'appName': 'Network Merge', 'status': 'Installed'}
+    """
+    try:
+        post_url = commands._command_2_post_query_url(cmd, base_url=base_url)
+        post_body = commands._command_2_post_query_body(cmd)
+        headers = {'Content-Type': 'application/json', 'Accept': 'application/json'}
+        r = await _do_request('POST', post_url, json=post_body, headers=headers, base_url=base_url, timeout=timeout)
+        r.raise_for_status()
+        res = json.loads(r.text)
+        if len(res['errors']):
+            raise CyError(str(res['errors'][0]))
+        return res['data']
+    except requests.exceptions.RequestException as e:
+        commands._handle_error(e)
+
+
+# ==============================================================================
+# III. HTTP session functions
+# ------------------------------------------------------------------------------
+
+def set_connection_limit(limit=DEFAULT_CONNECTION_LIMIT):
+    """Set the number of simultaneous connections allowed to each CyREST base_url.
+
+    Requests beyond the limit wait for a free connection. The new limit applies to sessions created after
+    ``close_sessions()`` is called or in a new event loop.
+
+    Args:
+        limit (int): maximum number of simultaneous connections to a single base_url
+
+    Returns:
+        int: the previous limit
+
+    Raises:
+        CyError: if limit is not a positive integer
+
+    Examples:
+        >>> set_connection_limit(20)
+        100
+    """
+    global _connection_limit
+    if not isinstance(limit, int) or limit < 1:
+        raise CyError(f'Connection limit must be a positive integer, not "{limit}"')
+    old_limit = _connection_limit
+    _connection_limit = limit
+    return old_limit
+
+
+async def close_sessions(base_url=None):
+    """Close the sessions opened by this event loop.
+
+    Call this before the event loop ends (e.g., at the end of the coroutine passed to ``asyncio.run()``) to release
+    connections cleanly.
+
+    Args:
+        base_url (str or None): base_url whose session should be closed; None closes sessions for all base_urls
+
+    Returns:
+        list: base_urls whose sessions were closed
+
+    Raises:
+        none
+
+    Examples:
+        >>> await close_sessions()
+        ['http://127.0.0.1:1234/v1']
+    """
+    loop = asyncio.get_running_loop()
+    closing = [key for key in _sessions if key[0] is loop and (base_url is None or key[1] == base_url)]
+    for key in closing:
+        await _sessions.pop(key).close()
+    return [key[1] for key in closing]
+
+
+def _get_session(base_url=DEFAULT_BASE_URL):
+    # Return this event loop's session for base_url ... aiohttp sessions can't be shared across event loops
+    loop = asyncio.get_running_loop()
+    for key in [key for key in _sessions if key[0].is_closed()]:
+        del _sessions[key]  # forget sessions whose event loop has already gone away
+    session = _sessions.get((loop, base_url))
+    if session is None or session.closed:
+        session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=_connection_limit))
+        _sessions[(loop, base_url)] = session
+    return session
+
+
+async def _prepare_request(base_url=DEFAULT_BASE_URL):
+    # Resolve local vs remote and initialize the sandbox just as the synchronous functions do. Both are remembered
+    # once resolved, so only the first request pays for them, and that work runs on a worker thread so that it
+    # doesn't block the event loop.
+    client = commands._get_client(base_url)
+    if client._needs_setup():
+        await asyncio.get_running_loop().run_in_executor(None, client.initialize_sandbox)
+    return client.is_remote()
+
+
+def _normalize_params(params):
+    # aiohttp accepts only str, int and float parameter values, so convert the rest the way requests would
+    if params is None: return None
+    normalized = []
+    for key, val in params.items():
+        vals = val if isinstance(val, (list, tuple)) else [val]
+        normalized.extend([(key, v if isinstance(v, str) else str(v)) for v in vals if v is not None])
+    return normalized
+
+
+async def _do_request(method, url, base_url=DEFAULT_BASE_URL, timeout=None, **kwargs):
+    # Determine whether actual call is local or remote ... Jupyter-Bridge calls are blocking, so run them on a thread
+    caller = sys._getframe(1).f_code.co_name
+    remote = await _prepare_request(base_url=base_url)
+    connect_secs, read_secs = commands._get_timeout(timeout, caller=caller)  # fails now if the deadline has passed
+
+    # Encode any JSON body the same way the synchronous functions do
+    if kwargs.get('json') is not None:
+        body = commands._json_serializer(kwargs.pop('json'))
+        if remote:
+            kwargs['json'] = json.loads(body)
+        else:
+            kwargs['data'] = body if isinstance(body, bytes) else body.encode('utf-8')
+
+    try:
+        if remote:
+            return await asyncio.get_running_loop().run_in_executor(None, functools.partial(do_request_remote, method, url, **kwargs))
+
+        # Wait as the synchronous functions do, with the whole call cut short by any deadline
+        log_http_request(method, url, **kwargs)
+        kwargs['params'] = _normalize_params(kwargs.get('params'))
+        kwargs['timeout'] = aiohttp.ClientTimeout(total=commands._get_deadline_remaining(), sock_connect=connect_secs,
+                                                  sock_read=read_secs)
+        try:
+            async with _get_session(base_url).request(method, URL(url, encoded=True), **kwargs) as response:
+                r = SpoofResponse(url, response.status, response.reason, await response.text())
+        except asyncio.TimeoutError as e:
+            raise CyTimeoutError(f'Cytoscape did not reply in time: {e!r}', caller=caller) from e
+        except aiohttp.ClientError as e:
+            raise requests.exceptions.ConnectionError(f'{e} for url: {url}')
+        log_http_result(r)
+        return r
+    finally:
+        commands._note_model_change(method, url, base_url=base_url)  # so the synchronous read cache isn't stale
@@ -55,6 +55,7 @@ def disable_app(app, base_url=DEFAULT_BASE_URL):
     """
     verify_supported_versions(1, 3.7, base_url=base_url)
     res = commands.commands_post(f'apps disable app="{app}"', base_url=base_url)
+    commands._get_client(base_url).clear_caches('layouts')  # apps may add or remove layout algorithms
     return narrate(res)
 
 
@@ -82,6 +83,7 @@ def enable_app(app, base_url=DEFAULT_BASE_URL):
     """
     verify_supported_versions(1, 3.7, base_url=base_url)
     res = commands.commands_post(f'apps enable app="{app}"', base_url=base_url)
+    commands._get_client(base_url).clear_caches('layouts')  # apps may add or remove layout algorithms
     return narrate(res)
 
 
@@ -107,7 +109,7 @@ def get_app_information(app, base_url=DEFAULT_BASE_URL):
         {'app': 'stringApp', 'descriptionName': 'Import and augment Cytoscape networks from STRING', 'version': '1.5.1'}
     """
     verify_supported_versions(1, 3.7, base_url=base_url)
-    res = commands.commands_post(f'apps information app="{app}"', base_url=base_url)
+    res = commands._cached_commands_post(f'apps information app="{app}"', base_url=base_url)
     return res
 
 
@@ -133,6 +135,7 @@ def install_app(app, base_url=DEFAULT_BASE_URL):
     """
     verify_supported_versions(1, 3.7, base_url=base_url)
     res = commands.commands_post(f'apps install app="{app}"', base_url=base_url)
+    commands._get_client(base_url).clear_caches('layouts')  # apps may add or remove layout algorithms
     return narrate(res)
 
 
@@ -156,7 +159,7 @@ def get_available_apps(base_url=DEFAULT_BASE_URL):
         [{'appName': 'stringApp', 'description': 'Import and augment Cytoscape networks from STRING', 'details': ''}, {...}, ...]
     """
     verify_supported_versions(1, 3.7, base_url=base_url)
-    res = commands.commands_post('apps list available', base_url=base_url)
+    res = commands._cached_commands_post('apps list available', base_url=base_url)
     return res
 
 
@@ -180,7 +183,7 @@ def get_disabled_apps(base_url=DEFAULT_BASE_URL):
         [{'appName': 'stringApp', 'version': '1.4.2', 'description': 'Import and augment Cytoscape networks from STRING', 'status': 'Disabled'}, {...}, ...]
     """
     verify_supported_versions(1, 3.7, base_url=base_url)
-    res = commands.commands_post('apps list disabled', base_url=base_url)
+    res = commands._cached_commands_post('apps list disabled', base_url=base_url)
     return res
 
 
@@ -204,7 +207,7 @@ def get_installed_apps(base_url=DEFAULT_BASE_URL):
         [{'appName': 'JSON Support', 'version': '3.7.0', 'description': 'null', 'status': 'Installed'}, ...]
     """
     verify_supported_versions(1, 3.7, base_url=base_url)
-    res = commands.commands_post('apps list installed', base_url=base_url)
+    res = commands._cached_commands_post('apps list installed', base_url=base_url)
     return res
 
 
@@ -228,7 +231,7 @@ def get_uninstalled_apps(base_url=DEFAULT_BASE_URL):
         [{'appName': 'JSON Support', 'version': '3.7.0', 'description': 'null', 'status': 'Uninstalled'}, ...]
     """
     verify_supported_versions(1, 3.7, base_url=base_url)
-    res = commands.commands_post('apps list uninstalled', base_url=base_url)
+    res = commands._cached_commands_post('apps list uninstalled', base_url=base_url)
     return res
 
 
@@ -252,7 +255,7 @@ def get_app_updates(base_url=DEFAULT_BASE_URL):
         [{'appName': 'JSON Support', 'version': '3.7.0', 'information': 'null'}, ...]
     """
     verify_supported_versions(1, 3.7, base_url=base_url)
-    res = commands.commands_post('apps list updates', base_url=base_url)
+    res = commands._cached_commands_post('apps list updates', base_url=base_url)
     return res
 
 
@@ -303,7 +306,7 @@ def get_app_status(app, base_url=DEFAULT_BASE_URL):
         {'appName': 'stringApp', 'status': 'Installed'}
     """
     verify_supported_versions(1, 3.7, base_url=base_url)
-    res = commands.commands_post(f'apps status app="{app}"', base_url=base_url)
+    res = commands._cached_commands_post(f'apps status app="{app}"', base_url=base_url)
     return res
 
 
@@ -329,6 +332,7 @@ def uninstall_app(app, base_url=DEFAULT_BASE_URL):
     """
     verify_supported_versions(1, 3.7, base_url=base_url)
     res = commands.commands_post(f'apps uninstall app="{app}"', base_url=base_url)
+    commands._get_client(base_url).clear_caches('layouts')  # apps may add or remove layout algorithms
     return narrate(res)
 
 
@@ -354,4 +358,5 @@ def update_app(app, base_url=DEFAULT_BASE_URL):
     """
     verify_supported_versions(1, 3.7, base_url=base_url)
     res = commands.commands_post(f'apps update app="{app}"', base_url=base_url)
+    commands._get_client(base_url).clear_caches('layouts')  # apps may add or remove layout algorithms
     return narrate(res)
@@ -54,7 +54,17 @@ def get_collection_list(base_url=DEFAULT_BASE_URL):
         ['galFiltered.sif', 'BINDyeast.sif']
     """
     res = commands.cyrest_get('collections', base_url=base_url)
-    col_names = [get_collection_name(suid, base_url=base_url) for suid in res]
+
+    # Collection names are cached along with network names, so only new collections' names need fetching ... and
+    # those are fetched all at once
+    cache = networks._get_network_cache(base_url)
+    missing_suids = [suid for suid in res if ('collection_name', suid) not in cache]
+    default_tables = commands.cyrest_batch([('GET', f'collections/{suid}/tables/default') for suid in missing_suids],
+                                   base_url=base_url)
+    for suid, table in zip(missing_suids, default_tables):
+        cache[('collection_name', suid)] = table['rows'][0]['name']
+
+    col_names = [cache[('collection_name', suid)] for suid in res]
     return col_names
 
 
@@ -35,13 +35,34 @@ import json
 import webbrowser
 import sys
 import os
+import re
+import time
+import random
+import math
+import threading
+import functools
+import contextlib
+import contextvars
+import collections
+import concurrent.futures
+import numpy as np
+import pandas as pd
+try:
+    import ijson  # Optional ... lets large replies be decoded as they arrive instead of all at once
+except ImportError:
+    ijson = None
+try:
+    import orjson  # Optional ... encodes large JSON bodies several times faster than the json module
+except ImportError:
+    orjson = None
 
 # Internal module convenience imports
 from .py4cytoscape_utils import *
-from .py4cytoscape_logger import cy_log, log_http_result, log_http_request, show_error
-from .py4cytoscape_notebook import running_remote, do_request_remote, check_running_remote, get_notebook_is_running
+from .py4cytoscape_logger import cy_log, log_http_result, log_http_request, log_http_retry, log_http_retries_done, show_error
+from .py4cytoscape_notebook import running_remote, do_request_remote, check_running_remote, get_notebook_is_running, \
+    detect_running_remote, _CYREST_URL_V1
 from .py4cytoscape_sandbox import *
-from .exceptions import CyError
+from .exceptions import CyError, CyTimeoutError
 
 
 def __init__(self):
@@ -79,7 +100,7 @@ def cyrest_api(base_url=DEFAULT_BASE_URL):
 
 
 @cy_log
-def cyrest_delete(operation=None, parameters=None, base_url=DEFAULT_BASE_URL, require_json=True):
+def cyrest_delete(operation=None, parameters=None, base_url=DEFAULT_BASE_URL, require_json=True, retry_policy=None, timeout=None):
     """Construct a query, make DELETE call and process the result.
 
     Args:
@@ -89,12 +110,15 @@ def cyrest_delete(operation=None, parameters=None, base_url=DEFAULT_BASE_URL, re
             port or version to connect to the CyREST API. Default is http://127.0.0.1:1234
             and the latest version of the CyREST API supported by this version of py4cytoscape.
         require_json (bool): True if only JSON is accepted as a response; otherwise, return non-JSON if response is non-JSON
+        retry_policy (RetryPolicy or None): how to retry transient failures; None uses the policy set by ``set_retry_policy``
+        timeout (float or tuple or None): seconds to wait for Cytoscape, either as one value or as a (connect, read) tuple; None uses the timeout set by ``set_request_timeout``
 
     Returns:
         str or dict: a dict if result was JSON; otherwise a string
 
     Raises:
         ValueError: if JSON is expected and response is not JSON
+        CyTimeoutError: if the timeout elapses or a ``deadline`` passes before Cytoscape replies
         requests.exceptions.RequestException: if can't connect to Cytoscape or Cytoscape returns an error
 
     Examples:
@@ -105,7 +129,7 @@ def cyrest_delete(operation=None, parameters=None, base_url=DEFAULT_BASE_URL, re
     """
     try:
         url = build_url(base_url, operation)
-        r = _do_request('DELETE', url, params=parameters, base_url=base_url)
+        r = _do_request('DELETE', url, params=parameters, base_url=base_url, retry_policy=retry_policy, timeout=timeout)
         r.raise_for_status()
         try:
             return r.json()
@@ -119,7 +143,7 @@ def cyrest_delete(operation=None, parameters=None, base_url=DEFAULT_BASE_URL, re
 
 
 @cy_log
-def cyrest_get(operation=None, parameters=None, base_url=DEFAULT_BASE_URL, require_json=True):
+def cyrest_get(operation=None, parameters=None, base_url=DEFAULT_BASE_URL, require_json=True, retry_policy=None, timeout=None):
     """Construct a query, make GET call and process the result.
 
     Args:
@@ -129,12 +153,15 @@ def cyrest_get(operation=None, parameters=None, base_url=DEFAULT_BASE_URL, requi
             port or version to connect to the CyREST API. Default is http://127.0.0.1:1234
             and the latest version of the CyREST API supported by this version of py4cytoscape.
         require_json (bool): True if only JSON is accepted as a response; otherwise, return non-JSON if response is non-JSON
+        retry_policy (RetryPolicy or None): how to retry transient failures; None uses the policy set by ``set_retry_policy``
+        timeout (float or tuple or None): seconds to wait for Cytoscape, either as one value or as a (connect, read) tuple; None uses the timeout set by ``set_request_timeout``
 
     Returns:
         str or dict: a dict if result was JSON; otherwise a string
 
     Raises:
         ValueError: if JSON is expected and response is not JSON
+        CyTimeoutError: if the timeout elapses or a ``deadline`` passes before Cytoscape replies
         requests.exceptions.RequestException: if can't connect to Cytoscape or Cytoscape returns an error
 
     Examples:
@@ -145,7 +172,7 @@ def cyrest_get(operation=None, parameters=None, base_url=DEFAULT_BASE_URL, requi
     """
     try:
         url = build_url(base_url, operation)
-        r = _do_request('GET', url, params=parameters, base_url=base_url)
+        r = _do_request('GET', url, params=parameters, base_url=base_url, retry_policy=retry_policy, timeout=timeout)
         r.raise_for_status()
         try:
             return r.json()
@@ -159,7 +186,7 @@ def cyrest_get(operation=None, parameters=None, base_url=DEFAULT_BASE_URL, requi
 
 
 @cy_log
-def cyrest_post(operation=None, parameters=None, body=None, base_url=DEFAULT_BASE_URL, require_json=True):
+def cyrest_post(operation=None, parameters=None, body=None, base_url=DEFAULT_BASE_URL, require_json=True, retry_policy=None, timeout=None):
     """Construct a query and body, make POST call and process the result.
 
     Args:
@@ -170,12 +197,15 @@ def cyrest_post(operation=None, parameters=None, body=None, base_url=DEFAULT_BAS
             port or version to connect to the CyREST API. Default is http://127.0.0.1:1234
             and the latest version of the CyREST API supported by this version of py4cytoscape.
         require_json (bool): True if only JSON is accepted as a response; otherwise, return non-JSON if response is non-JSON
+        retry_policy (RetryPolicy or None): how to retry transient failures; None uses the policy set by ``set_retry_policy``
+        timeout (float or tuple or None): seconds to wait for Cytoscape, either as one value or as a (connect, read) tuple; None uses the timeout set by ``set_request_timeout``
 
     Returns:
         str or dict: a dict if result was JSON; otherwise a string
 
     Raises:
         ValueError: if JSON is expected and response is not JSON
+        CyTimeoutError: if the timeout elapses or a ``deadline`` passes before Cytoscape replies
         requests.exceptions.RequestException: if can't connect to Cytoscape or Cytoscape returns an error
 
     Examples:
@@ -186,7 +216,7 @@ def cyrest_post(operation=None, parameters=None, body=None, base_url=DEFAULT_BAS
     """
     try:
         url = build_url(base_url, operation)
-        r = _do_request('POST', url, params=parameters, json=body, headers = {'Content-Type': 'application/json'}, base_url=base_url)
+        r = _do_request('POST', url, params=parameters, json=body, headers = {'Content-Type': 'application/json'}, base_url=base_url, retry_policy=retry_policy, timeout=timeout)
         r.raise_for_status()
         try:
             return r.json()
@@ -200,7 +230,7 @@ def cyrest_post(operation=None, parameters=None, body=None, base_url=DEFAULT_BAS
 
 
 @cy_log
-def cyrest_put(operation=None, parameters=None, body=None, base_url=DEFAULT_BASE_URL, require_json=True):
+def cyrest_put(operation=None, parameters=None, body=None, base_url=DEFAULT_BASE_URL, require_json=True, retry_policy=None, timeout=None):
     """Construct a query and body, make PUT call and process the result.
 
     Args:
@@ -211,12 +241,15 @@ def cyrest_put(operation=None, parameters=None, body=None, base_url=DEFAULT_BASE
             port or version to connect to the CyREST API. Default is http://127.0.0.1:1234
             and the latest version of the CyREST API supported by this version of py4cytoscape.
         require_json (bool): True if only JSON is accepted as a response; otherwise, return non-JSON if response is non-JSON
+        retry_policy (RetryPolicy or None): how to retry transient failures; None uses the policy set by ``set_retry_policy``
+        timeout (float or tuple or None): seconds to wait for Cytoscape, either as one value or as a (connect, read) tuple; None uses the timeout set by ``set_request_timeout``
 
     Returns:
         str or dict: a dict if result was JSON; otherwise a string
 
     Raises:
         ValueError: if JSON is expected and response is not JSON
+        CyTimeoutError: if the timeout elapses or a ``deadline`` passes before Cytoscape replies
         requests.exceptions.RequestException: if can't connect to Cytoscape or Cytoscape returns an error
 
     Examples:
@@ -225,7 +258,7 @@ def cyrest_put(operation=None, parameters=None, body=None, base_url=DEFAULT_BASE
     """
     try:
         url = build_url(base_url, operation)
-        r = _do_request('PUT', url, params=parameters, json=body, headers = {'Content-Type': 'application/json'}, base_url=base_url)
+        r = _do_request('PUT', url, params=parameters, json=body, headers = {'Content-Type': 'application/json'}, base_url=base_url, retry_policy=retry_policy, timeout=timeout)
         r.raise_for_status()
         try:
             return r.json()
@@ -238,6 +271,206 @@ def cyrest_put(operation=None, parameters=None, body=None, base_url=DEFAULT_BASE
         _handle_error(e)
 
 
+@cy_log
+def cyrest_get_values(operation=None, parameters=None, base_url=DEFAULT_BASE_URL, item_path='values.item', dtype=object,
+                      count=None, missing=None, retry_policy=None, timeout=None):
+    """Make a GET call and decode an array in the JSON result directly into a NumPy array.
+
+    This is meant for large results, such as table columns. If the ``ijson`` package is installed, the reply is
+    decoded as it arrives and each value is stored in the array as soon as it's decoded, so memory use stays near
+    the size of the final array instead of several times it. Otherwise, the whole reply is decoded first.
+
+    Args:
+        operation (str): A string to be converted to the REST query namespace
+        parameters (dict): A named list of values to be converted to REST query parameters
+        base_url (str): Ignore unless you need to specify a custom domain,
+            port or version to connect to the CyREST API. Default is http://127.0.0.1:1234
+            and the latest version of the CyREST API supported by this version of py4cytoscape.
+        item_path (str): location of the array items in the result, as dot-separated keys ending in 'item' ...
+            'values.item' for ``{'values': [...]}`` or 'item' for ``[...]`` ... if there is no array there, the
+            returned array is empty
+        dtype (str or type): NumPy dtype of the returned array
+        count (int or None): number of values expected, if known, so the array is allocated only once
+        missing (obj): value stored for JSON nulls ... if dtype is an integer or boolean type, the array is
+            returned with object dtype when there are any nulls
+        retry_policy (RetryPolicy or None): how to retry transient failures; None uses the policy set by ``set_retry_policy``
+        timeout (float or tuple or None): seconds to wait for Cytoscape, either as one value or as a (connect, read) tuple; None uses the timeout set by ``set_request_timeout``
+
+    Returns:
+        ndarray: the array items
+
+    Raises:
+        ValueError: if the result isn't JSON
+        CyTimeoutError: if the timeout elapses or a ``deadline`` passes before Cytoscape replies
+        requests.exceptions.RequestException: if can't connect to Cytoscape or Cytoscape returns an error
+
+    Examples:
+        >>> cyrest_get_values('networks/52/tables/defaultnode/columns/SUID', dtype='int64')
+        array([1022, 1023, 1024, ...])
+        >>> cyrest_get_values('networks/52/tables/defaultnode/columns/gal1RGexp', dtype='float64', missing=np.nan)
+        array([-0.262, -0.704, nan, ...])
+    """
+    try:
+        url = build_url(base_url, operation)
+        r = _do_request('GET', url, params=parameters, stream=True, base_url=base_url, retry_policy=retry_policy, timeout=timeout)
+        r.raise_for_status()
+        try:
+            if ijson and hasattr(r, 'raw'):
+                r.raw.decode_content = True  # undo any gzip compression as the reply streams in
+                items = ijson.items(r.raw, item_path, use_float=True)
+            else:
+                items = r.json()
+                for key in item_path.split('.')[:-1]:
+                    items = items.get(key, []) if isinstance(items, dict) else []
+            return _fill_array(items, dtype, count, missing)
+        except (ValueError, ijson.JSONError if ijson else ValueError) as e:
+            raise ValueError(f'Result is not JSON: {e}')
+        finally:
+            r.close()
+    except requests.exceptions.RequestException as e:
+        _handle_error(e)
+
+
+def _fill_array(items, dtype=object, count=None, missing=None):
+    # Store items into a NumPy array as they're produced, growing the array only if count was too small
+    values = np.empty(count or 1024, dtype=dtype)
+    missing_at = []
+    n = 0
+    for item in items:
+        if n == len(values):
+            values = np.resize(values, 2 * n)
+        if item is None:
+            missing_at.append(n)
+        else:
+            values[n] = item
+        n += 1
+    values = values[:n] if n == len(values) else values[:n].copy()  # don't hold on to unused space
+    if missing_at:
+        if values.dtype.kind in 'iub': values = values.astype(object)  # these types can't hold a missing value
+        values[missing_at] = missing
+    return values
+
+
+DEFAULT_BATCH_CONCURRENCY = 8
+_batch_concurrency = DEFAULT_BATCH_CONCURRENCY
+
+
+@cy_log
+def cyrest_batch(specs, base_url=DEFAULT_BASE_URL, require_json=True, max_workers=None, return_errors=False, retry_policy=None, timeout=None):
+    """Make a batch of independent CyREST calls concurrently and return the results in order.
+
+    Each spec is a (method, operation, parameters, body) tuple, where method is 'GET', 'POST', 'PUT' or 'DELETE',
+    and the others are as for ``cyrest_get``, ``cyrest_post``, etc. Trailing elements may be omitted. Calls are
+    made on a pool of worker threads, so they must not depend on each other's results or ordering.
+
+    Args:
+        specs (list): list of (method, operation, parameters, body) tuples
+        base_url (str): Ignore unless you need to specify a custom domain,
+            port or version to connect to the CyREST API. Default is http://127.0.0.1:1234
+            and the latest version of the CyREST API supported by this version of py4cytoscape.
+        require_json (bool): True if only JSON is accepted as a response; otherwise, return non-JSON if response is non-JSON
+        max_workers (int or None): maximum number of calls in flight at once; None uses ``set_batch_concurrency()``
+        return_errors (bool): True to return each failed call's exception in place of its result; False to raise
+            the first failure (in spec order) after all calls have finished
+        retry_policy (RetryPolicy or None): how to retry transient failures; None uses the policy set by ``set_retry_policy``
+        timeout (float or tuple or None): seconds to wait for Cytoscape, either as one value or as a (connect, read) tuple; None uses the timeout set by ``set_request_timeout``
+
+    Returns:
+        list: one result per spec, in spec order ... each a dict if result was JSON; otherwise a string
+
+    Raises:
+        ValueError: if JSON is expected and response is not JSON
+        CyError: if a spec is invalid or Cytoscape returns an error for a call
+        CyTimeoutError: if the timeout elapses or a ``deadline`` passes before Cytoscape replies
+        requests.exceptions.RequestException: if can't connect to Cytoscape or Cytoscape returns an error
+
+    Examples:
+        >>> cyrest_batch([('GET', 'networks/51/nodes/1022'), ('GET', 'networks/51/nodes/1023')])
+        [{'SUID': 1022, 'shared name': 'YDR277C', ...}, {'SUID': 1023, 'shared name': 'YDL194W', ...}]
+        >>> cyrest_batch([('GET', 'version'), ('GET', 'networks/0')], return_errors=True)
+        [{'apiVersion': 'v1', 'cytoscapeVersion': '3.8.0'}, CyError('In cyrest_batch(): Network does not exist')]
+    """
+    specs = [tuple(spec) + (None,) * (4 - len(spec)) for spec in specs]
+    for spec in specs:
+        if len(spec) != 4 or str(spec[0]).upper() not in ['GET', 'POST', 'PUT', 'DELETE']:
+            raise CyError(f'Invalid batch request "{spec}" ... must be (method, operation, parameters, body)')
+    if len(specs) == 0: return []
+
+    # Resolve local vs remote and the sandbox once, before any worker needs them
+    client = _get_client(base_url)
+    client.initialize_sandbox()
+    if client.is_remote():
+        max_workers = 1 # Jupyter-Bridge carries one request at a time on a channel, so replies can't be interleaved
+    else:
+        max_workers = min(max_workers or _batch_concurrency, len(specs))
+
+    # Workers are separate threads, so hand them the caller's deadline explicitly
+    expires = _deadline_expires.get()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(_cyrest_request, method.upper(), operation, parameters, body,
+                                   base_url=base_url, require_json=require_json, retry_policy=retry_policy, timeout=timeout,
+                                   expires=expires)
+                   for method, operation, parameters, body in specs]
+
+    results = [future.exception() or future.result() for future in futures]
+    if not return_errors:
+        for future, result in zip(futures, results):
+            if future.exception(): raise result
+    return results
+
+
+@cy_log
+def set_batch_concurrency(max_workers=None):
+    """Set the number of calls ``cyrest_batch`` keeps in flight at once.
+
+    Values above the session pool size (see ``set_session_pool_size``) gain nothing, as calls beyond the pool size
+    open connections that are discarded afterward.
+
+    Args:
+        max_workers (int or None): maximum number of concurrent calls; None restores the default
+
+    Returns:
+        int: the previous number of concurrent calls
+
+    Raises:
+        CyError: if max_workers is not a positive integer
+
+    Examples:
+        >>> set_batch_concurrency(4)
+        8
+    """
+    global _batch_concurrency
+    if max_workers is None: max_workers = DEFAULT_BATCH_CONCURRENCY
+    if not isinstance(max_workers, int) or max_workers < 1:
+        raise CyError(f'Batch concurrency must be a positive integer, not "{max_workers}"')
+    old_max_workers = _batch_concurrency
+    _batch_concurrency = max_workers
+    return old_max_workers
+
+
+def _cyrest_request(method, operation=None, parameters=None, body=None, base_url=DEFAULT_BASE_URL, require_json=True,
+                    retry_policy=None, timeout=None, expires=None, caller='cyrest_batch'):
+    # Same as cyrest_get/post/put/delete, but without function logging, whose nesting can't be shared across threads.
+    # Errors are reported as coming from caller, the public function that made the request.
+    _deadline_expires.set(expires)
+    try:
+        url = build_url(base_url, operation)
+        if method in ['POST', 'PUT']:
+            r = _do_request(method, url, params=parameters, json=body, headers={'Content-Type': 'application/json'}, base_url=base_url, retry_policy=retry_policy, timeout=timeout)
+        else:
+            r = _do_request(method, url, params=parameters, base_url=base_url, retry_policy=retry_policy, timeout=timeout)
+        r.raise_for_status()
+        try:
+            return r.json()
+        except ValueError as e:
+            if require_json:
+                raise
+            else:
+                return r.text
+    except requests.exceptions.RequestException as e:
+        _handle_error(e, caller=caller)
+
+
 # ==============================================================================
 # II. Commands API functions
 # ------------------------------------------------------------------------------
@@ -270,7 +503,7 @@ def commands_api(base_url=DEFAULT_BASE_URL):
 
 # TODO: Make sure this works the same as in R
 @cy_log
-def commands_get(cmd_string, base_url=DEFAULT_BASE_URL):
+def commands_get(cmd_string, base_url=DEFAULT_BASE_URL, retry_policy=None, timeout=None):
     """Commands GET.
 
     Using the same syntax as Cytoscape's Command Line Dialog, this function converts a command string into a
@@ -281,12 +514,15 @@ def commands_get(cmd_string, base_url=DEFAULT_BASE_URL):
         base_url (str): Ignore unless you need to specify a custom domain,
             port or version to connect to the CyREST API. Default is http://127.0.0.1:1234
             and the latest version of the CyREST API supported by this version of py4cytoscape.
+        retry_policy (RetryPolicy or None): how to retry transient failures; None uses the policy set by ``set_retry_policy``
+        timeout (float or tuple or None): seconds to wait for Cytoscape, either as one value or as a (connect, read) tuple; None uses the timeout set by ``set_request_timeout``
 
     Returns:
         list: a list of lines in the command result (omitting the "Finished" line at the end)
 
     Raises:
         CyError: if command has an error
+        CyTimeoutError: if the timeout elapses or a ``deadline`` passes before Cytoscape replies
         requests.exceptions.RequestException: if can't connect to Cytoscape or Cytoscape returns an error
 
     Examples:
@@ -299,7 +535,7 @@ def commands_get(cmd_string, base_url=DEFAULT_BASE_URL):
     """
     try:
         get_url, parameters = _command_2_get_query(cmd_string, base_url=base_url)
-        r = _do_request('GET', get_url, params=parameters, headers={'Accept': 'text/plain'}, base_url=base_url)
+        r = _do_request('GET', get_url, params=parameters, headers={'Accept': 'text/plain'}, base_url=base_url, retry_policy=retry_policy, timeout=timeout)
         r.raise_for_status()
 
         # Break response into a list of lines and return it
@@ -355,7 +591,7 @@ def commands_help(cmd_string='help', base_url=DEFAULT_BASE_URL):
 
 
 @cy_log
-def commands_post(cmd, base_url=DEFAULT_BASE_URL):
+def commands_post(cmd, base_url=DEFAULT_BASE_URL, retry_policy=None, timeout=None):
     """Commands POST.
 
     Using the same syntax as Cytoscape's Command Line Dialog, this function converts a command string into a CyREST
@@ -366,12 +602,15 @@ def commands_post(cmd, base_url=DEFAULT_BASE_URL):
         base_url (str): Ignore unless you need to specify a custom domain,
             port or version to connect to the CyREST API. Default is http://127.0.0.1:1234
             and the latest version of the CyREST API supported by this version of py4cytoscape.
+        retry_policy (RetryPolicy or None): how to retry transient failures; None uses the policy set by ``set_retry_policy``
+        timeout (float or tuple or None): seconds to wait for Cytoscape, either as one value or as a (connect, read) tuple; None uses the timeout set by ``set_request_timeout``
 
     Returns:
         dict or list: a structured command reply
 
     Raises:
         CyError: if command has an error
+        CyTimeoutError: if the timeout elapses or a ``deadline`` passes before Cytoscape replies
         requests.exceptions.RequestException: if can't connect to Cytoscape or Cytoscape returns an error
 
     Examples:
@@ -386,7 +625,7 @@ def commands_post(cmd, base_url=DEFAULT_BASE_URL):
         post_url = _command_2_post_query_url(cmd, base_url=base_url)
         post_body = _command_2_post_query_body(cmd)
         headers = {'Content-Type': 'application/json', 'Accept': 'application/json'}
-        r = _do_request('POST', post_url, json=post_body, headers=headers, base_url=base_url)
+        r = _do_request('POST', post_url, json=post_body, headers=headers, base_url=base_url, retry_policy=retry_policy, timeout=timeout)
         r.raise_for_status()
         res = json.loads(r.text)
         if len(res['errors']):
@@ -583,6 +822,863 @@ def command_sleep(duration=None, base_url=DEFAULT_BASE_URL):
     return commands_post(f'command sleep{dur_str}', base_url=base_url)
 
 
+# ==============================================================================
+# III. HTTP session and client functions
+# ------------------------------------------------------------------------------
+
+DEFAULT_SESSION_POOL_SIZE = 10
+
+_session_pool_size = DEFAULT_SESSION_POOL_SIZE
+_clients = {}  # base_url -> CyRESTClient
+_clients_lock = threading.Lock()
+_sandbox_generation = 0  # incremented each time a sandbox is set, so clients can tell whether theirs is current
+
+
+class CyRESTClient:
+    """Connection state for one Cytoscape instance, resolved once and reused by every call to its base_url.
+
+    A client holds the keep-alive session for its base_url, whether calls go directly to Cytoscape or through
+    Jupyter-Bridge, whether the current sandbox has been set up in its Cytoscape instance, and caches of facts about
+    that instance. Every function that
+    takes a ``base_url`` uses the client returned by ``get_client(base_url)``, so a process can drive several
+    Cytoscape instances just by passing different base_urls, and each instance's state is resolved only once.
+
+    The ``cyrest_*`` and ``commands_*`` methods are the same as the functions of the same name, but with base_url
+    filled in.
+
+    Args:
+        base_url (str): Ignore unless you need to specify a custom domain,
+            port or version to connect to the CyREST API. Default is http://127.0.0.1:1234
+            and the latest version of the CyREST API supported by this version of py4cytoscape.
+
+    Examples:
+        >>> client = get_client('http://127.0.0.1:1235/v1')
+        >>> client.cyrest_get('version')
+        {'apiVersion': 'v1', 'cytoscapeVersion': '3.9.1'}
+        >>> client.commands_post('network list')
+        [...]
+    """
+
+    def __init__(self, base_url=DEFAULT_BASE_URL):
+        self.base_url = base_url
+        self._lock = threading.RLock()
+        self._session = None
+        self._remote = None  # True if this Cytoscape is reached through Jupyter-Bridge, once known
+        self._requester = None
+        self._sandbox_generation = None  # _sandbox_generation of the sandbox set up in this instance
+        self._caches = {}  # cache name -> (dict, time.monotonic() when it was created)
+        self._generation = 0  # incremented by every call that may change the Cytoscape model
+        self._read_cache = collections.OrderedDict()  # read key -> (generation, encoded reply), least recent first
+        self._read_cache_bytes = 0
+
+    def __repr__(self):
+        return f'CyRESTClient(base_url={self.base_url!r})'
+
+    @property
+    def session(self):
+        """requests.Session: keep-alive session for this base_url, created (with its connection pool) on first use."""
+        with self._lock:
+            if self._session is None:
+                session = requests.Session()
+                session.headers['Accept-Encoding'] = 'gzip, deflate'  # let Cytoscape compress large replies
+                adapter = requests.adapters.HTTPAdapter(pool_connections=_session_pool_size,
+                                                        pool_maxsize=_session_pool_size)
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                self._session = session
+            return self._session
+
+    def get_requester(self):
+        """Return the function that makes HTTP calls to this Cytoscape, either directly or through Jupyter-Bridge."""
+        if self._requester is None:
+            remote = self._detect_remote()
+            with self._lock:
+                self._remote = remote
+                self._requester = do_request_remote if remote else functools.partial(_do_request_local,
+                                                                                       base_url=self.base_url)
+        return self._requester
+
+    def is_remote(self):
+        """Return True if this Cytoscape is reached through Jupyter-Bridge, or False if it's reached directly."""
+        self.get_requester()
+        return self._remote
+
+    def _detect_remote(self):
+        # Ask this instance's own URL whether it's local. The process-wide running_remote() answer (which callers can
+        # also set) is about the default Cytoscape, so it's used only for that one.
+        if self.base_url == _CYREST_URL_V1:
+            return _find_remote_cytoscape()
+        remote = detect_running_remote(self.base_url)
+        if remote is None:
+            raise requests.exceptions.RequestException(f'Cannot find local or remote Cytoscape at {self.base_url}. '
+                                                       'Start Cytoscape and then proceed.')
+        return remote
+
+    def initialize_sandbox(self):
+        """Make sure the current sandbox is set up in this Cytoscape instance, and return its (name, path)."""
+        requester = self.get_requester()
+        with self._lock:
+            if get_sandbox_reinitialize():
+                return do_set_sandbox(_get_default_sandbox(), requester, base_url=self.base_url)
+            if self._sandbox_generation != _sandbox_generation:
+                # The sandbox was last set up in a different Cytoscape instance, so set up the same one here
+                sandbox_name = get_current_sandbox_name()
+                generation = _sandbox_generation
+                if sandbox_name:
+                    do_set_sandbox({'sandboxName': sandbox_name, 'copySamples': False, 'reinitialize': False},
+                                   requester, base_url=self.base_url, new_generation=False)
+                self._sandbox_generation = generation
+            return get_current_sandbox()
+
+    def get_cache(self, name, ttl_secs=None):
+        """Return this client's cache of the given name, a dict that callers fill with whatever they've looked up.
+
+        Caches hold facts about the Cytoscape instance (e.g., network SUIDs) so they needn't be fetched again. Code that
+        changes those facts must call ``clear_caches``.
+
+        Args:
+            name (str): name of the cache
+            ttl_secs (float or None): age in seconds at which the cache is emptied, to catch changes made outside of
+                py4cytoscape; None keeps the cache until it's cleared
+
+        Returns:
+            dict: the cache
+        """
+        now = time.monotonic()
+        cache = self._caches.get(name)
+        if cache is None or (ttl_secs is not None and cache[1] + ttl_secs <= now):
+            cache = self._caches[name] = ({}, now)
+        return cache[0]
+
+    def get_versions(self):
+        """Return the versions of this Cytoscape and its CyREST API, fetching them only once per connection.
+
+        The versions are fetched again after ``reset()``, after a call fails because Cytoscape can't be reached, and
+        by ``cytoscape_ping``.
+
+        Returns:
+            dict: {'apiVersion': <version>, 'cytoscapeVersion': <version>}
+
+        Raises:
+            CyError: if error connecting to CyREST
+            requests.exceptions.RequestException: if can't connect to Cytoscape or Cytoscape returns an error
+        """
+        cache = self.get_cache('versions')
+        if 'versions' not in cache:
+            versions = cyrest_get('version', base_url=self.base_url)
+            if len(versions) == 0:
+                raise CyError('CyREST connection problem. py4cytoscape cannot continue!')
+            cache['versions'] = versions
+        return dict(cache['versions'])
+
+    def clear_caches(self, *names):
+        """Empty the named caches, or all caches (including the read cache) if no names are given, so values are
+        fetched from Cytoscape again."""
+        for name in names or list(self._caches):
+            self._caches.pop(name, None)
+        if not names:
+            with self._lock:
+                self._read_cache.clear()
+                self._read_cache_bytes = 0
+
+    @property
+    def generation(self):
+        """int: model generation, which goes up each time a call may have changed the Cytoscape model."""
+        return self._generation
+
+    def new_generation(self):
+        """Note that the Cytoscape model may have changed, so replies in the read cache are no longer used."""
+        with self._lock:
+            self._generation += 1
+
+    def reset(self):
+        """Forget everything resolved for this base_url and close its session, as is needed after Cytoscape restarts."""
+        with self._lock:
+            session, self._session = self._session, None
+            self._remote = self._requester = None
+            self._sandbox_generation = None
+            self._caches = {}
+            self._read_cache.clear()
+            self._read_cache_bytes = 0
+        if session is not None: session.close()
+
+    def _needs_setup(self):
+        # True if the next call would have to resolve the requester or set up the sandbox first
+        return self._requester is None or get_sandbox_reinitialize() or \
+               self._sandbox_generation != _sandbox_generation
+
+    def cyrest_get(self, operation=None, parameters=None, **kwargs):
+        """Same as ``cyrest_get``, but for this client's base_url."""
+        return cyrest_get(operation, parameters, base_url=self.base_url, **kwargs)
+
+    def cyrest_post(self, operation=None, parameters=None, body=None, **kwargs):
+        """Same as ``cyrest_post``, but for this client's base_url."""
+        return cyrest_post(operation, parameters, body, base_url=self.base_url, **kwargs)
+
+    def cyrest_put(self, operation=None, parameters=None, body=None, **kwargs):
+        """Same as ``cyrest_put``, but for this client's base_url."""
+        return cyrest_put(operation, parameters, body, base_url=self.base_url, **kwargs)
+
+    def cyrest_delete(self, operation=None, parameters=None, **kwargs):
+        """Same as ``cyrest_delete``, but for this client's base_url."""
+        return cyrest_delete(operation, parameters, base_url=self.base_url, **kwargs)
+
+    def commands_get(self, cmd_string, **kwargs):
+        """Same as ``commands_get``, but for this client's base_url."""
+        return commands_get(cmd_string, base_url=self.base_url, **kwargs)
+
+    def commands_post(self, cmd, **kwargs):
+        """Same as ``commands_post``, but for this client's base_url."""
+        return commands_post(cmd, base_url=self.base_url, **kwargs)
+
+
+@cy_log
+def get_client(base_url=DEFAULT_BASE_URL):
+    """Return the client that holds the connection state for a base_url, creating it on first use.
+
+    Args:
+        base_url (str): Ignore unless you need to specify a custom domain,
+            port or version to connect to the CyREST API. Default is http://127.0.0.1:1234
+            and the latest version of the CyREST API supported by this version of py4cytoscape.
+
+    Returns:
+        CyRESTClient: the one client for this base_url
+
+    Raises:
+        none
+
+    Examples:
+        >>> get_client()
+        CyRESTClient(base_url='http://127.0.0.1:1234/v1')
+        >>> get_client('http://127.0.0.1:1235/v1').cyrest_get('version')
+        {'apiVersion': 'v1', 'cytoscapeVersion': '3.9.1'}
+    """
+    return _get_client(base_url)
+
+
+def _get_client(base_url=DEFAULT_BASE_URL):
+    # Same as get_client, but without function logging, as it's called for every request
+    client = _clients.get(base_url)
+    if client is None:
+        with _clients_lock:
+            client = _clients.setdefault(base_url, CyRESTClient(base_url))
+    return client
+
+
+@cy_log
+def set_session_pool_size(pool_size=DEFAULT_SESSION_POOL_SIZE):
+    """Set the number of keep-alive connections pooled for each CyREST base_url.
+
+    All existing sessions are closed so that the new pool size applies to the next call made to each base_url.
+
+    Args:
+        pool_size (int): maximum number of connections kept open to a single base_url
+
+    Returns:
+        int: the previous pool size
+
+    Raises:
+        CyError: if pool_size is not a positive integer
+
+    Examples:
+        >>> set_session_pool_size(20)
+        10
+    """
+    global _session_pool_size
+    if not isinstance(pool_size, int) or pool_size < 1:
+        raise CyError(f'Session pool size must be a positive integer, not "{pool_size}"')
+    old_pool_size = _session_pool_size
+    _session_pool_size = pool_size
+    reset_sessions()
+    return old_pool_size
+
+
+@cy_log
+def get_session_pool_size():
+    """Return the number of keep-alive connections pooled for each CyREST base_url.
+
+    Returns:
+        int: maximum number of connections kept open to a single base_url
+
+    Raises:
+        none
+
+    Examples:
+        >>> get_session_pool_size()
+        10
+    """
+    return _session_pool_size
+
+
+@cy_log
+def get_session_info(base_url=DEFAULT_BASE_URL):
+    """Report on the keep-alive session used to reach a CyREST base_url.
+
+    A pool hit is a request that was sent over a connection that was already open, and a pool miss is a request
+    that had to open a new connection. Under a steady load, hits should greatly outnumber misses.
+
+    Args:
+        base_url (str): Ignore unless you need to specify a custom domain,
+            port or version to connect to the CyREST API. Default is http://127.0.0.1:1234
+            and the latest version of the CyREST API supported by this version of py4cytoscape.
+
+    Returns:
+        dict: {'base_url': base_url, 'active': True if a session exists, 'pool_size': max connections,
+            'requests': requests sent, 'pool_hits': requests on reused connections, 'pool_misses': new connections}
+
+    Raises:
+        none
+
+    Examples:
+        >>> get_session_info()
+        {'base_url': 'http://127.0.0.1:1234/v1', 'active': True, 'pool_size': 10, 'requests': 312, 'pool_hits': 311, 'pool_misses': 1}
+    """
+    client = _clients.get(base_url)
+    session = client._session if client else None
+    num_requests = num_connections = 0
+    if session is not None:
+        for adapter in set(session.adapters.values()):  # same adapter is mounted for http and https
+            pools = adapter.poolmanager.pools
+            for key in pools.keys():
+                pool = pools[key]
+                num_requests += pool.num_requests
+                num_connections += pool.num_connections
+    return {'base_url': base_url, 'active': session is not None, 'pool_size': _session_pool_size,
+            'requests': num_requests, 'pool_hits': num_requests - num_connections, 'pool_misses': num_connections}
+
+
+@cy_log
+def reset_sessions(base_url=None):
+    """Close keep-alive sessions so that the next call opens fresh connections.
+
+    This is useful after Cytoscape has been restarted, or when connections appear to have gone stale.
+
+    Args:
+        base_url (str or None): base_url whose session should be closed; None closes sessions for all base_urls
+
+    Returns:
+        list: base_urls whose sessions were closed
+
+    Raises:
+        none
+
+    Examples:
+        >>> reset_sessions()
+        ['http://127.0.0.1:1234/v1']
+        >>> reset_sessions('http://127.0.0.1:1235/v1')
+        []
+    """
+    with _clients_lock:
+        clients = [client for url, client in _clients.items() if base_url is None or url == base_url]
+    closing = []
+    for client in clients:
+        with client._lock:
+            session, client._session = client._session, None
+        if session is not None:
+            session.close()
+            closing.append(client.base_url)
+    return closing
+
+
+def _get_session(base_url=DEFAULT_BASE_URL):
+    # Return the session for this base_url, creating it (and its connection pool) on first use
+    return _get_client(base_url).session
+
+
+# ==============================================================================
+# IV. Read cache functions
+# ------------------------------------------------------------------------------
+
+DEFAULT_READ_CACHE_MAX_BYTES = 8 * 1024 * 1024
+
+_read_cache_max_bytes = DEFAULT_READ_CACHE_MAX_BYTES
+_read_cache_state = threading.local()  # fresh: True within fresh_reads(); reading: True while filling the read cache
+
+
+@cy_log
+def set_read_cache_size(max_bytes=DEFAULT_READ_CACHE_MAX_BYTES):
+    """Set how much memory each CyREST base_url's read cache may use.
+
+    Functions that read facts that only change when py4cytoscape changes them (e.g., style names, visual property
+    values and style mappings) keep the replies in a read cache, so they needn't be fetched again. Any call that may
+    change the Cytoscape model (i.e., any POST, PUT or DELETE, any command other than those that only read, such as
+    ``network list``, and any GET that applies a layout or style) starts a new model generation, and replies from
+    older generations aren't used. Opening or closing a session empties the cache. When the cache is
+    full, the least recently used replies are dropped.
+
+    Args:
+        max_bytes (int): bytes of encoded replies to keep per base_url; 0 turns the read cache off
+
+    Returns:
+        int: the previous max_bytes
+
+    Raises:
+        CyError: if max_bytes is not a non-negative integer
+
+    Examples:
+        >>> set_read_cache_size(32 * 1024 * 1024)
+        8388608
+        >>> set_read_cache_size(0) # turn the read cache off
+        33554432
+    """
+    global _read_cache_max_bytes
+    if not isinstance(max_bytes, int) or max_bytes < 0:
+        raise CyError(f'Read cache size must be a non-negative integer, not "{max_bytes}"')
+    old_max_bytes = _read_cache_max_bytes
+    _read_cache_max_bytes = max_bytes
+    with _clients_lock:
+        clients = list(_clients.values())
+    for client in clients:
+        with client._lock:
+            _trim_read_cache(client)
+    return old_max_bytes
+
+
+@cy_log
+def get_read_cache_info(base_url=DEFAULT_BASE_URL):
+    """Report on the read cache for a CyREST base_url.
+
+    Args:
+        base_url (str): Ignore unless you need to specify a custom domain,
+            port or version to connect to the CyREST API. Default is http://127.0.0.1:1234
+            and the latest version of the CyREST API supported by this version of py4cytoscape.
+
+    Returns:
+        dict: {'base_url': base_url, 'generation': model generation, 'entries': replies cached, 'bytes': bytes used,
+            'max_bytes': bytes allowed}
+
+    Raises:
+        none
+
+    Examples:
+        >>> get_read_cache_info()
+        {'base_url': 'http://127.0.0.1:1234/v1', 'generation': 42, 'entries': 5, 'bytes': 10240, 'max_bytes': 8388608}
+    """
+    client = _get_client(base_url)
+    return {'base_url': base_url, 'generation': client.generation, 'entries': len(client._read_cache),
+            'bytes': client._read_cache_bytes, 'max_bytes': _read_cache_max_bytes}
+
+
+@contextlib.contextmanager
+def fresh_reads():
+    """Fetch everything from Cytoscape within a ``with`` block, instead of using replies in the read cache.
+
+    This is needed only when the Cytoscape model may have been changed other than by py4cytoscape (e.g., by a user
+    in the Cytoscape GUI). Replies fetched in the block still refill the cache. This applies only to the thread that
+    calls it.
+
+    Returns:
+        None
+
+    Raises:
+        none
+
+    Examples:
+        >>> with fresh_reads():
+        ...     styles = get_visual_style_names()
+    """
+    outer_fresh = getattr(_read_cache_state, 'fresh', False)
+    _read_cache_state.fresh = True
+    try:
+        yield
+    finally:
+        _read_cache_state.fresh = outer_fresh
+
+
+def _cached_read(key, fetch, base_url=DEFAULT_BASE_URL):
+    # Return fetch()'s JSON-compatible value from the read cache if it was cached during the current model
+    # generation, or else call fetch() and cache its value. The value is kept encoded, which both measures its size
+    # and gives each caller its own copy. Reads made by fetch() don't start a new generation, even if they're POSTs.
+    client = _get_client(base_url)
+    if not getattr(_read_cache_state, 'fresh', False):
+        with client._lock:
+            entry = client._read_cache.get(key)
+            if entry is not None and entry[0] == client._generation:
+                client._read_cache.move_to_end(key)
+                return json.loads(entry[1])
+
+    generation = client._generation  # if the model changes during fetch(), the value may already be stale
+    outer_reading = getattr(_read_cache_state, 'reading', False)
+    _read_cache_state.reading = True
+    try:
+        value = fetch()
+    finally:
+        _read_cache_state.reading = outer_reading
+
+    if _read_cache_max_bytes:
+        encoded = json.dumps(value)
+        with client._lock:
+            old_entry = client._read_cache.pop(key, None)
+            if old_entry is not None: client._read_cache_bytes -= len(old_entry[1])
+            client._read_cache[key] = (generation, encoded)
+            client._read_cache_bytes += len(encoded)
+            _trim_read_cache(client)
+    return value
+
+
+def _cached_cyrest_get(operation=None, parameters=None, base_url=DEFAULT_BASE_URL):
+    # Same as cyrest_get, but using the read cache ... only for GETs that don't change the model
+    key = ('GET', operation, json.dumps(parameters, sort_keys=True, default=str))
+    return _cached_read(key, lambda: cyrest_get(operation, parameters, base_url=base_url), base_url=base_url)
+
+
+def _cached_commands_post(cmd, base_url=DEFAULT_BASE_URL):
+    # Same as commands_post, but using the read cache ... only for commands that don't change the model
+    return _cached_read(('COMMAND', cmd), lambda: commands_post(cmd, base_url=base_url), base_url=base_url)
+
+
+def _trim_read_cache(client):
+    # Drop stale replies, and then the least recently used ones, until the cache fits. Caller must hold client._lock.
+    for key in [key for key, entry in client._read_cache.items() if entry[0] != client._generation]:
+        client._read_cache_bytes -= len(client._read_cache.pop(key)[1])
+    while client._read_cache and client._read_cache_bytes > _read_cache_max_bytes:
+        client._read_cache_bytes -= len(client._read_cache.popitem(last=False)[1][1])
+
+
+# Calls that create or destroy network views: POST or DELETE of networks/{suid}/views[/{view suid}], or a view
+# create or destroy command
+_VIEW_LIFECYCLE_URL = re.compile(r'/views(/\d+)?/?$|/commands/view/(create|destroy)\b')
+
+# Commands that only read the model. Any other command may change it, whether it's sent by GET or POST.
+_READ_ONLY_COMMANDS = frozenset([
+    'apps information', 'apps list available', 'apps list disabled', 'apps list installed', 'apps list uninstalled',
+    'apps list updates', 'apps status', 'command echo', 'command sleep', 'cybrowser list', 'cybrowser version',
+    'edge get attribute', 'edge get properties', 'edge list', 'edge list attributes', 'edge list properties',
+    'filter get', 'filter list', 'group get', 'group list', 'network get attribute', 'network get properties',
+    'network list', 'network list attributes', 'network list properties', 'node get attribute',
+    'node get properties', 'node list', 'node list attributes', 'node list properties', 'table get column',
+    'table get row', 'table get value', 'table list', 'table list columns', 'table list rows', 'view get current',
+    'view list'])
+
+# GETs under apply/ that list layouts and styles or describe a layout, rather than applying one
+_READ_ONLY_APPLY_PATH = re.compile(r'/apply/(layouts|styles)/?$|/apply/layouts/[^/]+(/parameters)?/?$')
+
+def _may_change_model(method, url):
+    # True unless the call only reads the model: a GET other than one that applies something, or a read-only command
+    path = urllib.parse.urlsplit(url).path
+    if '/commands/' in path:
+        command = urllib.parse.unquote(path.split('/commands/', 1)[1]).strip('/').replace('/', ' ').lower()
+        if method == 'GET' and ' ' not in command: return False  # help for a namespace
+        return ' '.join(command.split()) not in _READ_ONLY_COMMANDS
+    if method == 'GET':
+        return '/apply/' in path and not _READ_ONLY_APPLY_PATH.search(path)
+    return True
+
+def _note_model_change(method, url, base_url=DEFAULT_BASE_URL):
+    # Start a new model generation if this call may change the model. Reads made to fill the read cache don't count.
+    if _may_change_model(method, url) and not getattr(_read_cache_state, 'reading', False):
+        _get_client(base_url).new_generation()
+    # Cached view lists change only when a view is created or destroyed, so other changes (e.g., bypasses) keep them
+    if _VIEW_LIFECYCLE_URL.search(url) and (method in ['POST', 'DELETE'] or '/commands/' in url):
+        _get_client(base_url).clear_caches('network_views')
+
+
+# ==============================================================================
+# V. Retry functions
+# ------------------------------------------------------------------------------
+
+class RetryPolicy:
+    """Describe whether and how CyREST calls that fail transiently are retried.
+
+    A call is retried if its connection fails or Cytoscape returns one of the ``retry_statuses``, up to
+    ``max_attempts`` attempts in all. Before each retry, the caller waits ``backoff_base`` seconds, doubled for each
+    retry after the first and capped at ``backoff_cap``. With ``jitter``, the wait is a random time up to that
+    backoff so that many clients don't retry in lockstep.
+
+    POST calls can change Cytoscape's state (e.g., create a network), and replaying one whose reply was lost could
+    repeat the change. So, POSTs are retried only if ``retry_post`` is True.
+
+    Args:
+        max_attempts (int): total attempts per call, including the first; 1 means never retry
+        backoff_base (float): seconds to wait before the first retry
+        backoff_cap (float): maximum seconds to wait before any retry
+        jitter (bool): True to wait a random time up to the backoff; False to wait exactly the backoff
+        retry_statuses (list): HTTP status codes that indicate a transient failure
+        retry_post (bool): True if POST calls made under this policy are safe to replay
+
+    Raises:
+        CyError: if max_attempts is not a positive integer or backoff times are negative
+
+    Examples:
+        >>> set_retry_policy(RetryPolicy(max_attempts=5))
+        >>> cyrest_post('networks/51/views', retry_policy=RetryPolicy(max_attempts=3, retry_post=True))
+    """
+
+    def __init__(self, max_attempts=3, backoff_base=0.5, backoff_cap=30.0, jitter=True,
+                 retry_statuses=(502, 503, 504), retry_post=False):
+        if not isinstance(max_attempts, int) or max_attempts < 1:
+            raise CyError(f'max_attempts must be a positive integer, not "{max_attempts}"')
+        if backoff_base < 0 or backoff_cap < 0:
+            raise CyError(f'Backoff times must not be negative')
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.jitter = jitter
+        self.retry_statuses = set(retry_statuses)
+        self.retry_post = retry_post
+
+    def __repr__(self):
+        return f'RetryPolicy(max_attempts={self.max_attempts}, backoff_base={self.backoff_base}, ' \
+               f'backoff_cap={self.backoff_cap}, jitter={self.jitter}, ' \
+               f'retry_statuses={sorted(self.retry_statuses)}, retry_post={self.retry_post})'
+
+    def can_retry(self, method, attempt):
+        """Return True if a call that failed on this (1-based) attempt may be attempted again."""
+        return attempt < self.max_attempts and (method.upper() != 'POST' or self.retry_post)
+
+    def backoff(self, attempt):
+        """Return the seconds to wait after this (1-based) attempt fails."""
+        delay = min(self.backoff_cap, self.backoff_base * 2 ** (attempt - 1))
+        return random.uniform(0, delay) if self.jitter else delay
+
+
+NO_RETRY_POLICY = RetryPolicy(max_attempts=1)
+
+_retry_policy = NO_RETRY_POLICY
+
+
+@cy_log
+def set_retry_policy(retry_policy=None):
+    """Set the policy for retrying CyREST calls that fail transiently.
+
+    The policy applies to all calls that don't pass their own ``retry_policy``. By default, calls are not retried.
+
+    Args:
+        retry_policy (RetryPolicy or None): the policy to use; None restores the default (no retries)
+
+    Returns:
+        RetryPolicy: the previous policy
+
+    Raises:
+        CyError: if retry_policy is not a RetryPolicy
+
+    Examples:
+        >>> set_retry_policy(RetryPolicy(max_attempts=5, backoff_base=1, backoff_cap=60))
+        RetryPolicy(max_attempts=1, backoff_base=0.5, backoff_cap=30.0, jitter=True, retry_statuses=[502, 503, 504], retry_post=False)
+        >>> set_retry_policy()
+        RetryPolicy(max_attempts=5, backoff_base=1, backoff_cap=60, jitter=True, retry_statuses=[502, 503, 504], retry_post=False)
+    """
+    global _retry_policy
+    if retry_policy is None: retry_policy = NO_RETRY_POLICY
+    if not isinstance(retry_policy, RetryPolicy):
+        raise CyError(f'retry_policy must be a RetryPolicy, not "{retry_policy}"')
+    old_retry_policy = _retry_policy
+    _retry_policy = retry_policy
+    return old_retry_policy
+
+
+@cy_log
+def get_retry_policy():
+    """Return the policy for retrying CyREST calls that fail transiently.
+
+    Returns:
+        RetryPolicy: the policy used by calls that don't pass their own ``retry_policy``
+
+    Raises:
+        none
+
+    Examples:
+        >>> get_retry_policy()
+        RetryPolicy(max_attempts=1, backoff_base=0.5, backoff_cap=30.0, jitter=True, retry_statuses=[502, 503, 504], retry_post=False)
+    """
+    return _retry_policy
+
+
+# ==============================================================================
+# VI. Timeout functions
+# ------------------------------------------------------------------------------
+
+_request_timeout = (None, None)  # (connect, read) seconds ... None waits forever
+# time.monotonic() by which the innermost deadline() must finish ... a context variable, so each thread and each asyncio
+# task has its own
+_deadline_expires = contextvars.ContextVar('deadline_expires', default=None)
+
+
+@cy_log
+def set_request_timeout(connect_secs=None, read_secs=None):
+    """Set how long CyREST calls wait for Cytoscape.
+
+    The connect timeout limits how long it takes to reach Cytoscape, and the read timeout limits how long Cytoscape
+    can go without sending a reply. By default, calls wait forever. Note that some operations (e.g., layouts of
+    large networks) legitimately take a long time, so choose a read timeout with care. Calls that pass their own
+    ``timeout`` aren't affected.
+
+    Timeouts apply only to calls made directly to Cytoscape. Calls made through Jupyter-Bridge wait for their reply
+    however long it takes, because a reply abandoned by a timed-out call would be picked up by the next call.
+
+    Args:
+        connect_secs (float or None): seconds to wait for a connection; None waits forever
+        read_secs (float or None): seconds to wait for a reply; None waits forever
+
+    Returns:
+        tuple: the previous (connect_secs, read_secs)
+
+    Raises:
+        CyError: if a timeout is not positive
+
+    Examples:
+        >>> set_request_timeout(5, 300)
+        (None, None)
+        >>> set_request_timeout()
+        (5, 300)
+    """
+    global _request_timeout
+    for secs in [connect_secs, read_secs]:
+        if secs is not None and not secs > 0:
+            raise CyError(f'Timeout must be a positive number of seconds, not "{secs}"')
+    old_timeout = _request_timeout
+    _request_timeout = (connect_secs, read_secs)
+    return old_timeout
+
+
+@cy_log
+def get_request_timeout():
+    """Return how long CyREST calls wait for Cytoscape.
+
+    Returns:
+        tuple: (connect_secs, read_secs), where None means wait forever
+
+    Raises:
+        none
+
+    Examples:
+        >>> get_request_timeout()
+        (None, None)
+    """
+    return _request_timeout
+
+
+@contextlib.contextmanager
+def deadline(secs):
+    """Limit the total time taken by all CyREST calls made within a ``with`` block.
+
+    Every call made in the block (including calls made by functions such as ``create_network_from_data_frames``
+    that issue many calls) waits only as long as the time left before the deadline, and a call started after the
+    deadline has passed fails immediately. Either way, ``CyTimeoutError`` is raised. Deadlines can be nested, in which
+    case the earlier deadline wins. A deadline applies only to the thread or asyncio task that sets it (and to tasks that task
+    creates), though ``cyrest_batch`` passes it on to its workers. The ``py4cytoscape.aio`` functions honor a deadline
+    set around the event loop (e.g., around ``asyncio.run()``) or within a task, so concurrent tasks can each have their
+    own deadline.
+
+    Through Jupyter-Bridge, a deadline that has passed still stops further calls, but a call already waiting for its
+    reply isn't cut short (see ``set_request_timeout``).
+
+    Args:
+        secs (float): seconds from now by which all calls in the block must finish
+
+    Returns:
+        None
+
+    Raises:
+        CyError: if secs is not a number
+
+    Examples:
+        >>> with deadline(30):
+        ...     create_network_from_data_frames(nodes, edges)
+    """
+    if not isinstance(secs, (int, float)):
+        raise CyError(f'Deadline must be a number of seconds, not "{secs}"')
+    outer_expires = _deadline_expires.get()
+    expires = time.monotonic() + secs
+    token = _deadline_expires.set(expires if outer_expires is None else min(expires, outer_expires))
+    try:
+        yield
+    finally:
+        _deadline_expires.reset(token)
+
+
+def _get_deadline_remaining():
+    # Return the seconds left before this context's innermost deadline, or None if there is no deadline
+    expires = _deadline_expires.get()
+    return None if expires is None else expires - time.monotonic()
+
+
+def _get_timeout(timeout=None, caller=None):
+    # Combine the call's (or the global) (connect, read) timeout with the time left before the deadline
+    if timeout is None: timeout = _request_timeout
+    connect_secs, read_secs = timeout if isinstance(timeout, tuple) else (timeout, timeout)
+    remaining = _get_deadline_remaining()
+    if remaining is None:
+        return connect_secs, read_secs
+    if remaining <= 0:
+        raise CyTimeoutError('Deadline passed before call could be made', caller=caller)
+    return min(connect_secs or remaining, remaining), min(read_secs or remaining, remaining)
+
+
+# ==============================================================================
+# VII. JSON encoding functions
+# ------------------------------------------------------------------------------
+
+def _default_json_serializer(body):
+    # Encode a body as compact UTF-8 JSON. NaN and infinite values become null, and NumPy values become their Python
+    # equivalents, so DataFrame contents can be sent as they come.
+    if orjson:
+        return orjson.dumps(body, default=_json_default, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+    try:
+        return json.dumps(body, default=_json_default, allow_nan=False, separators=(',', ':')).encode('utf-8')
+    except ValueError:
+        # There's a NaN or infinite value somewhere ... replace all of them (which takes time) and try again
+        return json.dumps(_json_nan_to_null(body), default=_json_default, allow_nan=False,
+                          separators=(',', ':')).encode('utf-8')
+
+
+_json_serializer = _default_json_serializer
+
+
+@cy_log
+def set_json_serializer(serializer=None):
+    """Set the function that encodes the JSON bodies of CyREST and Commands calls.
+
+    By default, bodies are encoded by the ``orjson`` package if it's installed, and by the standard ``json`` module
+    otherwise. Either way, NaN and infinite values are sent as null, and NumPy values are sent as their Python
+    equivalents. A replacement serializer should do the same.
+
+    Args:
+        serializer (func or None): function that accepts a body (dict or list) and returns its JSON encoding as
+            UTF-8 bytes or str; None restores the default
+
+    Returns:
+        func: the previous serializer
+
+    Raises:
+        CyError: if serializer is not callable
+
+    Examples:
+        >>> set_json_serializer(lambda body: rapidjson.dumps(body, number_mode=rapidjson.NM_NAN))
+        <function _default_json_serializer at 0x000001F2A9A4D1F0>
+        >>> set_json_serializer()
+        <function <lambda> at 0x000001F2A9B3E5E0>
+    """
+    global _json_serializer
+    if serializer is None: serializer = _default_json_serializer
+    if not callable(serializer):
+        raise CyError(f'serializer must be a function, not "{serializer}"')
+    old_serializer = _json_serializer
+    _json_serializer = serializer
+    return old_serializer
+
+
+def _json_default(value):
+    # Convert values that JSON encoders don't know about
+    if isinstance(value, np.generic): return value.item()
+    if isinstance(value, np.ndarray): return value.tolist()
+    if value is pd.NA or value is pd.NaT: return None
+    raise TypeError(f'Object of type {type(value).__name__} is not JSON serializable')
+
+
+def _json_nan_to_null(value):
+    # Copy a body, replacing NaN and infinite values with None so they encode as null
+    if isinstance(value, dict):
+        return {key: _json_nan_to_null(val) for key, val in value.items()}
+    if isinstance(value, (list, tuple, np.ndarray)):
+        return [_json_nan_to_null(val) for val in value]
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    return value
+
+
 def _command_2_get_query(cmd_string, base_url=DEFAULT_BASE_URL):
     # Wipe out parameters so we can focus just on the Cytoscape command
     # For example, 'network get attribute network="test" namespace="default" columnList="SUID"'
@@ -656,14 +1752,14 @@ def _command_2_post_query_body(cmd):
 
 def sub_versions(base_url=DEFAULT_BASE_URL, **kwargs):
     # If we're running through Jupyter-Bridge, get the versions of components along the way
-    if _find_remote_cytoscape():
+    if _get_client(base_url).is_remote():
         return do_request_remote('version', None, **kwargs).json()
     else:
         return {}
 
-def _handle_error(e, force_cy_error=False):
+def _handle_error(e, force_cy_error=False, caller=None):
     # An exception occurred ... figure out the most sensible thing to return as the exception text
-    caller = sys._getframe(1).f_code.co_name
+    if caller is None: caller = sys._getframe(1).f_code.co_name
     if e.response is None or e.response.text is None or e.response.text == '':
         show_error(f'In {caller}: {e}') # Was: narrate(f'In {caller}: {e}')
         raise
@@ -682,31 +1778,74 @@ def _handle_error(e, force_cy_error=False):
         raise e
 
 
-def _do_request_local(method, url, **kwargs):
-    # Call CyREST via a local URL
+def _do_request_local(method, url, base_url=DEFAULT_BASE_URL, **kwargs):
+    # Call CyREST via a local URL, reusing a pooled connection if one is open
     log_http_request(method, url, **kwargs)
-    r = requests.request(method, url, **kwargs)
-    log_http_result(r)
+    r = _get_session(base_url).request(method, url, **kwargs)
+    log_http_result(r, show_content=not kwargs.get('stream', False)) # showing a stream's content would consume it
     return r
 
-def _do_request(method, url, base_url=DEFAULT_BASE_URL, **kwargs):
+def _do_request(method, url, base_url=DEFAULT_BASE_URL, retry_policy=None, timeout=None, **kwargs):
     # Determine whether actual call is local or remote
-    requester = _get_requester()
+    client = _get_client(base_url)
+    requester = client.get_requester()
 
-    do_initialize_sandbox(requester, base_url=base_url) # make sure there's a sandbox before executing a command
+    client.initialize_sandbox() # make sure there's a sandbox before executing a command
 
-    return requester(method, url, **kwargs)
+    # Encode any JSON body once, no matter how many retries. Jupyter-Bridge sends the body as part of its own JSON
+    # message, so it gets the body back as plain values, with NaNs already turned into None.
+    if kwargs.get('json') is not None:
+        body = _json_serializer(kwargs.pop('json'))
+        if requester is do_request_remote:
+            kwargs['json'] = json.loads(body)
+        else:
+            kwargs['data'] = body if isinstance(body, bytes) else body.encode('utf-8')
 
-def do_initialize_sandbox(requester=None, base_url=DEFAULT_BASE_URL):
-    # If re-initialize has been requested, reset sandbox to environment's default (i.e., None or default_sandbox)
-    if get_sandbox_reinitialize():
-        return do_set_sandbox(_get_default_sandbox(), requester, base_url=base_url)
-    else:
-        return get_current_sandbox()
+    # Make the call, and retry it if it fails transiently and the policy allows. The last failure is returned or
+    # raised as though there had been no retries. Each attempt's timeout is cut short by any deadline, and a deadline
+    # that has already passed fails the call before anything is sent.
+    caller = sys._getframe(1).f_code.co_name
+    retry_policy = retry_policy or _retry_policy
+    call_start = time.perf_counter()
+    attempt = 1
+    kwargs['timeout'] = _get_timeout(timeout, caller=caller)
+    try:
+        while True:
+            attempt_start = time.perf_counter()
+            try:
+                r = requester(method, url, **kwargs)
+                if r.status_code not in retry_policy.retry_statuses or not retry_policy.can_retry(method, attempt):
+                    break
+                reason = f'{r.reason}[{r.status_code}]'
+            except requests.exceptions.ConnectionError as e:
+                if not retry_policy.can_retry(method, attempt):
+                    client.clear_caches()  # Cytoscape may come back as a different instance, so forget this one
+                    raise
+                reason = str(e)
+            delay = retry_policy.backoff(attempt)
+            remaining = _get_deadline_remaining()
+            if remaining is not None: delay = max(0, min(delay, remaining))
+            log_http_retry(method, url, attempt, reason, time.perf_counter() - attempt_start, delay)
+            time.sleep(delay)
+            attempt += 1
+            kwargs['timeout'] = _get_timeout(timeout, caller=caller)
+    except requests.exceptions.Timeout as e:
+        raise CyTimeoutError(f'Cytoscape did not reply in time: {e}', caller=caller) from e
+    finally:
+        _note_model_change(method, url, base_url=base_url)  # even a failed call may have changed something
+
+    if attempt > 1: log_http_retries_done(method, url, attempt, time.perf_counter() - call_start)
+    return r
 
-def do_set_sandbox(sandbox_to_set, requester=None, base_url=DEFAULT_BASE_URL):
-    # Set the sandbox to whatever is passed in. Note that sandbox_to_set is a dictionary not a string.
-    requester = requester or _get_requester()
+def do_initialize_sandbox(requester=None, base_url=DEFAULT_BASE_URL):
+    # If re-initialize has been requested, reset sandbox to environment's default (i.e., None or default_sandbox) ...
+    # or if the sandbox was last set up in a different Cytoscape instance, set it up in this one, too
+    return _get_client(base_url).initialize_sandbox()
+
+def do_set_sandbox(sandbox_to_set, requester=None, base_url=DEFAULT_BASE_URL, new_generation=True):
+    # Set the sandbox to whatever is passed in. Note that sandbox_to_set is a dictionary not a string. If
+    # new_generation, other Cytoscape instances must set up this sandbox too ... otherwise, they already have it.
+    requester = requester or _get_requester(base_url=base_url)
     if not sandbox_to_set['sandboxName']:
         # A null name means that the default sandbox should be used, but honoring the copySamples and reinitialize
         # settings passed in by the caller.
@@ -762,6 +1901,12 @@ def do_set_sandbox(sandbox_to_set, requester=None, base_url=DEFAULT_BASE_URL):
         new_sandbox = set_current_sandbox(None, default_sandbox_path)
 
     set_sandbox_reinitialize(False) # No need to initialize again immediately before the next command is issued
+
+    # Other Cytoscape instances will need to set up a new sandbox before their next command
+    global _sandbox_generation
+    if new_generation:
+        _sandbox_generation += 1
+        _get_client(base_url)._sandbox_generation = _sandbox_generation
     return new_sandbox
 
 def _get_default_sandbox():
@@ -779,9 +1924,9 @@ def _get_default_sandbox():
         set_default_sandbox(**default)
     return default
 
-def _get_requester():
+def _get_requester(base_url=DEFAULT_BASE_URL):
     # Figure out whether CyREST is local or remote ... if remote, we'll want to go through Jupyter-Bridge
-    return do_request_remote if _find_remote_cytoscape() else _do_request_local
+    return _get_client(base_url).get_requester()
 
 def _do_browser_open(url, **kwargs):
     # Figure out whether CyREST is local or remote ... if remote, issue a browser command through Jupyter-Bridge
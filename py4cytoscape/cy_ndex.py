@@ -23,10 +23,14 @@ TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR TH
 import sys
 import re
 import time
+import os
+import hashlib
+import requests
 
 # Internal module imports
 from . import commands
 from . import networks
+from . import sandbox
 
 # Internal module convenience imports
 from .exceptions import CyError
@@ -63,16 +67,23 @@ def import_network_from_ndex(ndex_id, username=None, password=None, access_key=N
 
     Note:
         Importing a network that has recently been stored on NDEx may result in an error if NDEx has not finished indexing it. Lags can range from a few seconds to a few minutes.
+
+        If an NDEx cache has been set up with ``set_ndex_cache``, the network is downloaded into the cache (unless
+        the same version is already there) and imported from there as a CX file, instead of by Cytoscape's NDEx
+        import.
     """
     if re.search("^https?://", ndex_url) == None:
         ndex_url = "".join(["http://", ndex_url])
     server_Url = "/".join([ndex_url, ndex_version])
+    if _ndex_cache_dir is not None:
+        return _import_network_from_ndex_cache(server_Url, ndex_id, username, password, access_key, base_url)
     ndex_body = {'serverUrl': server_Url, 'uuid': ndex_id}
     if username is not None: ndex_body.update({'username': username})
     if password is not None: ndex_body.update({'password': password})
     if access_key is not None: ndex_body.update({'accessKey': access_key})
 
     res = commands.cyrest_post('networks', body=ndex_body, base_url=_cy_ndex_base_url(base_url))
+    networks._clear_network_cache(base_url)
     return res['data']['suid']
 
 @cy_log
@@ -207,6 +218,170 @@ def get_network_ndex_id(network=None, base_url=DEFAULT_BASE_URL):
     return res['data']['members'][0].get('uuid', None)
 
 
+# ==============================================================================
+# NDEx cache
+# ------------------------------------------------------------------------------
+
+DEFAULT_NDEX_CACHE_MAX_BYTES = 1024 * 1024 * 1024
+
+_ndex_cache_dir = None  # None means no cache ... Cytoscape fetches every network from NDEx itself
+_ndex_cache_max_bytes = DEFAULT_NDEX_CACHE_MAX_BYTES
+
+
+@cy_log
+def set_ndex_cache(cache_dir=None, max_bytes=DEFAULT_NDEX_CACHE_MAX_BYTES):
+    """Keep networks imported from NDEx in a directory, so they needn't be downloaded again.
+
+    Once set, ``import_network_from_ndex`` asks NDEx only for a network's summary. If the network hasn't been modified
+    since it was last downloaded, it's imported from the cache directory. Otherwise, it's downloaded into the cache
+    first. Either way, it's imported as a CX file (sent to the current sandbox, if there is one). When the cache grows
+    beyond max_bytes, the least recently imported networks are removed. The directory can be shared by several
+    processes (e.g., CI jobs) and survives restarts.
+
+    Args:
+        cache_dir (str or None): directory for cached networks, created if needed; None turns the cache off
+        max_bytes (int): most bytes of networks to keep in the cache
+
+    Returns:
+        tuple: the previous (cache_dir, max_bytes)
+
+    Raises:
+        CyError: if max_bytes is not a positive integer or cache_dir can't be created
+
+    Examples:
+        >>> set_ndex_cache('~/.cache/py4cytoscape/ndex')
+        (None, 1073741824)
+        >>> set_ndex_cache() # turn the cache off
+        ('/home/user/.cache/py4cytoscape/ndex', 1073741824)
+    """
+    global _ndex_cache_dir, _ndex_cache_max_bytes
+    if not isinstance(max_bytes, int) or max_bytes < 1:
+        raise CyError(f'NDEx cache size must be a positive integer, not "{max_bytes}"')
+    if cache_dir is not None:
+        cache_dir = os.path.abspath(os.path.expanduser(cache_dir))
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+        except OSError as e:
+            raise CyError(f'Could not create NDEx cache directory "{cache_dir}": {e}')
+    old_cache = (_ndex_cache_dir, _ndex_cache_max_bytes)
+    _ndex_cache_dir, _ndex_cache_max_bytes = cache_dir, max_bytes
+    if cache_dir is not None: _trim_ndex_cache()
+    return old_cache
+
+
+@cy_log
+def get_ndex_cache_info():
+    """Report on the NDEx cache set up by ``set_ndex_cache``.
+
+    Returns:
+        dict: {'cache_dir': directory or None if there's no cache, 'max_bytes': bytes allowed, 'networks': networks
+            cached, 'bytes': bytes used}
+
+    Raises:
+        none
+
+    Examples:
+        >>> get_ndex_cache_info()
+        {'cache_dir': '/home/user/.cache/py4cytoscape/ndex', 'max_bytes': 1073741824, 'networks': 3, 'bytes': 5318008}
+    """
+    files = _get_ndex_cache_files()
+    return {'cache_dir': _ndex_cache_dir, 'max_bytes': _ndex_cache_max_bytes, 'networks': len(files),
+            'bytes': sum(size for path, size, mtime in files)}
+
+
+@cy_log
+def clear_ndex_cache():
+    """Remove all networks from the NDEx cache set up by ``set_ndex_cache``.
+
+    Returns:
+        int: number of networks removed
+
+    Raises:
+        none
+
+    Examples:
+        >>> clear_ndex_cache()
+        3
+    """
+    files = _get_ndex_cache_files()
+    for path, size, mtime in files:
+        _remove_file(path)
+    return len(files)
+
+
+def _import_network_from_ndex_cache(server_url, ndex_id, username, password, access_key, base_url):
+    # Import an NDEx network from the cache, downloading it into the cache first if it's missing or out of date
+    auth = (username, password) if username is not None else None
+    params = {'accesskey': access_key} if access_key is not None else None
+    summary = _ndex_get(f'{server_url}/network/{ndex_id}/summary', ndex_id, auth, params).json()
+
+    # Name the file for the network's content, so a modified network is never mistaken for an older one
+    key = hashlib.sha256(f'{server_url}|{ndex_id}|{summary.get("modificationTime")}'.encode('utf-8')).hexdigest()
+    cache_file = os.path.join(_ndex_cache_dir, key + '.cx')
+    if os.path.exists(cache_file):
+        os.utime(cache_file)  # most recently used
+    else:
+        r = _ndex_get(f'{server_url}/network/{ndex_id}', ndex_id, auth, params, stream=True)
+        temp_file = f'{cache_file}.{os.getpid()}.tmp'
+        try:
+            with open(temp_file, 'wb') as file:
+                for chunk in r.iter_content(chunk_size=1024 * 1024):
+                    file.write(chunk)
+            os.replace(temp_file, cache_file)  # another process may have just done the same, which is fine
+        finally:
+            r.close()
+            _remove_file(temp_file)
+        _trim_ndex_cache(keep=cache_file)
+
+    # Cytoscape can read the cache directly unless there's a sandbox, in which case it gets a copy
+    if sandbox.get_current_sandbox()[0]:
+        import_file = f'ndex_{ndex_id}.cx'
+        sandbox.sandbox_send_to(cache_file, import_file, base_url=base_url)
+    else:
+        import_file = cache_file
+    res = networks.import_network_from_file(import_file, base_url=base_url)
+    return res['networks'][0]
+
+def _ndex_get(url, ndex_id, auth, params, stream=False):
+    # Fetch from NDEx directly, turning NDEx's complaints (e.g., bad ID or credentials) into CyErrors
+    r = requests.get(url, auth=auth, params=params, stream=stream, timeout=commands._get_timeout())
+    try:
+        r.raise_for_status()
+    except requests.exceptions.HTTPError as e:
+        r.close()
+        raise CyError(f'Could not fetch network "{ndex_id}" from NDEx: {e}', caller='import_network_from_ndex')
+    return r
+
+def _get_ndex_cache_files():
+    # Return [(path, size, mtime)] for the networks in the cache, least recently used first
+    if _ndex_cache_dir is None or not os.path.isdir(_ndex_cache_dir): return []
+    files = []
+    for entry in os.scandir(_ndex_cache_dir):
+        if entry.is_file() and entry.name.endswith('.cx'):
+            try:
+                stat = entry.stat()
+                files.append((entry.path, stat.st_size, stat.st_mtime))
+            except OSError:
+                pass  # removed by another process
+    return sorted(files, key=lambda file: file[2])
+
+def _trim_ndex_cache(keep=None):
+    # Remove least recently used networks (but never keep) until the cache fits
+    files = _get_ndex_cache_files()
+    total_bytes = sum(size for path, size, mtime in files)
+    for path, size, mtime in files:
+        if total_bytes <= _ndex_cache_max_bytes: break
+        if path != keep:
+            _remove_file(path)
+            total_bytes -= size
+
+def _remove_file(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
 # ------------------------------------------------------------------------------
 # Transforms generic base.url into a specific cyndex.base.url
 def _cy_ndex_base_url(base_url):
@@ -0,0 +1,257 @@
+# -*- coding: utf-8 -*-
+
+"""Run jobs in parallel on a pool of Cytoscape instances.
+
+Cytoscape executes one command at a time, so a single instance limits how fast a batch of networks can be processed.
+A ``CytoscapePool`` spreads jobs across several instances (e.g., headless Cytoscape containers built from the
+``docker`` directory), checking each instance's health and moving jobs off instances that stop responding.
+
+Examples:
+    >>> def render(file, base_url):
+    ...     import_network_from_file(file, base_url=base_url)
+    ...     analyze_network(base_url=base_url)
+    ...     return export_image(file + '.png', base_url=base_url)
+    >>> with CytoscapePool(['http://127.0.0.1:1234/v1', 'http://127.0.0.1:1235/v1']) as pool:
+    ...     futures = [pool.submit(render, file) for file in ['a.sif', 'b.sif', 'c.sif']]
+    ...     images = [future.result() for future in futures]
+"""
+
+"""Copyright 2020 The Cytoscape Consortium
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit
+persons to whom the Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+
+# External library imports
+import threading
+import queue
+import concurrent.futures
+import requests
+
+# Internal module imports
+from . import commands
+
+# Internal module convenience imports
+from .exceptions import CyError, CyTimeoutError
+from .py4cytoscape_logger import detail_logger
+
+# print(f'Starting {__name__} module')
+
+
+DEFAULT_POOL_MAX_ATTEMPTS = 3
+DEFAULT_POOL_HEALTH_CHECK_SECS = 30
+
+
+class CytoscapePool:
+    """A pool of Cytoscape instances that run jobs in parallel, one job per instance at a time.
+
+    A job is any function that accepts a ``base_url`` keyword argument and does all of its work in the Cytoscape at
+    that base_url. ``submit`` queues a job and returns a ``concurrent.futures.Future`` for its result. Each instance
+    takes the next queued job as soon as it finishes its last one, so faster instances take on more jobs.
+
+    Each instance is checked (as ``cytoscape_ping`` would, but without its message) before it takes its first job,
+    and again after a job fails because the instance couldn't be reached or didn't reply in time (see
+    ``set_request_timeout``). An instance that fails its check takes no jobs until it passes a later check (made every
+    ``health_check_secs``), and the job that found it down is queued again for any instance, up to ``max_attempts``
+    tries in all. Jobs that fail for other reasons fail their futures right away. Jobs still queued
+    when every instance is down wait for one to come back.
+
+    Jobs run on one thread per instance. The pool doesn't apply to Jupyter-Bridge connections, which reach only the
+    one Cytoscape next to the browser.
+
+    Args:
+        base_urls (list): base_urls of the Cytoscape instances, e.g., ['http://127.0.0.1:1234/v1', 'http://127.0.0.1:1235/v1']
+        max_attempts (int): number of times a job is tried before it fails because its instances couldn't be reached
+        health_check_secs (float): seconds between checks of an instance that's down
+
+    Raises:
+        CyError: if base_urls is empty or contains duplicates, or max_attempts is less than 1
+
+    Examples:
+        >>> pool = CytoscapePool(['http://127.0.0.1:1234/v1', 'http://127.0.0.1:1235/v1'])
+        >>> pool.submit(cytoscape_version_info).result()
+        {'apiVersion': 'v1', 'cytoscapeVersion': '3.9.1', ...}
+        >>> pool.shutdown()
+    """
+
+    def __init__(self, base_urls, max_attempts=DEFAULT_POOL_MAX_ATTEMPTS, health_check_secs=DEFAULT_POOL_HEALTH_CHECK_SECS):
+        base_urls = list(base_urls)
+        if len(base_urls) == 0 or len(set(base_urls)) != len(base_urls):
+            raise CyError(f'Pool needs at least one base_url and no duplicates, not "{base_urls}"')
+        if not isinstance(max_attempts, int) or max_attempts < 1:
+            raise CyError(f'max_attempts must be a positive integer, not "{max_attempts}"')
+        self.base_urls = base_urls
+        self.max_attempts = max_attempts
+        self.health_check_secs = health_check_secs
+        self._jobs = queue.Queue()  # _Job, or None to tell an instance to stop
+        self._shutdown = threading.Event()
+        self._status = {base_url: {'base_url': base_url, 'healthy': None, 'busy': False, 'completed': 0, 'failed': 0}
+                        for base_url in base_urls}
+        self._threads = [threading.Thread(target=self._run_instance, args=(base_url,), daemon=True,
+                                          name=f'CytoscapePool {base_url}') for base_url in base_urls]
+        for thread in self._threads:
+            thread.start()
+
+    def __repr__(self):
+        return f'CytoscapePool({self.base_urls!r})'
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.shutdown(wait=True)
+        return False
+
+    def submit(self, job, *args, **kwargs):
+        """Queue a job to run on the next free instance.
+
+        Args:
+            job (func): function to call as ``job(*args, base_url=<instance base_url>, **kwargs)``
+            *args: positional arguments for job
+            **kwargs: keyword arguments for job
+
+        Returns:
+            concurrent.futures.Future: the job's result or exception, once it has run
+
+        Raises:
+            CyError: if the pool has been shut down
+        """
+        if self._shutdown.is_set():
+            raise CyError('Cannot submit a job after the pool has been shut down')
+        future = concurrent.futures.Future()
+        self._jobs.put(_Job(future, job, args, kwargs))
+        return future
+
+    def map(self, job, *iterables):
+        """Queue a job for each set of arguments, and return their results in order as they become available.
+
+        Args:
+            job (func): function to call as ``job(*args, base_url=<instance base_url>)``
+            *iterables: iterables that supply job's positional arguments, as for the builtin ``map``
+
+        Returns:
+            generator: the jobs' results, in argument order ... a job's exception is raised when its result is reached
+
+        Raises:
+            CyError: if the pool has been shut down
+        """
+        futures = [self.submit(job, *args) for args in zip(*iterables)]
+        return (future.result() for future in futures)
+
+    def get_status(self):
+        """Report on each instance in the pool.
+
+        Returns:
+            list: one dict per instance ... {'base_url': base_url, 'healthy': True, False or None if not yet checked,
+                'busy': True if running a job, 'completed': number of jobs that succeeded, 'failed': number that
+                raised an exception}
+        """
+        return [dict(status) for status in self._status.values()]
+
+    def shutdown(self, wait=True, cancel_jobs=False):
+        """Stop the pool once the queued jobs have run.
+
+        Args:
+            wait (bool): True to return only once all instances have stopped
+            cancel_jobs (bool): True to cancel jobs that haven't started yet, instead of running them
+
+        Returns:
+            None
+        """
+        self._shutdown.set()
+        if cancel_jobs:
+            self._cancel_queued()
+        for _ in self._threads:
+            self._jobs.put(None)
+        if wait:
+            for thread in self._threads:
+                thread.join()
+            # Any jobs left over were waiting for an instance that never came back
+            self._cancel_queued(CyError('Pool was shut down before any instance could run the job'))
+
+    def _cancel_queued(self, exception=None):
+        # Empty the queue, cancelling (or failing) each job in it
+        while True:
+            try:
+                job = self._jobs.get_nowait()
+            except queue.Empty:
+                return
+            if job is None: continue
+            if exception is None or job.started:
+                if not job.future.cancel(): job.future.set_exception(exception or CyError('Pool was shut down'))
+            else:
+                if job.future.set_running_or_notify_cancel(): job.future.set_exception(exception)
+
+    def _run_instance(self, base_url):
+        # Run jobs on one instance until shut down, checking its health first and after it drops out
+        status = self._status[base_url]
+        while True:
+            if not status['healthy']:
+                status['healthy'] = self._check_health(base_url)
+                if not status['healthy']:
+                    if self._shutdown.wait(self.health_check_secs): return
+                    continue
+
+            job = self._jobs.get()
+            if job is None: return
+            if not job.started:
+                if not job.future.set_running_or_notify_cancel(): continue  # cancelled while queued
+                job.started = True
+
+            status['busy'] = True
+            try:
+                result = job.func(*job.args, base_url=base_url, **job.kwargs)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout, CyTimeoutError) as e:
+                # The instance went away or stopped answering ... take it out of service and let another instance try
+                # the job
+                detail_logger.warning(f'Cytoscape at {base_url} failed job {getattr(job.func, "__name__", job.func)}: {e}')
+                status['healthy'] = False
+                commands.get_client(base_url).reset()  # it may come back as a fresh Cytoscape
+                job.attempts += 1
+                if job.attempts < self.max_attempts:
+                    self._jobs.put(job)
+                else:
+                    status['failed'] += 1
+                    job.future.set_exception(e)
+            except BaseException as e:
+                status['failed'] += 1
+                job.future.set_exception(e)
+            else:
+                status['completed'] += 1
+                job.future.set_result(result)
+            finally:
+                status['busy'] = False
+
+    def _check_health(self, base_url):
+        # Return True if the Cytoscape at base_url answers and is a supported version. This is what cytoscape_ping
+        # checks, but checks are repeated while an instance is down, so nothing is narrated.
+        from .py4cytoscape_utils import check_supported_versions
+        try:
+            commands.get_client(base_url).clear_caches('versions')  # be sure to reach Cytoscape
+            problem = check_supported_versions(1, 3.6, base_url=base_url)
+            if problem: raise CyError(problem)
+            return True
+        except Exception as e:
+            detail_logger.warning(f'Cytoscape at {base_url} failed health check: {e}')
+            return False
+
+
+class _Job:
+    # A queued call, and how many times it has been tried on an instance that couldn't be reached
+    def __init__(self, future, func, args, kwargs):
+        self.future = future
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.started = False
+        self.attempts = 0
@@ -55,6 +55,7 @@ def cytoscape_ping(base_url=DEFAULT_BASE_URL):
         You are connected to Cytoscape!
     """
     from .py4cytoscape_utils import verify_supported_versions
+    commands._get_client(base_url).clear_caches('versions')  # be sure to reach Cytoscape, and note its versions again
     verify_supported_versions(1, 3.6, base_url=base_url)
     return narrate('You are connected to Cytoscape!')
 
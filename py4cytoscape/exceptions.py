@@ -53,3 +53,27 @@ class CyError(Exception):
         show_error(whole_error)     # was: print(whole_error, file=sys.stderr)
 
 
+class CyTimeoutError(CyError):
+    """Create an error describing a Cytoscape call that didn't finish in time.
+
+    Raised when a call's timeout elapses or when a ``deadline`` has passed, so callers can tell a slow or hung
+    Cytoscape apart from other errors.
+
+    Args:
+        message_text (str): text describing error condition
+        caller (str): name of function in which error is to be reported
+
+    Returns:
+         CyTimeoutError: contains the text message and error location
+
+    Raises:
+        none
+
+    Examples:
+        >>> CyTimeoutError('Deadline passed before call could be made', caller='cyrest_get')
+        'In cyrest_get(): Deadline passed before call could be made'
+    """
+
+    def __init__(self, message_text, caller=None):
+        if caller is None: caller = sys._getframe(1).f_code.co_name
+        super().__init__(message_text, caller=caller)
@@ -128,6 +128,7 @@ def collapse_group(groups=None, network=None, base_url=DEFAULT_BASE_URL):
     net_suid = networks.get_network_suid(network, base_url=base_url)
     res = commands.commands_post(f'group collapse groupList="{group_list}" network="SUID:{net_suid}"',
                                  base_url=base_url)
+    invalidate_name_index(network=net_suid, base_url=base_url)  # group nodes and meta-edges replace members
     return res
 
 
@@ -177,6 +178,7 @@ def create_group(group_name, nodes=None, nodes_by_col='SUID', network=None, base
     res = commands.commands_post(
         f'group create groupName="{group_name}" nodeList="{node_list}" network="SUID:{net_suid}"',
         base_url=base_url)
+    invalidate_name_index(network=net_suid, base_url=base_url)
     return res
 
 
@@ -210,6 +212,7 @@ def create_group_by_column(group_name, column=None, value=None, network=None, ba
     res = commands.commands_post(
         f'group create groupName="{group_name}" nodeList="{column}":"{value}" network="SUID:{net_suid}"',
         base_url=base_url)
+    invalidate_name_index(network=net_suid, base_url=base_url)
     return res
 
 
@@ -250,6 +253,7 @@ def expand_group(groups=None, network=None, base_url=DEFAULT_BASE_URL):
     net_suid = networks.get_network_suid(network, base_url=base_url)
     res = commands.commands_post(
         f'group expand groupList="{group_list}" network="SUID:{net_suid}"', base_url=base_url)
+    invalidate_name_index(network=net_suid, base_url=base_url)
     return res
 
 
@@ -433,5 +437,6 @@ def delete_group(groups=None, groups_by_col='SUID', network=None, base_url=DEFAU
     net_suid = networks.get_network_suid(network, base_url=base_url)
     res = commands.commands_post(f'group ungroup nodeList="{group_list}" network="SUID:{net_suid}"', base_url=base_url)
     # TODO: The R implementation uses the groupList parameter, which conflicts with the command documentation
+    invalidate_name_index(network=net_suid, base_url=base_url)
     return res
 
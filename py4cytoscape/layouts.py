@@ -207,8 +207,10 @@ def get_layout_names(base_url=DEFAULT_BASE_URL):
         >>> get_layout_names()
         ['attribute-circle', 'stacked-node-layout', 'degree-circle', 'circular', 'attributes-layout', 'kamada-kawai', 'force-directed', 'cose', 'grid', 'hierarchical', 'fruchterman-rheingold', 'isom']
     """
-    res = commands.cyrest_get('apply/layouts', base_url=base_url)
-    return res
+    cache = _get_layout_cache(base_url)
+    if 'names' not in cache:
+        cache['names'] = commands.cyrest_get('apply/layouts', base_url=base_url)
+    return list(cache['names'])
 
 
 @cy_log
@@ -236,12 +238,17 @@ def get_layout_name_mapping(base_url=DEFAULT_BASE_URL):
         {'Attribute Circle Layout': 'attribute-circle', 'Stacked Node Layout': 'stacked-node-layout' ...}
     """
     layout_names = get_layout_names(base_url=base_url)
-    layout_mapping = {}
+    cache = _get_layout_cache(base_url)
+
+    # get the full names of layouts not seen before, all at once
+    missing_names = [layout_name for layout_name in layout_names if ('long_name', layout_name) not in cache]
+    res = commands.cyrest_batch([('GET', f'apply/layouts/{layout_name}') for layout_name in missing_names],
+                                base_url=base_url)
+    for layout_name, layout_info in zip(missing_names, res):
+        cache[('long_name', layout_name)] = layout_info['longName']
 
-    # get the full name of a layout and create {fullname:layoutname} in dictionary
-    for layout_name in layout_names:
-        res = commands.cyrest_get(f'apply/layouts/{layout_name}', base_url=base_url)
-        layout_mapping.update({res['longName']: layout_name})
+    # create {fullname:layoutname} in dictionary
+    layout_mapping = {cache[('long_name', layout_name)]: layout_name for layout_name in layout_names}
 
     return layout_mapping
 
@@ -268,8 +275,7 @@ def get_layout_property_names(layout_name, base_url=DEFAULT_BASE_URL):
         >>> get_layout_property_names('force-directed')
         ['numIterations', 'defaultSpringCoefficient', 'defaultSpringLength', 'defaultNodeMass', 'isDeterministic', 'singlePartition']
     """
-    res = commands.cyrest_get(f'apply/layouts/{layout_name}/parameters', base_url=base_url)
-    param_names = [param_def['name'] for param_def in res]
+    param_names = list(_get_layout_parameter_types(layout_name, base_url))
     return param_names
 
 
@@ -297,8 +303,7 @@ def get_layout_property_type(layout_name, property_name, base_url=DEFAULT_BASE_U
         >>> get_layout_property_names('force-directed','defaultSpringLength')
         "double"
     """
-    res = commands.cyrest_get(f'apply/layouts/{layout_name}/parameters', base_url=base_url)
-    param_types = {param['name']: param['type'] for param in res}
+    param_types = _get_layout_parameter_types(layout_name, base_url)
     return param_types[property_name]
 
 
@@ -360,14 +365,32 @@ def set_layout_properties(layout_name, properties_dict, base_url=DEFAULT_BASE_UR
         >>> set_layout_properties('force-directed', {'defaultSpringLength': 50, 'defaultSpringCoefficient': 6E-01})
         ''
     """
-    all_possible_properties = get_layout_property_names(layout_name)
+    all_possible_properties = _get_layout_parameter_types(layout_name, base_url)
 
-    res = ''
-    for prop, value in properties_dict.items():
+    # check all properties first, so that either all of them are set or none are
+    for prop in properties_dict:
         if not prop in all_possible_properties:
             raise CyError(f'"{prop}" is not a property in layout "{layout_name}"')
-        else:
-            each_property = [{'name': prop, 'value': value}]
-            res = commands.cyrest_put(f'apply/layouts/{layout_name}/parameters', body=each_property,
-                                      base_url=base_url, require_json=False)
+
+    res = ''
+    if properties_dict:
+        all_properties = [{'name': prop, 'value': value} for prop, value in properties_dict.items()]
+        res = commands.cyrest_put(f'apply/layouts/{layout_name}/parameters', body=all_properties,
+                                  base_url=base_url, require_json=False)
     return res
+
+
+def _get_layout_cache(base_url):
+    # Return the cache of layout names, long names and parameter types for base_url. These are fixed by the layout
+    # algorithms installed in Cytoscape, so they're kept until apps change or the connection is lost.
+    return commands._get_client(base_url).get_cache('layouts')
+
+def _get_layout_parameter_types(layout_name, base_url):
+    # Return {parameter name: type} for a layout, fetching it only the first time. Parameter values aren't cached, as
+    # they change whenever properties are set.
+    cache = _get_layout_cache(base_url)
+    param_types = cache.get(('parameters', layout_name))
+    if param_types is None:
+        res = commands.cyrest_get(f'apply/layouts/{layout_name}/parameters', base_url=base_url)
+        param_types = cache[('parameters', layout_name)] = {param['name']: param['type'] for param in res}
+    return param_types
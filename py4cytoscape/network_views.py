@@ -31,6 +31,7 @@ import os
 from . import commands
 from . import networks
 from . import sandbox
+from . import py4cytoscape_tuning
 
 # Internal module convenience imports
 from .exceptions import CyError
@@ -65,9 +66,15 @@ def get_network_views(network=None, base_url=DEFAULT_BASE_URL):
         [130223]
     """
     net_suid = networks.get_network_suid(network, base_url=base_url)
-    res = commands.cyrest_get(f'networks/{net_suid}/views', base_url=base_url)
-    # TODO: Note that we get a 404 exception here if there are no networks. Is that what we want?
-    return res
+    # View SUIDs are cached because every bypass and style value function looks up its network's view. The cache is
+    # cleared by calls that create or destroy views (see commands._note_model_change), not by other changes.
+    cache = _get_view_cache(base_url)
+    res = cache.get(net_suid)
+    if res is None:
+        res = commands.cyrest_get(f'networks/{net_suid}/views', base_url=base_url)
+        # TODO: Note that we get a 404 exception here if there are no networks. Is that what we want?
+        if res: cache[net_suid] = res  # a network without a view may get one at any time, so don't cache that
+    return list(res)
 
 
 @cy_log
@@ -102,7 +109,7 @@ def get_network_view_suid(network=None, base_url=DEFAULT_BASE_URL):
         return network_views[-1]
     elif isinstance(network, int):
         # suid provided, but is it a network or a view?
-        net_suids = commands.cyrest_get('networks', base_url=base_url)
+        net_suids = networks._get_network_suids(base_url)
         if network in net_suids:  # network SUID, warn if multiple view
             network_views = get_network_views(network, base_url=base_url)
             if len(network_views) > 1:
@@ -200,6 +207,7 @@ def create_view(network=None, base_url=DEFAULT_BASE_URL):
     else:
         net_parm = "current"
     res = commands.commands_post(f'view create network="{net_parm}"', base_url=base_url)
+    _clear_view_cache(base_url)
     return res
 
 
@@ -233,6 +241,7 @@ def set_current_view(network=None, base_url=DEFAULT_BASE_URL):
     """
     view_suid = get_network_view_suid(network, base_url=base_url)
     res = commands.commands_post(f'view set current view="SUID:{view_suid}"', base_url=base_url)
+    networks._clear_network_cache(base_url)  # current view's network is now the current network
     # Added double quotes for SUID
     return res
 
@@ -345,3 +354,13 @@ def toggle_graphics_details(base_url=DEFAULT_BASE_URL):
     """
     res = commands.cyrest_put('ui/lod', base_url=base_url)
     return res
+
+
+def _get_view_cache(base_url):
+    # Return the cache of view SUID lists for base_url, keyed by network SUID. It's emptied every NETWORK_CACHE_SECS
+    # in case views are created or destroyed in the Cytoscape GUI or by another client.
+    return commands._get_client(base_url).get_cache('network_views', py4cytoscape_tuning.NETWORK_CACHE_SECS)
+
+def _clear_view_cache(base_url):
+    # Call after any operation that creates or destroys a view
+    commands._get_client(base_url).clear_caches('network_views')
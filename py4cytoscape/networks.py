@@ -58,6 +58,7 @@ from . import sandbox
 from .py4cytoscape_utils import *
 from .py4cytoscape_logger import cy_log
 from .py4cytoscape_tuning import MODEL_PROPAGATION_SECS, CATCHUP_NETWORK_SECS
+from . import py4cytoscape_tuning
 from .exceptions import CyError
 from .py4cytoscape_notebook import running_remote
 from .py4cytoscape_sandbox import get_abs_sandbox_path
@@ -92,9 +93,10 @@ def set_current_network(network=None, base_url=DEFAULT_BASE_URL):
         >>> set_current_network(1502) # sets network having SUID 1502 as current
         {}
     """
-    suid = get_network_suid(network)
+    suid = get_network_suid(network, base_url=base_url)
     cmd = f'network set current network="SUID:{suid}"'
     res = commands.commands_post(cmd, base_url=base_url)
+    _clear_network_cache(base_url)
     # TODO: Put double quotes around SUID
     return res
 
@@ -131,7 +133,9 @@ def rename_network(title, network=None, base_url=DEFAULT_BASE_URL):
     old_suid = get_network_suid(network, base_url=base_url)
     cmd = f'network rename name="{title}" sourceNetwork="SUID:{old_suid}"'
     # TODO: Put double quotes around SUID
-    return commands.commands_post(cmd, base_url)
+    res = commands.commands_post(cmd, base_url)
+    _clear_network_cache(base_url)
+    return res
 
 
 @cy_log
@@ -194,7 +198,7 @@ def get_network_name(suid=None, base_url=DEFAULT_BASE_URL):
     if isinstance(suid, str):
         # title provided
         if suid == 'current':
-            network_suid = get_network_suid(base_url=DEFAULT_BASE_URL)
+            network_suid = get_network_suid(base_url=base_url)
         else:
             net_names = get_network_list(base_url=base_url)
             if suid in net_names:
@@ -205,10 +209,12 @@ def get_network_name(suid=None, base_url=DEFAULT_BASE_URL):
         # suid provided
         network_suid = suid
     else:
-        network_suid = get_network_suid(base_url=DEFAULT_BASE_URL)
+        network_suid = get_network_suid(base_url=base_url)
 
-    res = commands.cyrest_get('networks.names', {'column': 'suid', 'query': network_suid}, base_url=DEFAULT_BASE_URL)
-    return res[0]['name']
+    net_names = dict(_get_network_names(base_url))
+    if network_suid not in net_names:
+        raise CyError(f'Network does not exist for SUID "{network_suid}"')
+    return net_names[network_suid]
 
 
 @cy_log
@@ -244,30 +250,41 @@ def get_network_suid(title=None, base_url=DEFAULT_BASE_URL):
         'current', and NULL). These functions are then used by all other functions
         that take a "network" argument.
     """
+    # Network names and SUIDs are cached because nearly every function resolves its network argument here
+    cache = _get_network_cache(base_url)
     if isinstance(title, str):
         # Title was provided
         if title == 'current':
             network_title = title
+        elif ('title', title) in cache:
+            return cache[('title', title)]
         else:
-            net_names = get_network_list(base_url=base_url)
-            if title in net_names:
-                network_title = title
+            net_suids = [suid for suid, name in _get_network_names(base_url) if name == title]
+            if len(net_suids) == 1:
+                cache[('title', title)] = net_suids[0]
+                return net_suids[0]
+            elif net_suids:
+                network_title = title  # several networks have this name, so let Cytoscape choose as it always has
             else:
                 raise CyError(f'Network does not exist for name "{title}"')
     elif isinstance(title, int):
         # SUID was provided
-        net_suids = commands.cyrest_get('networks', base_url=base_url)
-        if title in net_suids:
+        if title in _get_network_suids(base_url):
             return title
         raise CyError(f'Network does not exist for SUID "{title}"')
     else:
         # Don't understand, so use current network
         network_title = 'current'
 
-    # Make requested network current and return its SUID
+    if network_title == 'current' and 'current' in cache:
+        return cache['current']
+
+    # Fetch the requested network's SUID
     cmd = f'network get attribute network="{network_title}" namespace="default" columnList="SUID"'
     response = commands.commands_post(cmd, base_url=base_url)
-    return int(response[0]['SUID'])
+    suid = int(response[0]['SUID'])
+    cache['current' if network_title == 'current' else ('title', network_title)] = suid
+    return suid
 
 
 @cy_log
@@ -290,13 +307,7 @@ def get_network_list(base_url=DEFAULT_BASE_URL):
         >>> get_network_list()
         ['yeastHighQuality.sif', 'galFiltered.sif']
     """
-    if get_network_count(base_url=base_url):
-        cy_networks_suids = commands.cyrest_get('networks', base_url=base_url)
-        # TODO: This is horribly slow for large networks ... it gets the network in JS format and then digs out the name
-        cy_network_names = [commands.cyrest_get(f'networks/{suid}', base_url=base_url)['data']['name'] for suid in
-                            cy_networks_suids]
-    else:
-        cy_network_names = []
+    cy_network_names = [name for suid, name in _get_network_names(base_url)]
 
     return cy_network_names
 
@@ -389,8 +400,9 @@ def delete_network(network=None, base_url=DEFAULT_BASE_URL):
         >>> delete_network('galFiltered.sif') # delete network having name
         ''
     """
-    suid = get_network_suid(network)
+    suid = get_network_suid(network, base_url=base_url)
     res = commands.cyrest_delete(f'networks/{suid}', base_url=base_url, require_json=False)
+    _clear_network_cache(base_url)
     return res
 
 
@@ -413,6 +425,7 @@ def delete_all_networks(base_url=DEFAULT_BASE_URL):
         >>> delete_all_networks()
     """
     res = commands.cyrest_delete('networks', base_url=base_url, require_json=False)
+    _clear_network_cache(base_url)
     return res
 
 
@@ -462,7 +475,6 @@ def get_first_neighbors(node_names=None, as_nested_list=False, network=None, bas
     See Also:
         :meth:`select_nodes`, :meth:`select_first_neighbors`
     """
-    # TODO: This looks very inefficient because for each node, the entire node table is fetched from Cytoscape and the neighbor list is de-dupped ... verify this and maybe do better
     if node_names is None:
         node_names = network_selection.get_selected_nodes(network=network, base_url=base_url)
     else:
@@ -471,22 +483,30 @@ def get_first_neighbors(node_names=None, as_nested_list=False, network=None, bas
     if node_names is None or len(node_names) == 0: return None
 
     net_suid = get_network_suid(network, base_url=base_url)
-    neighbor_names = []
 
-    for node_name in node_names:
-        # get first neighbors for each node
-        node_suid = node_name_to_node_suid([node_name], net_suid, base_url=base_url, unique_list=True)[0]
+    # translate each distinct name to (the first of) its SUIDs, then fetch all neighbor lists at once
+    distinct_names = list(dict.fromkeys(node_names))
+    name_to_suid = dict(zip(distinct_names,
+                            node_name_to_node_suid(distinct_names, net_suid, base_url=base_url, unique_list=True)))
+    first_neighbors_suids = commands.cyrest_batch([('GET', f'networks/{net_suid}/nodes/{name_to_suid[node_name]}/neighbors')
+                                                   for node_name in node_names], base_url=base_url)
 
-        first_neighbors_suids = commands.cyrest_get(
-            f'networks/{net_suid}/nodes/{node_suid}/neighbors', base_url=base_url)
-        first_neighbors_names = node_suid_to_node_name(first_neighbors_suids, net_suid, base_url=base_url)
+    # translate all neighbor SUIDs to names in one call, then split them back out per node
+    all_neighbors_names = node_suid_to_node_name([suid for suids in first_neighbors_suids for suid in suids], net_suid,
+                                                 base_url=base_url)
+    neighbor_names = []
+    start = 0
+    for node_name, suids in zip(node_names, first_neighbors_suids):
+        first_neighbors_names = all_neighbors_names[start:start + len(suids)]
+        start += len(suids)
 
         if as_nested_list:
             neighbor_names.append([node_name, first_neighbors_names])
         else:
             neighbor_names += first_neighbors_names
-            neighbor_names = list(dict.fromkeys(neighbor_names))  # dedup list
 
+    if not as_nested_list:
+        neighbor_names = list(dict.fromkeys(neighbor_names))  # dedup list
     return neighbor_names
 
 
@@ -526,6 +546,7 @@ def add_cy_nodes(node_names, skip_duplicate_names=True, network=None, base_url=D
         node_names = list(set(node_names) - set(all_nodes_list))
 
     res = commands.cyrest_post(f'networks/{net_suid}/nodes', body=node_names, base_url=base_url)
+    invalidate_name_index('node', net_suid, base_url=base_url)
     return res
 
 
@@ -646,6 +667,7 @@ def add_cy_edges(source_target_list, edge_type='interacts with', directed=False,
                   'interaction': edge_type} for x in range(0, len(edge_suid_list) - 1, 2)]
 
     res = commands.cyrest_post(f'networks/{net_suid}/edges', body=edge_data, base_url=base_url)
+    invalidate_name_index('edge', net_suid, base_url=base_url)
     return res
 
 
@@ -778,8 +800,9 @@ def get_all_edges(network=None, base_url=DEFAULT_BASE_URL):
     e_count = get_edge_count(network, base_url=base_url)
     if e_count == 0: return None
 
-    res = commands.cyrest_get(f'networks/{net_suid}/tables/defaultedge/columns/name', base_url=base_url)
-    return res['values']
+    res = commands.cyrest_get_values(f'networks/{net_suid}/tables/defaultedge/columns/name', count=e_count,
+                                     base_url=base_url)
+    return res.tolist()
 
 
 # ==============================================================================
@@ -811,6 +834,7 @@ def clone_network(network=None, base_url=DEFAULT_BASE_URL):
     """
     net_suid = get_network_suid(network, base_url=base_url)
     res = commands.commands_post(f'network clone network="SUID:{net_suid}"', base_url=base_url)
+    _clear_network_cache(base_url)
 
     # TODO: Put double quotes around SUID
     return res['network']
@@ -871,6 +895,7 @@ def create_subnetwork(nodes=None, nodes_by_col='SUID', edges=None, edges_by_col=
     if not subnetwork_name is None: json_sub['networkName'] = subnetwork_name
 
     res = commands.cyrest_post('commands/network/create', body=json_sub, base_url=base_url)
+    _clear_network_cache(base_url)
     return res['data']['network']
 
 
@@ -1122,6 +1147,7 @@ def create_network_from_data_frames(nodes=None, edges=None, title='From datafram
     # TODO: There appears to be a race condition here ... the view isn't set for a while. Without an explicit delay, the
     # "vizmap apply" command below fails for lack of a valid view.
     time.sleep(CATCHUP_NETWORK_SECS)
+    _clear_network_cache(base_url)
 
     # drop the SUID column if one is present
     nodes = nodes.drop(['SUID'], axis=1, errors='ignore')
@@ -1228,6 +1254,7 @@ def import_network_from_tabular_file(file=None, first_row_as_column_names=False,
     # not returning until it's actually done.
     # TODO: Fix this race condition
     time.sleep(CATCHUP_NETWORK_SECS)
+    _clear_network_cache(base_url)
 
     return res
 
@@ -1272,6 +1299,7 @@ def import_network_from_file(file=None, base_url=DEFAULT_BASE_URL):
     # not returning until it's actually done.
     # TODO: Fix this race condition
     time.sleep(CATCHUP_NETWORK_SECS)
+    _clear_network_cache(base_url)
 
     return res
 
@@ -1426,3 +1454,34 @@ def create_networkx_from_network(network=None, base_url=DEFAULT_BASE_URL):
 # functions.
 # ------------------------------------------------------------------------------
 
+
+def _get_network_cache(base_url):
+    # Return the cache of network SUIDs for base_url, keyed by ('title', network name), 'suids' (set of all network
+    # SUIDs) and 'current' (SUID of the current network). It's emptied every NETWORK_CACHE_SECS in case networks are
+    # changed in the Cytoscape GUI or by another client.
+    return commands._get_client(base_url).get_cache('networks', py4cytoscape_tuning.NETWORK_CACHE_SECS)
+
+def _get_network_names(base_url):
+    # Return [(SUID, name)] for all networks, fetched all at once. The list is cached, but the network count is checked
+    # each time as a cheap way of noticing networks added or deleted outside of py4cytoscape.
+    cache = _get_network_cache(base_url)
+    net_count = get_network_count(base_url=base_url)
+    cached = cache.get('names')
+    if cached is None or cached[0] != net_count:
+        res = commands.cyrest_get('networks.names', base_url=base_url) if net_count else []
+        cached = cache['names'] = (net_count, [(net['SUID'], net['name']) for net in res])
+        cache['suids'] = {suid for suid, name in cached[1]}
+    return cached[1]
+
+def _get_network_suids(base_url):
+    # Return the set of all network SUIDs, from the cache if possible
+    cache = _get_network_cache(base_url)
+    net_suids = cache.get('suids')
+    if net_suids is None:
+        net_suids = cache['suids'] = set(commands.cyrest_get('networks', base_url=base_url))
+    return net_suids
+
+def _clear_network_cache(base_url):
+    # Call after any operation that creates, deletes or renames a network, or changes the current network ... the
+    # network views cached by network_views go too, as networks (and so their views) may have been created or deleted
+    commands._get_client(base_url).clear_caches('networks', 'network_views')
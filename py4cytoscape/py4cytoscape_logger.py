@@ -153,16 +153,27 @@ def log_http_request(method, url, **kwargs):
         if _SUMMARY_ENABLE_HTTP_CALLS and summary_logger.isEnabledFor(logging.INFO) and _summary_logger_enable:
             summary_logger.info(' ' + _logger_nesting_spacer + 'HTTP ' + method + '(' + url + ')' + params + json + data)
 
-def log_http_result(r):
+def log_http_result(r, show_content=True):
     if (_DETAIL_ENABLE_HTTP_CALLS and detail_logger.isEnabledFor(logging.DEBUG)) or \
         (_SUMMARY_ENABLE_HTTP_CALLS and summary_logger.isEnabledFor(logging.DEBUG)):
         if _DETAIL_ENABLE_HTTP_CALLS and detail_logger.isEnabledFor(logging.DEBUG):
-            content = ', content: ' + r.text if _DETAIL_ENABLE_HTTP_CONTENT else ''
+            content = ', content: ' + r.text if _DETAIL_ENABLE_HTTP_CONTENT and show_content else ''
             detail_logger.debug(_logger_nesting_spacer + r.reason + '[' + str(r.status_code) + ']' + content)
         if _SUMMARY_ENABLE_HTTP_CALLS and summary_logger.isEnabledFor(logging.INFO) and _summary_logger_enable:
-            content = ', content: ' + r.text if _SUMMARY_ENABLE_HTTP_CONTENT else ''
+            content = ', content: ' + r.text if _SUMMARY_ENABLE_HTTP_CONTENT and show_content else ''
             summary_logger.info(' ' + _logger_nesting_spacer + r.reason + '[' + str(r.status_code) + ']' + content)
 
+def log_http_retry(method, url, attempt, reason, elapsed_secs, delay_secs):
+    # Retries are always worth a warning in the detail log, as they point to an overloaded or unstable Cytoscape
+    message = f'HTTP {method}({url}) attempt {attempt} failed after {elapsed_secs:.3f} secs: {reason} ... retrying in {delay_secs:.3f} secs'
+    detail_logger.warning(_logger_nesting_spacer + message)
+    if _summary_logger_enable: summary_logger.warning(' ' + _logger_nesting_spacer + message)
+
+def log_http_retries_done(method, url, attempts, elapsed_secs):
+    message = f'HTTP {method}({url}) finished after {attempts} attempts in {elapsed_secs:.3f} secs'
+    detail_logger.info(_logger_nesting_spacer + message)
+    if _summary_logger_enable: summary_logger.info(' ' + _logger_nesting_spacer + message)
+
 def narrate(progress):
     from .py4cytoscape_notebook import get_notebook_is_running
     if get_notebook_is_running():
@@ -21,6 +21,8 @@ import requests
 import json
 import os
 import uuid
+import threading
+import concurrent.futures
 
 
 # Internal module convenience imports
@@ -45,6 +47,10 @@ class SpoofResponse:
     def json(self):
         return json.loads(self.text)
 
+    def close(self):
+        """Does nothing, as the whole reply has already been read ... present so callers can close any response."""
+        pass
+
     def raise_for_status(self):
         """Raises stored :class:`HTTPError`, if one occurred."""
 
@@ -70,7 +76,25 @@ def get_browser_client_channel():
 def get_jupyter_bridge_url():
     return _JUPYTER_BRIDGE_URL
 
+# Jupyter-bridge calls share one keep-alive session, so each call doesn't pay for a new TCP and TLS handshake. Calls
+# are made one at a time, as replies on a channel can't be told apart.
+_bridge_session = None
+_bridge_executor = None
+_bridge_lock = threading.Lock()
+_bridge_overlap = True  # False once Jupyter-bridge has kept refusing to let us wait for a reply before it's queued
+_bridge_overlap_refusals = 0  # early waits refused in a row
+_BRIDGE_MAX_OVERLAP_REFUSALS = 3
+_bridge_stray_wait = None  # early wait left by a call whose request wasn't queued, so the next call's reply is its own
+
+def _get_bridge_session():
+    global _bridge_session, _bridge_executor
+    if _bridge_session is None:
+        _bridge_session = requests.Session()
+        _bridge_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix='jupyter-bridge')
+    return _bridge_session
+
 def do_request_remote(method, url, **kwargs):
+    global _bridge_overlap, _bridge_overlap_refusals, _bridge_stray_wait
     log_http_request(method, url, **kwargs)
 
     if 'json' in kwargs:
@@ -80,6 +104,7 @@ def do_request_remote(method, url, **kwargs):
     else:
         data = None
 
+    # Any timeout is left out on purpose: if this call stopped waiting, its reply would be dequeued by the next call
     http_request = {'command': method,
                     'url': url,
                     'params': kwargs['params'] if 'params' in kwargs else None,
@@ -87,24 +112,51 @@ def do_request_remote(method, url, **kwargs):
                     'headers': kwargs['headers'] if 'headers' in kwargs else None
                     }
 
-    # Call Jupyter-bridge to request a Cytoscape operation. Jupyter-bridge will put the request into a queue, and
-    # the local browser will pick it out, use it to call Cytoscape, and then queue a reply.
-    try:
-        r = requests.request('POST', f'{_JUPYTER_BRIDGE_URL}/queue_request?channel={_CHANNEL}',
-                             headers={'Content-Type': 'application/json'}, json=http_request)
-        r.raise_for_status()
-    except Exception as e:
-        raise requests.exceptions.HTTPError(f'Error posting to Jupyter-bridge: {_error_content(e)}')
-
-    # Call Juptyer-bridge to pick up a reply queued by the local browser, which called Cytoscape to execute an operation
-    # and return a reply.
-    try:
-        while True:
-            r = requests.request('GET', f'{_JUPYTER_BRIDGE_URL}/dequeue_reply?channel={_CHANNEL}')
-            if r.status_code != 408: break  # keep waiting for a result as long as we keep getting connection timeouts
-        r.raise_for_status()
-    except Exception as e:
-        raise requests.exceptions.HTTPError(f'Error receiving from Jupyter-bridge: {_error_content(e)}')
+    with _bridge_lock:
+        session = _get_bridge_session()
+
+        # Start waiting for the reply before the request is queued, so the two round trips to Jupyter-bridge overlap
+        # instead of following each other. An early wait left by a call that couldn't queue its request is still
+        # waiting for the next reply, which will be this call's ... unless it failed before this request was queued.
+        early_reply, _bridge_stray_wait = _bridge_stray_wait, None
+        if early_reply and early_reply.done() and early_reply.exception():
+            early_reply = None
+        if early_reply is None and _bridge_overlap:
+            early_reply = _bridge_executor.submit(_dequeue_reply, session)
+
+        # Call Jupyter-bridge to request a Cytoscape operation. Jupyter-bridge will put the request into a queue, and
+        # the local browser will pick it out, use it to call Cytoscape, and then queue a reply.
+        try:
+            r = session.request('POST', f'{_JUPYTER_BRIDGE_URL}/queue_request?channel={_CHANNEL}',
+                                headers={'Content-Type': 'application/json'}, json=http_request)
+            r.raise_for_status()
+        except Exception as e:
+            # Nothing was queued, so rather than sit out the early wait, leave it to the next call
+            _bridge_stray_wait = early_reply
+            raise requests.exceptions.HTTPError(f'Error posting to Jupyter-bridge: {_error_content(e)}')
+
+        # Call Juptyer-bridge to pick up a reply queued by the local browser, which called Cytoscape to execute an operation
+        # and return a reply.
+        try:
+            r = None
+            if early_reply:
+                # A failed early wait is reported as is, because it may have failed after taking the reply, and then
+                # waiting again would wait forever
+                r = early_reply.result()
+                if r.ok:
+                    _bridge_overlap_refusals = 0
+                else:
+                    # Jupyter-bridge refused to wait before the request was queued, so wait now that it is. If it keeps
+                    # refusing, it doesn't accept early waits at all, so wait after queueing from now on.
+                    detail_logger.debug(f'Jupyter-bridge refused early dequeue_reply: {r.status_code} {r.text}')
+                    _bridge_overlap_refusals += 1
+                    _bridge_overlap = _bridge_overlap_refusals < _BRIDGE_MAX_OVERLAP_REFUSALS
+                    r = None
+            if r is None:
+                r = _dequeue_reply(session)
+            r.raise_for_status()
+        except Exception as e:
+            raise requests.exceptions.HTTPError(f'Error receiving from Jupyter-bridge: {_error_content(e)}')
 
     # We really need a JSON message coming from Jupyter-bridge. It will contain the Cytoscape HTTP response in a dict.
     # If the dict is bad, we can't continue. I have seen this happen, but as a consequence of questionable networking.
@@ -118,8 +170,7 @@ def do_request_remote(method, url, **kwargs):
     # fail.
     try:
         content = r.content
-        encoding = chardet.detect(content)['encoding']
-        message = str(content, encoding, errors='replace')
+        message = _decode_reply(content, r.encoding)
         cy_reply = json.loads(message)
     except:
         content = content or 'None'
@@ -132,8 +183,26 @@ def do_request_remote(method, url, **kwargs):
     log_http_result(r)
     return r
 
+def _dequeue_reply(session):
+    # Keep waiting for a result as long as we keep getting connection timeouts
+    while True:
+        r = session.request('GET', f'{_JUPYTER_BRIDGE_URL}/dequeue_reply?channel={_CHANNEL}')
+        if r.status_code != 408: return r
+
+def _decode_reply(content, declared_encoding=None):
+    # Detecting the character set takes a long time for a large reply, so skip it if the reply is declared as UTF-8
+    # or turns out to be valid UTF-8 (which includes plain ASCII)
+    if declared_encoding and declared_encoding.lower().replace('-', '') == 'utf8':
+        return str(content, 'utf-8', errors='replace')
+    try:
+        return str(content, 'utf-8')
+    except UnicodeDecodeError:
+        encoding = chardet.detect(content)['encoding']
+        return str(content, encoding, errors='replace')
+
 def _error_content(e):
-    return f'{e}' if e.response is None or e.response.text is None or e.response.text == '' else e.response.text
+    response = getattr(e, 'response', None)
+    return f'{e}' if response is None or response.text is None or response.text == '' else response.text
 
 """Determine whether a notebook is running. This matters because if none is running, we're going to have to
    connect to Cytoscape only via a local socket. If a notebook is running, there will be an option to connect
@@ -185,28 +254,35 @@ def check_running_remote():
     global _running_remote
     if get_notebook_is_running():
         if _running_remote is None:
-            try:
-                # Try connecting to a local Cytoscape, first, in case Notebook is on same machine as Cytoscape
-                detail_logger.debug(f'Attempting to connect to local Cytoscape')
-                r = requests.request('GET', _CYREST_URL_V1, headers={'Content-Type': 'application/json'})
-                r.raise_for_status()
-                _running_remote = False
-                detail_logger.debug(f'Detected local Cytoscape')
-            except:
-                # Local Cytoscape doesn't appear to be reachable, so try reaching a remote Cytoscape via Jupyter-bridge
-                try:
-                    detail_logger.debug(f'Attempting to connect to remote Cytoscape')
-                    do_request_remote('GET', _CYREST_URL_V1, headers={'Content-Type': 'application/json'})
-                    _running_remote = True
-                    detail_logger.debug(f'Detected remote Cytoscape')
-                except Exception as e:
-                    # Couldn't reach a local or remote Cytoscape ... use probably didn't start a Cytoscape, so assume he will eventually
-                    detail_logger.debug(f'Error initially contacting Jupyter-bridge: {_error_content(e)}')
-                    _running_remote = None
+            _running_remote = detect_running_remote(_CYREST_URL_V1)
     else:
         _running_remote = False
     return _running_remote
 
+def detect_running_remote(cyrest_url):
+    # Return whether the Cytoscape at cyrest_url is reached via Jupyter-bridge (True) or directly (False), or None if
+    # it can't be reached yet. Unlike check_running_remote(), nothing is remembered, so each URL can be checked.
+    if not get_notebook_is_running():
+        return False
+    try:
+        # Try connecting to a local Cytoscape, first, in case Notebook is on same machine as Cytoscape
+        detail_logger.debug(f'Attempting to connect to local Cytoscape at {cyrest_url}')
+        r = requests.request('GET', cyrest_url, headers={'Content-Type': 'application/json'})
+        r.raise_for_status()
+        detail_logger.debug(f'Detected local Cytoscape')
+        return False
+    except:
+        # Local Cytoscape doesn't appear to be reachable, so try reaching a remote Cytoscape via Jupyter-bridge
+        try:
+            detail_logger.debug(f'Attempting to connect to remote Cytoscape at {cyrest_url}')
+            do_request_remote('GET', cyrest_url, headers={'Content-Type': 'application/json'})
+            detail_logger.debug(f'Detected remote Cytoscape')
+            return True
+        except Exception as e:
+            # Couldn't reach a local or remote Cytoscape ... use probably didn't start a Cytoscape, so assume he will eventually
+            detail_logger.debug(f'Error initially contacting Jupyter-bridge: {_error_content(e)}')
+            return None
+
 def get_browser_client_js(debug_bridge=False):
     global _CHANNEL
     _CHANNEL = uuid.uuid4() # Get a new channel here ... each new browser client works on a fresh channel
@@ -25,6 +25,7 @@ TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR TH
 CATCHUP_FILTER_SECS = 0 # 1
 MODEL_PROPAGATION_SECS = 0 #2
 CATCHUP_NETWORK_SECS = 10 # 2 # with a new Cytoscape instance, 2 would be OK for galFiltered ... on an older instance, need more time
+NETWORK_CACHE_SECS = 5 # how long network, node and edge names and SUIDs are trusted, in case they're changed outside of py4cytoscape
 
 def set_catchup_filter_secs(delay_secs):
     global CATCHUP_FILTER_SECS
@@ -38,4 +39,6 @@ def set_catchup_network_secs(delay_secs):
     global CATCHUP_NETWORK_SECS
     CATCHUP_NETWORK_SECS = delay_secs
 
-
+def set_network_cache_secs(cache_secs):
+    global NETWORK_CACHE_SECS
+    NETWORK_CACHE_SECS = cache_secs
@@ -27,10 +27,15 @@ DEFAULT_BASE_URL = os.environ.get('DEFAULT_BASE_URL') or 'http://127.0.0.1:1234/
 import urllib.parse
 import re
 import sys
+import collections
+import numpy as np
+import pandas as pd
 
 # Internal module imports
 from . import tables
-from . import cytoscape_system
+from . import commands
+from . import networks
+from . import py4cytoscape_tuning
 
 # Internal module convenience imports
 from .exceptions import CyError
@@ -242,20 +247,10 @@ def node_suid_to_node_name(node_suids, network=None, base_url=DEFAULT_BASE_URL):
     if node_suids is None: return None
     node_suids = normalize_list(node_suids)
 
-    df = tables.get_table_columns('node', ['name'], 'default', network, base_url=base_url)
-    all_names = df['name'].values
-
-    test_present = [x in all_names   for x in node_suids]
-    if not False in test_present:
-        return node_suids
-
-    all_suids_list = df.index.tolist()
-    try:
-        # map all SUIDS into column names ... all SUIDs *must* be actual SUIDs
-        node_names = [all_names[all_suids_list.index(node_suid)] for node_suid in node_suids]
-        return node_names
-    except Exception as e:
+    node_names = _suid_to_item(node_suids, 'node', network, base_url=base_url)
+    if node_names is None:
         raise CyError(f'Invalid node SUID in list: {node_suids}')
+    return node_names
 
 
 def edge_name_to_edge_suid(edge_names, network=None, base_url=DEFAULT_BASE_URL, *, unique_list=False):
@@ -339,19 +334,80 @@ def edge_suid_to_edge_name(edge_suids, network=None, base_url=DEFAULT_BASE_URL):
     if edge_suids is None: return None
     edge_suids = normalize_list(edge_suids)
 
-    df = tables.get_table_columns('edge', ['name'], 'default', network, base_url=base_url)
-    all_names = df['name'].values
+    edge_names = _suid_to_item(edge_suids, 'edge', network, base_url=base_url)
+    if edge_names is None:
+        raise CyError(f'Invalid edge SUID in list: {edge_suids}')
+    return edge_names
+
+# ------------------------------------------------------------------------------
+def refresh_name_index(table='node', network=None, base_url=DEFAULT_BASE_URL):
+    """Fetch the names of a network's nodes or edges and index them by SUID and by name.
 
-    test = [edge_suid in all_names   for edge_suid in edge_suids]
-    if not False in test: return edge_suids  # the list already had valid names
+    The SUID/name translation functions (e.g., ``node_name_to_node_suid``) and the functions that accept node or edge
+    names (e.g., ``set_node_color_bypass``) keep an index of each network's names so they needn't fetch the name
+    column on every call. py4cytoscape updates the index when it adds or removes nodes or edges, and otherwise rebuilds
+    it after ``NETWORK_CACHE_SECS`` (see ``set_network_cache_secs``). Call this function (or ``invalidate_name_index``)
+    after nodes or edges are added, removed or renamed outside of py4cytoscape (e.g., in the Cytoscape GUI) to see the
+    change right away.
 
-    all_suids_list = df.index.tolist()
-    try:
-        # map all SUIDS into column names ... all SUIDs *must* be actual SUIDs
-        edge_names = [all_names[all_suids_list.index(edge_suid)]   for edge_suid in edge_suids]
-        return edge_names
-    except Exception as e:
-        raise CyError(f'Invalid edge SUID in list: {edge_suids}')
+    Args:
+        table (str): 'node' or 'edge'
+        network (SUID or str or None): Name or SUID of a network. Default is the
+            "current" network active in Cytoscape.
+        base_url (str): Ignore unless you need to specify a custom domain,
+            port or version to connect to the CyREST API. Default is http://127.0.0.1:1234
+            and the latest version of the CyREST API supported by this version of py4cytoscape.
+
+    Returns:
+        int: number of names indexed
+
+    Raises:
+        CyError: if table is not 'node' or 'edge', or network name or SUID doesn't exist
+        requests.exceptions.RequestException: if can't connect to Cytoscape or Cytoscape returns an error
+
+    Examples:
+        >>> refresh_name_index()
+        330
+        >>> refresh_name_index('edge', network='myNetwork')
+        359
+    """
+    if table not in ['node', 'edge']:
+        raise CyError(f'table must be "node" or "edge", not "{table}"')
+    net_suid = networks.get_network_suid(network, base_url=base_url)
+    return len(_get_name_index(table, net_suid, base_url, refresh=True).suids)
+
+def invalidate_name_index(table=None, network=None, base_url=DEFAULT_BASE_URL):
+    """Discard a network's index of node or edge names, so it's rebuilt the next time a name is translated.
+
+    See ``refresh_name_index`` for when this is needed.
+
+    Args:
+        table (str or None): 'node' or 'edge'; default is both
+        network (SUID or str or None): Name or SUID of a network. Default is the
+            "current" network active in Cytoscape.
+        base_url (str): Ignore unless you need to specify a custom domain,
+            port or version to connect to the CyREST API. Default is http://127.0.0.1:1234
+            and the latest version of the CyREST API supported by this version of py4cytoscape.
+
+    Returns:
+        None
+
+    Raises:
+        CyError: if network name or SUID doesn't exist
+        requests.exceptions.RequestException: if can't connect to Cytoscape or Cytoscape returns an error
+
+    Examples:
+        >>> invalidate_name_index()
+        >>> invalidate_name_index('edge', network='myNetwork')
+    """
+    net_suid = networks.get_network_suid(network, base_url=base_url)
+    client = commands._get_client(base_url)
+    cache = client.get_cache('name_index')
+    snapshots = client.get_cache('table_snapshots')  # sync_table_data's table keys may have changed, too
+    for tbl in ['node', 'edge'] if table is None else [table]:
+        cache.pop((tbl, net_suid), None)
+        for key in [key for key in snapshots if key[0] == net_suid and key[2] == tbl]:
+            del snapshots[key]
 
 
 
@@ -382,7 +438,8 @@ def table_column_exists(table_column, table, network=None, base_url=DEFAULT_BASE
         >>> table_column_exists('bogus', 'edge', network='myNetwork')
         False
     """
-    if table_column not in tables.get_table_column_names(table, network=network, base_url=base_url):
+    net_suid = networks.get_network_suid(network, base_url=base_url)
+    if table_column not in tables._get_column_types(table, 'default', net_suid, base_url, columns=[table_column]):
         narrate('Column ' + table_column + ' does not exist in the ' + table + ' table.')
         return False
     return True
@@ -391,7 +448,8 @@ def table_column_exists(table_column, table, network=None, base_url=DEFAULT_BASE
 def check_supported_versions(cyrest=1, cytoscape=3.6, base_url=DEFAULT_BASE_URL, caller=None):
     """Checks to see if min supported versions of api and cytoscape are running.
 
-    Extracts numerics from api and major cytoscape versions before making comparison.
+    Extracts numerics from api and major cytoscape versions before making comparison. The versions are fetched from
+    Cytoscape only once per connection (see ``CyRESTClient.get_versions``), so checks are cheap enough for any code path.
 
     Args:
         cyrest (int): minimum CyREST version
@@ -412,7 +470,7 @@ def check_supported_versions(cyrest=1, cytoscape=3.6, base_url=DEFAULT_BASE_URL,
     """
     if isinstance(cytoscape, float): cytoscape = str(cytoscape)
 
-    v = cytoscape_system.cytoscape_version_info(base_url=base_url)
+    v = commands._get_client(base_url).get_versions()
     v_api_str = v['apiVersion']
     v_cy_str = v['cytoscapeVersion']
     v_api_num = int(re.match('v([0-9]+)$', v_api_str).group(1))
@@ -436,6 +494,45 @@ def check_supported_versions(cyrest=1, cytoscape=3.6, base_url=DEFAULT_BASE_URL,
 
     return nogo
 
+def get_cytoscape_capabilities(base_url=DEFAULT_BASE_URL):
+    """Report which version-dependent features the connected Cytoscape supports.
+
+    Capabilities are worked out from the Cytoscape version once per connection, so testing one costs no round trip.
+
+    Args:
+        base_url (str): Ignore unless you need to specify a custom domain,
+            port or version to connect to the CyREST API. Default is http://127.0.0.1:1234
+            and the latest version of the CyREST API supported by this version of py4cytoscape.
+
+    Returns:
+         dict: {<capability>: True or False}, where the capabilities are:
+            'filter_apply_flag' (filters can be created without being applied),
+            'filter_regex' (REGEX column filters are safe to use), and
+            'filter_settled_selection' (a filter's selection is complete when the filter returns)
+
+    Raises:
+        CyError: if error connecting to CyREST
+        requests.exceptions.RequestException: if can't connect to Cytoscape or Cytoscape returns an error
+
+    Examples:
+        >>> get_cytoscape_capabilities()
+        {'filter_apply_flag': True, 'filter_regex': True, 'filter_settled_selection': True}
+        >>> get_cytoscape_capabilities()['filter_apply_flag']
+        True
+    """
+    cache = commands._get_client(base_url).get_cache('versions')
+    if 'capabilities' not in cache:
+        cache['capabilities'] = {capability: check_supported_versions(cytoscape=version, base_url=base_url) is None
+                                 for capability, version in _CAPABILITY_VERSIONS.items()}
+    return dict(cache['capabilities'])
+
+# Earliest Cytoscape version having each capability reported by get_cytoscape_capabilities(). All three arrived with
+# the filter rework in Cytoscape 3.9.0: filter create commands gained the apply flag, REGEX filters stopped hanging,
+# and filters began selecting before returning instead of afterward.
+_CAPABILITY_VERSIONS = {'filter_apply_flag': '3.9',
+                        'filter_regex': '3.9',
+                        'filter_settled_selection': '3.9'}
+
 def verify_supported_versions(cyrest=1, cytoscape=3.6, base_url=DEFAULT_BASE_URL, caller=None):
     """Throws exception if min supported versions of api and cytoscape are not running.
 
@@ -545,33 +642,93 @@ def normalize_mapping(mapping_type, visual_prop_name, supported_mappings):
     else:
         raise CyError(f'mapping_type "{mapping_type}" for property "{visual_prop_name}" not recognized ... must be "{supported_mappings}"')
 
+class _NameIndex(collections.namedtuple('_NameIndex', ['suids', 'names', 'unique_names', 'name_starts',
+                                                        'name_counts', 'grouped_suids'])):
+    # suids: pd.Index of node or edge SUIDs in table order
+    # names: np.array of the name for each SUID
+    # unique_names: pd.Index of each distinct name (but not None)
+    # name_starts, name_counts: np.arrays giving where each unique name's SUIDs start in grouped_suids, and how many
+    # grouped_suids: np.array of SUIDs grouped by name, and in table order within each name
+    __slots__ = ()
+
+    def suids_of(self, name):
+        # Return the list of SUIDs having the name ... empty if there are none
+        try:
+            pos = self.unique_names.get_loc(name)
+        except (KeyError, TypeError, pd.errors.InvalidIndexError):
+            return []
+        return self.grouped_suids[self.name_starts[pos]:self.name_starts[pos] + self.name_counts[pos]].tolist()
+
+def _build_name_index(suids, names):
+    codes, unique_names = pd.factorize(names)  # code -1 marks a missing name
+    order = np.argsort(codes, kind='stable')
+    order = order[codes[order] >= 0]
+    name_counts = np.bincount(codes[order], minlength=len(unique_names))
+    name_starts = np.cumsum(name_counts) - name_counts
+    return _NameIndex(suids, names, pd.Index(unique_names, dtype=object), name_starts, name_counts,
+                      suids.values[order])
+
+def _get_name_index(table_name, net_suid, base_url, refresh=False):
+    # Return the _NameIndex for a node or edge table, fetching its name column if it isn't cached. The cache lives as
+    # long as network SUIDs are cached, and functions that add or delete nodes or edges must invalidate_name_index().
+    cache = commands._get_client(base_url).get_cache('name_index', py4cytoscape_tuning.NETWORK_CACHE_SECS)
+    index = None if refresh else cache.get((table_name, net_suid))
+    if index is None:
+        df = tables.get_table_columns(table_name, ['name'], 'default', net_suid, base_url=base_url)
+        index = cache[(table_name, net_suid)] = _build_name_index(df.index, df['name'].values)
+    return index
+
+def _as_suids(items):
+    # Return items as an np.array of int64 if they're all integers (or integer strings), or None if they're not
+    try:
+        suids = np.asarray(items)
+        if suids.ndim != 1: return None
+        return suids if suids.dtype.kind in 'iu' else suids.astype(np.int64)
+    except (ValueError, TypeError, OverflowError):
+        return None
+
+def _suid_to_item(item_suids, table_name, network=None, base_url=DEFAULT_BASE_URL):
+    # Translate a list of node or edge SUIDs into a list of names. If the list is already all names, return it as is.
+    # Return None if any SUID isn't in the network.
+    index = _get_name_index(table_name, networks.get_network_suid(network, base_url=base_url), base_url)
+    if (index.unique_names.get_indexer(item_suids) >= 0).all():
+        return item_suids
+
+    positions = index.suids.get_indexer(item_suids)
+    if (positions < 0).any():
+        return None
+    return index.names[positions].tolist()
+
 def _item_to_suid(item_names, table_name, network=None, base_url=DEFAULT_BASE_URL, unique_list=False):
     # Translate a list of node or edge names into a list of SUIDs ... account for duplicatated names if list is unique
     if item_names is None: return None
     item_names = normalize_list(item_names)
 
-    df = tables.get_table_columns(table_name, ['name'], 'default', network, base_url=base_url)
+    index = _get_name_index(table_name, networks.get_network_suid(network, base_url=base_url), base_url)
 
     # Check all item names to see if they're all valid SUIDs ... if so, we're already done
-    all_suids = df.index
-    try:
-        item_names = [int(i) for i in item_names]
-        found_valid_suids = [i in all_suids for i in item_names]
-        if False not in found_valid_suids:
-            return item_names
-    except:
-        pass
+    item_suids = _as_suids(item_names)
+    if item_suids is not None and np.isin(item_suids, index.suids.values).all():
+        return item_suids.tolist()
 
     # map all names into SUIDs ... all names *must* be actual names
-    item_name_to_suid_list = {item_name: list(df[df.name.eq(item_name)].index.values) for item_name in item_names}
-    try:
-        if unique_list:
-            suid_list = [item_name_to_suid_list[item_name].pop(0) for item_name in item_names]
-        else:
-            suid_list = [item_name_to_suid_list[item_name] for item_name in item_names]
-            suid_list = [s[0] if len(s) <= 1 else s    for s in suid_list] # return scalar if len(list) = 1, blow up if len(list) = 0
-    except:
+    positions = index.unique_names.get_indexer(item_names)
+    if (positions < 0).any():
         raise CyError(f'Invalid name in {table_name} name list: {item_names}')
+    starts = index.name_starts[positions]
+    counts = index.name_counts[positions]
+
+    if unique_list:
+        # the nth instance of a name gets the nth node/edge having that name
+        instance = pd.Series(positions).groupby(positions).cumcount().values
+        if (instance >= counts).any():
+            raise CyError(f'Invalid name in {table_name} name list: {item_names}')
+        suid_list = index.grouped_suids[starts + instance].tolist()
+    else:
+        # return scalar if only one node/edge has the name, or a list of all that have the name
+        suid_list = index.grouped_suids[starts].tolist()
+        for i in np.flatnonzero(counts > 1):
+            suid_list[i] = index.grouped_suids[starts[i]:starts[i] + counts[i]].tolist()
 
     return suid_list
 
@@ -67,7 +67,9 @@ def close_session(save_before_closing, filename=None, base_url=DEFAULT_BASE_URL)
     """
     if save_before_closing: save_session(filename, base_url=base_url)
 
-    return commands.commands_post('session new', base_url=base_url)
+    res = commands.commands_post('session new', base_url=base_url)
+    commands._get_client(base_url).clear_caches()  # nothing cached about the old session still holds
+    return res
 
 
 @cy_log
@@ -115,7 +117,9 @@ def open_session(file_location=None, base_url=DEFAULT_BASE_URL):
             file_location = 'sampleData/sessions/Yeast Perturbation.cys' # relative to Cytoscape install directory
 
     narrate(f'Opening {file_location}...')
-    return commands.commands_post(f'session open {type}="{file_location}"', base_url=base_url)
+    res = commands.commands_post(f'session open {type}="{file_location}"', base_url=base_url)
+    commands._get_client(base_url).clear_caches()  # nothing cached about the old session still holds
+    return res
 
 
 @cy_log
@@ -127,7 +127,7 @@ def get_visual_property_default(property, style_name=None, base_url=DEFAULT_BASE
         narrate(f'style_name not specified, so accessing "default" style.')
 
     # TODO: Should the property name be mapped like in update_style_defaults?
-    res = commands.cyrest_get(f'styles/{style_name}/defaults/{property}', base_url=base_url)
+    res = commands._cached_cyrest_get(f'styles/{style_name}/defaults/{property}', base_url=base_url)
     return res['value']
 
 
@@ -71,7 +71,7 @@ def get_style_dependencies(style_name=None, base_url=DEFAULT_BASE_URL):
     if style_name not in styles.get_visual_style_names(base_url=base_url):
         raise CyError(f'No visual style named "{style_name}"')
 
-    res = commands.cyrest_get(f'styles/{style_name}/dependencies', base_url=base_url)
+    res = commands._cached_cyrest_get(f'styles/{style_name}/dependencies', base_url=base_url)
 
     # make it a dict
     dep_list = {dep['visualPropertyDependency']: dep['enabled'] for dep in res}
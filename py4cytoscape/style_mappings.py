@@ -31,6 +31,7 @@ import time
 # Internal module imports
 from . import networks
 from . import commands
+from . import tables
 from . import styles
 from . import style_defaults
 from . import style_dependencies
@@ -121,12 +122,7 @@ def map_visual_property(visual_prop, table_column, mapping_type, table_column_va
     # check mapping column and get type
     tp = visual_prop_name.split('_')[0].lower()
     table = 'default' + tp
-    res = commands.cyrest_get('networks/' + str(suid) + '/tables/' + table + '/columns', base_url=base_url)
-    table_column_type = None
-    for col in res:
-        if col['name'] == table_column:
-            table_column_type = col['type']
-            break
+    table_column_type = tables._get_column_types(tp, 'default', suid, base_url, columns=[table_column]).get(table_column)
     if table_column_type is None:
         raise CyError(f'Could not find "{table_column}" column in "{table}" table.')
 
@@ -195,7 +191,7 @@ def update_style_mapping(style_name, mapping, base_url=DEFAULT_BASE_URL):
         narrate(f'style_name not specified, so updating "default" style.')
 
     # check if vp exists already
-    res = commands.cyrest_get(f'styles/{style_name}/mappings', base_url=base_url)
+    res = commands._cached_cyrest_get(f'styles/{style_name}/mappings', base_url=base_url)
     vp_list = [prop['visualProperty'] for prop in res]
     exists = visual_prop_name in vp_list
 
@@ -234,7 +230,7 @@ def delete_style_mapping(style_name, visual_prop, base_url=DEFAULT_BASE_URL):
         ''
     """
     # check if vp exists already
-    res = commands.cyrest_get(f'styles/{style_name}/mappings', base_url=base_url)
+    res = commands._cached_cyrest_get(f'styles/{style_name}/mappings', base_url=base_url)
     vp_list = [prop['visualProperty'] for prop in res]
     exists = visual_prop in vp_list
 
@@ -281,7 +277,7 @@ def get_style_mapping(style_name, visual_prop, base_url=DEFAULT_BASE_URL):
         narrate(f'style_name not specified, so accessing "default" style.')
 
     # check if vp exists already
-    res = commands.cyrest_get(f'styles/{style_name}/mappings', base_url=base_url)
+    res = commands._cached_cyrest_get(f'styles/{style_name}/mappings', base_url=base_url)
     for prop in res:
         if prop['visualProperty'] == visual_prop:
             return prop
@@ -320,7 +316,7 @@ def get_style_all_mappings(style_name, base_url=DEFAULT_BASE_URL):
         style_name = 'default'
         narrate(f'style_name not specified, so accessing "default" style.')
 
-    res = commands.cyrest_get(f'styles/{style_name}/mappings', base_url=base_url)
+    res = commands._cached_cyrest_get(f'styles/{style_name}/mappings', base_url=base_url)
     return res
 
 
@@ -96,9 +96,9 @@ def get_node_property(node_names=None, visual_property=None, network=None, base_
     else:
         node_names = normalize_list(node_names)
         node_suids = node_name_to_node_suid(node_names, network=network, base_url=base_url, unique_list=True)
-        node_props = {node_name: commands.cyrest_get(
-            f'networks/{net_suid}/views/{view_suid}/nodes/{node_suid}/{visual_property}', base_url=base_url)['value']
-                      for node_suid, node_name in zip(node_suids, node_names)}
+        res = commands.cyrest_batch([('GET', f'networks/{net_suid}/views/{view_suid}/nodes/{node_suid}/{visual_property}')
+                                     for node_suid in node_suids], base_url=base_url)
+        node_props = {node_name: prop['value'] for prop, node_name in zip(res, node_names)}
         return node_props
 
 
@@ -160,9 +160,9 @@ def get_edge_property(edge_names=None, visual_property=None, network=None, base_
     else:
         edge_names = normalize_list(edge_names)
         edge_suids = edge_name_to_edge_suid(edge_names, network=network, base_url=base_url, unique_list=True)
-        edge_props = {edge_name: commands.cyrest_get(
-            f'networks/{net_suid}/views/{view_suid}/edges/{edge_suid}/{visual_property}', base_url=base_url)['value']
-                      for edge_suid, edge_name in zip(edge_suids, edge_names)}
+        res = commands.cyrest_batch([('GET', f'networks/{net_suid}/views/{view_suid}/edges/{edge_suid}/{visual_property}')
+                                     for edge_suid in edge_suids], base_url=base_url)
+        edge_props = {edge_name: prop['value'] for prop, edge_name in zip(res, edge_names)}
         return edge_props
 
 
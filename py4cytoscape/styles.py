@@ -262,7 +262,7 @@ def get_visual_style_names(base_url=DEFAULT_BASE_URL):
         >>> visual_style_names()
         ['Universe', 'Marquee', 'Big Labels', 'BioPAX_SIF', 'Ripple', 'Metallic', 'default black', ...]
     """
-    res = commands.cyrest_get('apply/styles', base_url=base_url)
+    res = commands._cached_cyrest_get('apply/styles', base_url=base_url)
     return res
 
 
@@ -323,7 +323,7 @@ def get_arrow_shapes(base_url=DEFAULT_BASE_URL):
         >>> get_arrow_shapes()
         ['OPEN_CIRCLE', 'SQUARE', 'CIRCLE', 'DELTA_SHORT_2', 'DELTA', 'DIAMOND_SHORT_2', ...]
     """
-    res = commands.cyrest_get('styles/visualproperties/EDGE_TARGET_ARROW_SHAPE/values', base_url=base_url)
+    res = commands._cached_cyrest_get('styles/visualproperties/EDGE_TARGET_ARROW_SHAPE/values', base_url=base_url)
     return res['values']
 
 
@@ -349,7 +349,7 @@ def get_line_styles(base_url=DEFAULT_BASE_URL):
         >>> get_line_styles()
         ['MARQUEE_DASH_DOT', 'SOLID', 'BACKWARD_SLASH', 'EQUAL_DASH', 'CONTIGUOUS_ARROW', ...]
     """
-    res = commands.cyrest_get('styles/visualproperties/EDGE_LINE_TYPE/values', base_url=base_url)
+    res = commands._cached_cyrest_get('styles/visualproperties/EDGE_LINE_TYPE/values', base_url=base_url)
     return res['values']
 
 @cy_log
@@ -374,7 +374,7 @@ def get_node_shapes(base_url=DEFAULT_BASE_URL):
         >>> get_node_shapes()
         ['ROUND_RECTANGLE', 'VEE', 'TRIANGLE', 'HEXAGON', 'PARALLELOGRAM', 'ELLIPSE', 'OCTAGON', ...]
     """
-    res = commands.cyrest_get('styles/visualproperties/NODE_SHAPE/values', base_url=base_url)
+    res = commands._cached_cyrest_get('styles/visualproperties/NODE_SHAPE/values', base_url=base_url)
     return res['values']
 
 
@@ -397,9 +397,12 @@ def get_visual_property_names(base_url=DEFAULT_BASE_URL):
         >>> get_visual_property_names()
         ['COMPOUND_NODE_PADDING', 'COMPOUND_NODE_SHAPE', 'DING_RENDERING_ENGINE_ROOT', 'EDGE', ...]
     """
-    res = commands.cyrest_get('styles/default/defaults', base_url=base_url)
-    visual_properties = [prop['visualProperty']     for prop in res['defaults']]
-    return visual_properties
+    # The visual properties come from the renderer, so they don't change until Cytoscape restarts
+    cache = commands._get_client(base_url).get_cache('visual_properties')
+    if 'names' not in cache:
+        res = commands.cyrest_get('styles/default/defaults', base_url=base_url)
+        cache['names'] = [prop['visualProperty'] for prop in res['defaults']]
+    return list(cache['names'])
 
 
 @cy_log
@@ -21,18 +21,31 @@ TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR TH
 """
 
 # External library imports
+import collections
+import os
+import tempfile
+import concurrent.futures
 import pandas as pd
 import numpy as np
+try:
+    import pyarrow as pa  # Optional ... lets tables be exchanged as Arrow tables and Parquet files
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pc = pq = None
 
 # Internal module imports
 from . import commands
 from . import networks
+from . import sandbox
+from . import py4cytoscape_tuning
 
 # Internal module convenience imports
 from .py4cytoscape_utils import *
 from .py4cytoscape_logger import cy_log, narrate
 from .exceptions import CyError
-from .py4cytoscape_sandbox import get_abs_sandbox_path
+from .py4cytoscape_sandbox import get_abs_sandbox_path, get_current_sandbox
+from .py4cytoscape_notebook import running_remote
 
 def __init__(self):
     pass
@@ -75,11 +88,14 @@ def delete_table_column(column, table='node', namespace='default', network=None,
     net_suid = networks.get_network_suid(network, base_url=base_url)
     res = commands.cyrest_delete(f'networks/{net_suid}/tables/{namespace}{table}/columns/{column}',
                                  base_url=base_url, require_json=False)
+    _invalidate_column_types(table, namespace, net_suid, base_url)
+    _invalidate_table_snapshots(table, namespace, net_suid, base_url, columns=[column])
     return res
 
 
 @cy_log
-def get_table_columns(table='node', columns=None, namespace='default', network=None, base_url=DEFAULT_BASE_URL):
+def get_table_columns(table='node', columns=None, namespace='default', network=None, base_url=DEFAULT_BASE_URL, *,
+                      bulk=None, dtype_backend='numpy'):
     """Retrieve one or more columns of data from node, edge or network tables.
 
     The 'SUID' column is always retrieved along with specified columns. The 'SUID' values are used as ``index`` in
@@ -95,13 +111,18 @@ def get_table_columns(table='node', columns=None, namespace='default', network=N
         base_url (str): Ignore unless you need to specify a custom domain,
             port or version to connect to the CyREST API. Default is http://127.0.0.1:1234
             and the latest version of the CyREST API supported by this version of py4cytoscape.
+        bulk (bool or None): True to fetch the whole table in one call; False to fetch each column with its own call;
+            None to fetch the whole table if more than half of its columns are requested
+        dtype_backend (str): 'numpy' for NumPy dtypes, where an integer column with missing values has object dtype;
+            'numpy_nullable' for pandas nullable dtypes (Int64, Float64, boolean and string), where missing values
+            are ``pd.NA``
 
     Returns:
         dataframe: requested columns (including SUID), and rows for each node/edge or network.
 
     Raises:
         HTTPError: if table or namespace doesn't exist in network
-        CyError: if network name or SUID doesn't exist
+        CyError: if network name or SUID doesn't exist, or dtype_backend is invalid
         requests.exceptions.RequestException: if can't connect to Cytoscape or Cytoscape returns an error
 
     Examples:
@@ -130,27 +151,44 @@ def get_table_columns(table='node', columns=None, namespace='default', network=N
         4608       0   NaN
         4609    2092   NaN
         ...
+        >>> get_table_columns(bulk=True, dtype_backend='numpy_nullable').dtypes
+        SUID                    Int64
+        shared name            string
+        name                   string
+        ...
 
     Note:
         For requested columns not present in the table, the column is still returned but is full of ``nan`` values.
     """
+    if dtype_backend not in _COLUMN_DTYPES:
+        raise CyError(f'dtype_backend must be one of {list(_COLUMN_DTYPES)}, not "{dtype_backend}"')
     suid = networks.get_network_suid(network, base_url)
 
-    # column information (names and types)
-    table_col_info = get_table_column_types(table, namespace=namespace, network=network, base_url=base_url)
-    table_col_list = list(table_col_info.keys())
-
     # all columns ... handle comma separated lists and list objects
     if columns is None:
-        col_list = table_col_list
+        col_list = None
     elif isinstance(columns, str):
         col_list = [col.strip() for col in columns.split(',')]
     else:
         col_list = columns
 
-    # get suid column first and make a dataframe with SUID as index
-    res_names = commands.cyrest_get(f'networks/{suid}/tables/{namespace}{table}/columns/SUID', base_url=base_url)
-    suid_list = res_names['values']
+    # column information (names and types)
+    table_col_info = _get_column_types(table, namespace, suid, base_url, columns=col_list, refresh=col_list is None)
+    table_col_list = list(table_col_info.keys())
+    if col_list is None: col_list = table_col_list
+    if bulk is None: bulk = len(col_list) > len(table_col_list) / 2
+
+    if bulk:
+        # fetch all rows in one call, and then pull each column out of them
+        rows = commands.cyrest_get_values(f'networks/{suid}/tables/{namespace}{table}', item_path='rows.item',
+                                          base_url=base_url)
+        suid_list = commands._fill_array((row['SUID'] for row in rows), dtype='int64', count=len(rows))
+    else:
+        # get suid column first
+        suid_list = commands.cyrest_get_values(f'networks/{suid}/tables/{namespace}{table}/columns/SUID',
+                                               dtype='int64', base_url=base_url)
+
+    # make a dataframe with SUID as index
     df = pd.DataFrame(index=suid_list, columns=col_list)
 
     # then fill in each requested column
@@ -160,35 +198,25 @@ def get_table_columns(table='node', columns=None, namespace='default', network=N
             # TODO: Is this really the behavior we want?
             break
 
-        # fetch all values for the column
-        res_col = commands.cyrest_get(f'networks/{suid}/tables/{namespace}{table}/columns/{col}', base_url=base_url)
-
         # the R version of this function replaces missing values with the constant NA, which
         # doesn't exist in Python. Pandas authority discusses this situation, but doesn't
         # make a clear recommendation, so we'll leave None as None for non-numerics and nan for
         # numerics.
         # https://pandas.pydata.org/pandas-docs/stable/user_guide/missing_data.html
-        table_col_type = table_col_info[col]
-        if table_col_type in ['Double']:
-            def f(x):
-                return np.nan if x is None else float(x)
-        elif table_col_type in ['Long', 'Integer']:
-            def f(x):
-                return np.nan if x is None else int(x)
-        elif table_col_type in ['Boolean']:
-            def f(x):
-                return None if x is None else bool(x)
+        dtype, missing, pd_dtype = _COLUMN_DTYPES[dtype_backend].get(table_col_info[col], (object, None, None))
+
+        if bulk:
+            # rows leave out missing values, so those come back as None
+            cvv = commands._fill_array((row.get(col) for row in rows), dtype=dtype, count=len(rows), missing=missing)
         else:
-            def f(x):
-                return x
-        cvv = [f(x) for x in res_col['values']]
+            # fetch all values for the column straight into an array
+            cvv = commands.cyrest_get_values(f'networks/{suid}/tables/{namespace}{table}/columns/{col}', dtype=dtype,
+                                             count=len(suid_list), missing=missing, base_url=base_url)
 
         if len(suid_list) != len(cvv):
             narrate('Column "%s" has only %d elements, but should have %d' % (col, len(cvv), len(suid_list)))
             break  # TODO: Is this the right response?
-        # TODO: Consider assigning entire column all at once instead of iterating ... should be OK
-        for val, suid_val in zip(cvv, suid_list):
-            df.at[suid_val, col] = val
+        df[col] = pd.Series(cvv, index=df.index, dtype=pd_dtype or cvv.dtype)
 
     return df
 
@@ -227,7 +255,7 @@ def get_table_value(table, row_name, column, namespace='default', network=None,
     suid = networks.get_network_suid(network, base_url=base_url)
 
     # column type
-    table_col_info = get_table_column_types(table, namespace, network, base_url=base_url)
+    table_col_info = _get_column_types(table, namespace, suid, base_url, columns=[column])
     table_col_type = table_col_info[column]
 
     # which row
@@ -293,9 +321,7 @@ def get_table_column_names(table='node', namespace='default', network=None, base
         ['SUID', 'shared name', 'name', 'selected', '__Annotations', 'publication', 'Dataset Name', 'Dataset URL']
     """
     suid = networks.get_network_suid(network, base_url=base_url)
-    tbl = namespace + table
-    res = commands.cyrest_get(f'networks/{suid}/tables/{tbl}/columns', base_url=base_url)
-    col_names = [x['name'] for x in res]
+    col_names = list(_get_column_types(table, namespace, suid, base_url, refresh=True))
     return col_names
 
 
@@ -329,9 +355,7 @@ def get_table_column_types(table='node', namespace='default', network=None, base
         {'SUID': 'Long', 'shared name': 'String', 'name': 'String', 'selected': 'Boolean', '__Annotations': 'List', ...}
     """
     suid = networks.get_network_suid(network, base_url=base_url)
-    cmd = f'networks/{suid}/tables/{namespace}{table}/columns'
-    res = commands.cyrest_get(cmd, base_url=base_url)
-    col_types = {x['name']: x['type'] for x in res}
+    col_types = dict(_get_column_types(table, namespace, suid, base_url, refresh=True))
 
     return col_types
 
@@ -404,7 +428,8 @@ def load_table_data_from_file(file, first_row_as_column_names=False, start_load_
 
 @cy_log
 def load_table_data(data, data_key_column='row.names', table='node', table_key_column='name', namespace='default',
-                    network=None, base_url=DEFAULT_BASE_URL):
+                    network=None, base_url=DEFAULT_BASE_URL, *, chunk_size=None, max_workers=1, progress=None,
+                    diagnostics=False):
     """Loads data into Cytoscape tables keyed by row.
 
     This function loads data into Cytoscape node/edge/network
@@ -416,8 +441,15 @@ def load_table_data(data, data_key_column='row.names', table='node', table_key_c
     stored as Lists by CyREST v3.9+. Existing columns with the same names will
     keep original type but values will be overwritten.
 
+    For very large data, set ``chunk_size`` so the data is sent a chunk of rows at a time, which limits the memory
+    needed to encode it and the time Cytoscape takes for each call. Chunks can be sent several at a time by setting
+    ``max_workers``. The data can also be given as an iterator of dataframes (e.g., from ``pd.read_csv(...,
+    chunksize=...)``), so it needn't all be in memory at once. Integer columns are created before any data is sent, and
+    other new columns are created by sending the first chunk having them before any others.
+
     Args:
-        data (dataframe): each row is a node and columns contain node attributes
+        data (dataframe or iterator): each row is a node and columns contain node attributes ... or an iterator of
+            such dataframes, all having the same columns
         data_key_column (str): name of data.frame column to use as key; ' default is "row.names"
         table (str): name of Cytoscape table to load data into, e.g., node, edge or network; default is "node"
         namespace (str): Namespace of table. Default is "default".
@@ -426,13 +458,20 @@ def load_table_data(data, data_key_column='row.names', table='node', table_key_c
         base_url (str): Ignore unless you need to specify a custom domain,
             port or version to connect to the CyREST API. Default is http://127.0.0.1:1234
             and the latest version of the CyREST API supported by this version of py4cytoscape.
+        chunk_size (int or None): most rows sent per call; None sends each dataframe in one call
+        max_workers (int): most calls in flight at once ... always 1 for Jupyter-Bridge connections
+        progress (func or None): called as ``progress(rows_loaded, rows_total)`` each time a chunk has been loaded,
+            where rows_total is None if data is an iterator
+        diagnostics (bool): True to return a dict describing the load instead of a message
 
     Returns:
-        str: 'Success: Data loaded in <table name> table' or 'Failed to load data: <reason>'
+        str: 'Success: Data loaded in <table name> table' or 'Failed to load data: <reason>' ... or if diagnostics is
+            True, a dict: {'message': message, 'rows_loaded': rows whose keys matched, 'rows_unmatched': rows whose
+            keys weren't in the table and so weren't loaded, 'unmatched_keys': up to 10 of those keys}
 
     Raises:
         HTTPError: if table or namespace or table doesn't exist in network
-        CyError: if network name or SUID doesn't exist
+        CyError: if network name or SUID doesn't exist, or chunk_size or max_workers is invalid
         requests.exceptions.RequestException: if can't connect to Cytoscape or Cytoscape returns an error
 
     Examples:
@@ -442,7 +481,18 @@ def load_table_data(data, data_key_column='row.names', table='node', table_key_c
         >>> data = df.DataFrame(data={'id':['YDL194W','YDR277C','YBR043C'], 'newcol':[1,2,3]})
         >>> load_table_data(data, data_key_column='id', table='node', table_key_column='name', network='galfiltered.sif')
         'Success: Data loaded in defaultnode table'
+        >>> data = df.DataFrame(data={'id':['YDL194W','YDR277C','New1'], 'newcol':[1,2,3]})
+        >>> load_table_data(data, data_key_column='id', diagnostics=True)
+        {'message': 'Success: Data loaded in defaultnode table', 'rows_loaded': 2, 'rows_unmatched': 1, 'unmatched_keys': ['New1']}
+        >>> load_table_data(pd.read_csv('edge_weights.csv', chunksize=500000), data_key_column='id', table='edge',
+        ...                 chunk_size=100000, max_workers=4, progress=lambda rows, total: print(f'{rows} rows'))
+        'Success: Data loaded in defaultedge table'
     """
+    if chunk_size is not None and (not isinstance(chunk_size, int) or chunk_size < 1):
+        raise CyError(f'chunk_size must be a positive integer or None, not "{chunk_size}"')
+    if not isinstance(max_workers, int) or max_workers < 1:
+        raise CyError(f'max_workers must be a positive integer, not "{max_workers}"')
+
     net_suid = networks.get_network_suid(network, base_url=base_url)
     table_key_column_values = get_table_columns(table=table, namespace=namespace, columns=table_key_column,
                                                 network=net_suid, base_url=base_url)
@@ -450,34 +500,18 @@ def load_table_data(data, data_key_column='row.names', table='node', table_key_c
 
     if table_key_column_values.columns is None:
         raise CyError('Failed to load data. Please check table_key_column.')
+    table_keys = table_key_column_values[table_key_column]
+    table_key_strs = pd.Index(table_keys.astype(str)).unique()  # hashed, so each data key is matched in constant time
 
-    if data_key_column == 'row.names':
-        data['row.names'] = data.index
-
-    if not data_key_column in data.columns:
-        raise CyError('Failed to load data. Please check data_key_column.')
-
-    # verify that there is at least one key in the Cytoscape table that matches a key in the data
-    table_keys = table_key_column_values[table_key_column].astype(str).values
-    filter = [str(key) in table_keys     for key in data[data_key_column]]
-    if not True in filter:
-        raise CyError(f'Provided table key column "{table_key_column}" and data key column "{data_key_column}" do not contain any matches')
-
-    # create table containing columns present in data and already present in Cytoscape table
-    data_subset = data[filter]
-
-    # look for elements that are lists (instead of scalars) and turn them into comma-separated strings.
-    # Note that CyREST doesn't accept lists or create columns of type list, but comma-separated strings is
-    # the best we can do for the user at this time.
-    for col in data_subset.columns:
-        col_val = [','.join(val) if isinstance(val, list) else val for val in data_subset[col]]
-        data_subset[col] = col_val
-
-    # TODO: Find out whether "factors" are an issue in Python, and why factors could be troublesome in R
-    # TODO: Verify that this gives the right answer for list of str, int, etc
+    return _load_table_data(data, data_key_column, table, table_key_column, namespace, net_suid, base_url, table_keys,
+                            table_key_strs, chunk_size=chunk_size, max_workers=max_workers, progress=progress,
+                            diagnostics=diagnostics)
+    # TODO: This is a difficult result to test for ... are we able to change it?
 
-    data_list = _df_to_attr_dict_list(data_subset)  # convert DataFrame to dicts that are easy to convert to JSON
 
+def _load_table_data(data, data_key_column, table, table_key_column, namespace, net_suid, base_url, table_keys,
+                     table_key_strs, chunk_size=None, max_workers=1, progress=None, diagnostics=False):
+    # Same as load_table_data, but with the table's keys (and their hashed strings) already fetched
     tbl = namespace + table  # calculate fully qualified table name
 
     # if there are any columns that aren't in the Cytoscape table and they're going to be Int, add them explicitly now so
@@ -486,17 +520,516 @@ def load_table_data(data, data_key_column='row.names', table='node', table_key_c
         return commands.cyrest_post(f'networks/{net_suid}/tables/{tbl}/columns',
                                     body={'name': x, 'type': 'Integer'}, require_json=False, base_url=base_url)
 
-    existing_cols = get_table_column_names(table, namespace, net_suid, base_url=base_url)
-    [create_col(x[0]) if x[1] == 'int64' and not x[0] in existing_cols else None for x in
-     data_subset.dtypes.iteritems()]
+    existing_cols = set(_get_column_types(table, namespace, net_suid, base_url))
+    known_cols = set(existing_cols)  # columns whose cached types stay good
+    loaded_cols = set()
 
-    # finally, add the values for whatever columns we have (and create new columns as needed)
-    res = commands.cyrest_put(f'networks/{net_suid}/tables/{tbl}',
-                              body={'key': table_key_column, 'dataKey': data_key_column, 'data': data_list},
-                              require_json=False, base_url=base_url)
+    # A single dataframe is checked for matching keys before anything is sent, as it always has been. An iterator's
+    # dataframes are checked one at a time, and it's an error only if none of them match.
+    if isinstance(data, pd.DataFrame):
+        frames = [_filter_table_data(data, data_key_column, table_keys, table_key_strs, table_key_column)]
+        rows_total = len(frames[0][0])
+    else:
+        frames = (_filter_table_data(frame, data_key_column, table_keys, table_key_strs, table_key_column,
+                                     require_match=False)
+                  for frame in data)
+        rows_total = None
+    unmatched_count = 0
+    unmatched_sample = []
+
+    # Send the chunks, keeping up to max_workers of them in flight and noting progress as each one finishes
+    if commands._get_client(base_url).is_remote(): max_workers = 1  # Jupyter-Bridge carries one request at a time
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) if max_workers > 1 else None
+    expires = commands._deadline_expires.get()  # workers are separate threads, so pass the deadline
+    pending = collections.deque()  # (future, rows in chunk)
+    rows_loaded = 0
+
+    def finish_chunks(max_pending):
+        nonlocal rows_loaded
+        while len(pending) > max_pending:
+            future, chunk_rows = pending.popleft()
+            future.result()
+            rows_loaded += chunk_rows
+            if progress: progress(rows_loaded, rows_total)
+
+    try:
+        for data_subset, frame_unmatched_count, frame_unmatched_sample in frames:
+            unmatched_count += frame_unmatched_count
+            unmatched_sample.extend(frame_unmatched_sample[:_UNMATCHED_KEY_SAMPLES - len(unmatched_sample)])
+            if len(data_subset) == 0: continue
+
+            [create_col(x[0]) if x[1] == 'int64' and not x[0] in existing_cols else None for x in
+             data_subset.dtypes.items()]
+            has_new_cols = not existing_cols.issuperset(data_subset.columns)
+            existing_cols.update(data_subset.columns)
+            loaded_cols.update(data_subset.columns)
+
+            for start in range(0, len(data_subset), chunk_size or len(data_subset)):
+                chunk = data_subset.iloc[start:start + chunk_size] if chunk_size else data_subset
+                data_list = _df_to_attr_dict_list(chunk)  # convert DataFrame to dicts that are easy to convert to JSON
+                body = {'key': table_key_column, 'dataKey': data_key_column, 'data': data_list}
+
+                # finally, add the values for whatever columns we have (and create new columns as needed). Cytoscape
+                # creates a column when a call first has values for it, so the first chunk having new columns is sent
+                # alone, after the chunks in flight ... parallel calls would race to create the same columns.
+                if executor is None or (start == 0 and has_new_cols):
+                    finish_chunks(0)
+                    commands.cyrest_put(f'networks/{net_suid}/tables/{tbl}', body=body, require_json=False,
+                                        base_url=base_url)
+                    pending.append((_DONE_FUTURE, len(chunk)))
+                else:
+                    pending.append((executor.submit(commands._cyrest_request, 'PUT', f'networks/{net_suid}/tables/{tbl}',
+                                                    body=body, base_url=base_url, require_json=False, expires=expires,
+                                                    caller='load_table_data'),
+                                    len(chunk)))
+                finish_chunks(max_workers - 1)
+        finish_chunks(0)
+    finally:
+        if executor is not None:
+            for future, chunk_rows in pending: future.cancel()
+            executor.shutdown(wait=True)
+        if not loaded_cols <= known_cols:
+            _invalidate_column_types(table, namespace, net_suid, base_url)  # Cytoscape may have created columns
+        if loaded_cols:
+            _invalidate_table_snapshots(table, namespace, net_suid, base_url, columns=loaded_cols)
+        if 'name' in loaded_cols and table in ['node', 'edge']:
+            from .py4cytoscape_utils import invalidate_name_index
+            invalidate_name_index(table, net_suid, base_url=base_url)
+
+    if not loaded_cols:
+        raise CyError(f'Provided table key column "{table_key_column}" and data key column "{data_key_column}" do not contain any matches, e.g., {unmatched_sample}',
+                      caller='load_table_data')
+
+    res = f'Success: Data loaded in {tbl} table'
+    if diagnostics:
+        return {'message': res, 'rows_loaded': rows_loaded, 'rows_unmatched': unmatched_count,
+                'unmatched_keys': unmatched_sample}
+    return res
+
+
+@cy_log
+def sync_table_data(data, data_key_column='row.names', table='node', table_key_column='name', namespace='default',
+                    network=None, base_url=DEFAULT_BASE_URL, *, refresh=False, chunk_size=None, max_workers=1):
+    """Loads only the values that have changed since the last sync into Cytoscape tables keyed by row.
+
+    This function is for loading the same columns over and over as their values are recomputed, where
+    ``load_table_data`` would send every value each time. It keeps a snapshot of the values last synced for
+    the table, and loads only the rows and columns containing values that differ from the snapshot.
+    The first sync fetches the table key column and the data's columns to make a snapshot, which is fetched again
+    only after py4cytoscape changes the table's keys or the synced columns some other way (e.g., by
+    ``load_table_data`` or ``delete_table_column``). Changes made outside of py4cytoscape (e.g., in the Cytoscape
+    GUI) aren't noticed, so pass ``refresh=True`` after them. Values are stored as for ``load_table_data``.
+
+    Args:
+        data (dataframe): each row is a node and columns contain node attributes
+        data_key_column (str): name of data.frame column to use as key; ' default is "row.names"
+        table (str): name of Cytoscape table to load data into, e.g., node, edge or network; default is "node"
+        table_key_column (str): name of Cytoscape table column to use as key; default is "name"
+        namespace (str): Namespace of table. Default is "default".
+        network (SUID or str or None): Name or SUID of a network. Default is the
+            "current" network active in Cytoscape.
+        base_url (str): Ignore unless you need to specify a custom domain,
+            port or version to connect to the CyREST API. Default is http://127.0.0.1:1234
+            and the latest version of the CyREST API supported by this version of py4cytoscape.
+        refresh (bool): True to fetch a new snapshot even if the last one is still good
+        chunk_size (int or None): most rows sent per call, as for ``load_table_data``
+        max_workers (int): most calls in flight at once, as for ``load_table_data``
+
+    Returns:
+        dict: {'message': 'Success: Data loaded in <table name> table' or 'Success: No changes to <table name> table',
+            'rows_changed': rows loaded, 'columns_changed': names of columns loaded, 'cells_changed': values that
+            differed, 'rows_unchanged': rows not loaded, 'rows_unmatched': rows whose keys weren't in the table,
+            'unmatched_keys': up to 10 of those keys}
+
+    Raises:
+        HTTPError: if table or namespace or table doesn't exist in network
+        CyError: if network name or SUID doesn't exist, or the keys don't match
+        requests.exceptions.RequestException: if can't connect to Cytoscape or Cytoscape returns an error
+
+    Examples:
+        >>> scores = df.DataFrame(data={'id':['YDL194W','YDR277C','YBR043C'], 'score':[0.5, 0.7, 0.1]})
+        >>> sync_table_data(scores, data_key_column='id')
+        {'message': 'Success: Data loaded in defaultnode table', 'rows_changed': 3, 'columns_changed': ['score'], 'cells_changed': 3, 'rows_unchanged': 0, 'rows_unmatched': 0, 'unmatched_keys': []}
+        >>> scores.loc[1, 'score'] = 0.8
+        >>> sync_table_data(scores, data_key_column='id')
+        {'message': 'Success: Data loaded in defaultnode table', 'rows_changed': 1, 'columns_changed': ['score'], 'cells_changed': 1, 'rows_unchanged': 2, 'rows_unmatched': 0, 'unmatched_keys': []}
+    """
+    net_suid = networks.get_network_suid(network, base_url=base_url)
+    tbl = namespace + table  # calculate fully qualified table name
+    if data_key_column == 'row.names':
+        data = data.assign(**{'row.names': data.index})
+    elif not data_key_column in data.columns:
+        raise CyError('Failed to load data. Please check data_key_column.')
+    columns = [col for col in data.columns if col != data_key_column]
+
+    # The snapshot is good until something changes the table's keys or the synced columns, which discards it (see
+    # _invalidate_table_snapshots), so changes elsewhere (e.g., to other tables or columns) don't force a new one
+    snapshots = commands._get_client(base_url).get_cache('table_snapshots')
+    snapshot_key = (net_suid, namespace or 'default', table, table_key_column)
+    snapshot = snapshots.get(snapshot_key)
+    if refresh or snapshot is None or not set(columns) <= set(snapshot['values'].columns):
+        snapshot = _get_table_snapshot(columns, table, table_key_column, namespace, net_suid, base_url)
+        snapshots[snapshot_key] = snapshot
+
+    # Find the values that differ from the snapshot, as they would be sent (e.g., with lists joined into strings)
+    data_subset, unmatched_count, unmatched_sample = _filter_table_data(data, data_key_column, snapshot['keys'],
+                                                                        snapshot['key_strs'], table_key_column)
+    new_values = data_subset.set_index(data_subset[data_key_column].astype(str))[columns]
+    new_values = new_values[~new_values.index.duplicated(keep='last')].astype(object)
+    old_values = snapshot['values'].reindex(index=new_values.index, columns=columns)
+    changed = ~((new_values.values == old_values.values) | (pd.isna(new_values.values) & pd.isna(old_values.values)))
+    changed_rows = changed.any(axis=1)
+    changed_cols = changed.any(axis=0)
+
+    res = {'message': f'Success: No changes to {tbl} table', 'rows_changed': int(changed_rows.sum()),
+           'columns_changed': [col for col, col_changed in zip(columns, changed_cols) if col_changed],
+           'cells_changed': int(changed.sum()), 'rows_unchanged': int(len(changed_rows) - changed_rows.sum()),
+           'rows_unmatched': unmatched_count, 'unmatched_keys': unmatched_sample}
+    if res['cells_changed']:
+        # Loading takes the data key column and the original column types, which decide the column types Cytoscape
+        # creates. The snapshot's keys are still good, so they aren't fetched again.
+        load_data = data_subset.loc[data_subset[data_key_column].astype(str).isin(new_values.index[changed_rows]),
+                                    [data_key_column] + res['columns_changed']]
+        res['message'] = _load_table_data(load_data, data_key_column, table, table_key_column, namespace, net_suid,
+                                          base_url, snapshot['keys'], snapshot['key_strs'], chunk_size=chunk_size,
+                                          max_workers=max_workers)
+
+        # Cytoscape now has the new values, so they're the snapshot from here on ... loading discarded the old one
+        values = snapshot['values']
+        for col in res['columns_changed']:
+            if not col in values.columns: values[col] = pd.Series(np.nan, index=values.index, dtype=object)
+        synced = new_values.index[changed_rows].intersection(values.index)
+        values.loc[synced, res['columns_changed']] = new_values.loc[synced, res['columns_changed']].values
+        snapshots[snapshot_key] = snapshot
+
+    return res
 
-    return f'Success: Data loaded in {tbl} table'
-    # TODO: This is a difficult result to test for ... are we able to change it?
+
+def _get_table_snapshot(columns, table, table_key_column, namespace, net_suid, base_url):
+    # Fetch the table's keys and the values of whichever columns it has, indexed by key ... keys held by more than one
+    # row don't have a single value, so they're left out of the values and always count as changed
+    existing_cols = _get_column_types(table, namespace, net_suid, base_url)
+    fetch_cols = [table_key_column] + [col for col in columns if col in existing_cols and col != table_key_column]
+    table_values = get_table_columns(table=table, columns=fetch_cols, namespace=namespace, network=net_suid,
+                                     base_url=base_url)
+    if not table_key_column in table_values.columns:
+        raise CyError('Failed to load data. Please check table_key_column.', caller='sync_table_data')
+
+    keys = table_values[table_key_column]
+    key_strs = keys.astype(str)
+    values = table_values.set_index(key_strs).astype(object)
+    values = values[~values.index.duplicated(keep=False)].reindex(columns=columns).astype(object)
+    return {'keys': keys, 'key_strs': pd.Index(key_strs).unique(), 'values': values}
+
+
+@cy_log
+def get_table_arrow(table='node', columns=None, namespace='default', network=None, base_url=DEFAULT_BASE_URL, *,
+                    bulk=None):
+    """Retrieve one or more columns of data from node, edge or network tables as an Arrow table.
+
+    Unlike ``get_table_columns``, each column keeps its Cytoscape type: Long columns become int64, Integer columns
+    become int32, Double columns become float64, Boolean columns become bool, String columns become string, and List
+    columns become lists of their element type. Missing values are nulls. The 'SUID' column is always retrieved
+    first, along with specified columns.
+
+    Use ``to_pandas()`` on the result to make a dataframe ... numeric columns without nulls are converted without
+    copying, and ``to_pandas(types_mapper=pd.ArrowDtype)`` keeps every column in Arrow memory.
+
+    This function requires the ``pyarrow`` package (``pip install py4cytoscape[arrow]``).
+
+    Args:
+        table (str): Name of table, e.g., node (default), edge, network
+        columns (str or list or None): Names of columns to retrieve values from as list object or comma-separated list;
+            default is all columns
+        namespace (str): Namespace of table. Default is "default".
+        network (SUID or str or None): Name or SUID of a network. Default is the
+            "current" network active in Cytoscape.
+        base_url (str): Ignore unless you need to specify a custom domain,
+            port or version to connect to the CyREST API. Default is http://127.0.0.1:1234
+            and the latest version of the CyREST API supported by this version of py4cytoscape.
+        bulk (bool or None): True to fetch the whole table in one call; False to fetch each column with its own call;
+            None to fetch the whole table if more than half of its columns are requested
+
+    Returns:
+        pyarrow.Table: requested columns (including SUID), and rows for each node/edge or network
+
+    Raises:
+        HTTPError: if table or namespace doesn't exist in network
+        CyError: if network name or SUID doesn't exist, a column doesn't exist, or pyarrow isn't installed
+        requests.exceptions.RequestException: if can't connect to Cytoscape or Cytoscape returns an error
+
+    Examples:
+        >>> get_table_arrow(columns=['name', 'Degree', 'gal1RGexp'])
+        pyarrow.Table
+        SUID: int64
+        name: string
+        Degree: int32
+        gal1RGexp: double
+        ...
+        >>> get_table_arrow(table='edge').to_pandas()
+              SUID     shared name  ...
+        0    4637  YDR277C (pp) YJR022W  ...
+        ...
+    """
+    _require_pyarrow()
+    suid = networks.get_network_suid(network, base_url)
+
+    # all columns ... handle comma separated lists and list objects
+    if columns is None:
+        col_list = None
+    elif isinstance(columns, str):
+        col_list = [col.strip() for col in columns.split(',')]
+    else:
+        col_list = list(columns)
+
+    # column information, including element types of lists
+    table_col_info = {x['name']: x for x in commands.cyrest_get(f'networks/{suid}/tables/{namespace}{table}/columns',
+                                                                base_url=base_url)}
+    if col_list is None: col_list = list(table_col_info.keys())
+    missing_cols = [col for col in col_list if not col in table_col_info]
+    if missing_cols:
+        raise CyError(f'Columns {missing_cols} not found in "{table}" table')
+    col_list = ['SUID'] + [col for col in col_list if col != 'SUID']
+    if bulk is None: bulk = len(col_list) > len(table_col_info) / 2
+
+    if bulk:
+        # fetch all rows in one call, and then pull each column out of them ... rows leave out missing values
+        rows = commands.cyrest_get_values(f'networks/{suid}/tables/{namespace}{table}', item_path='rows.item',
+                                          base_url=base_url)
+
+    arrays = []
+    for col in col_list:
+        col_info = table_col_info[col]
+        arrow_type = _cytoscape_to_arrow_type(col_info['type'], col_info.get('listType'))
+        if bulk:
+            values = [row.get(col) for row in rows]
+        else:
+            # fetch numeric values straight into a NumPy array, which Arrow takes as it is
+            dtype, missing, pd_dtype = _COLUMN_DTYPES['numpy'].get(col_info['type'], (object, None, None))
+            values = commands.cyrest_get_values(f'networks/{suid}/tables/{namespace}{table}/columns/{col}',
+                                                dtype=dtype, missing=None if dtype == 'int64' else missing,
+                                                base_url=base_url)
+        arrays.append(pa.array(values, type=arrow_type, from_pandas=True))
+
+    return pa.table(arrays, names=col_list)
+
+
+@cy_log
+def load_table_arrow(data, data_key_column='name', table='node', table_key_column='name', namespace='default',
+                     network=None, base_url=DEFAULT_BASE_URL, *, chunk_size=None, max_workers=1, progress=None,
+                     diagnostics=False):
+    """Loads an Arrow table into Cytoscape tables keyed by row.
+
+    This works as ``load_table_data`` does, except that columns that don't exist yet are created with types that
+    match the Arrow types: int64 and uint32 columns become Long, smaller integers become Integer, floating point
+    columns become Double, bool columns become Boolean, string columns become String, and lists of these become
+    Lists. Existing columns keep their types. Nulls are sent as missing values.
+
+    The data can also be an iterator of Arrow record batches or tables (e.g., from
+    ``pyarrow.parquet.ParquetFile.iter_batches()``), which are converted to dataframes one at a time.
+
+    This function requires the ``pyarrow`` package (``pip install py4cytoscape[arrow]``).
+
+    Args:
+        data (pyarrow.Table or iterator): each row is a node and columns contain node attributes ... or an iterator
+            of record batches or tables, all having the same schema
+        data_key_column (str): name of data column to use as key; default is "name"
+        table (str): name of Cytoscape table to load data into, e.g., node, edge or network; default is "node"
+        table_key_column (str): name of Cytoscape table column to use as key; default is "name"
+        namespace (str): Namespace of table. Default is "default".
+        network (SUID or str or None): Name or SUID of a network. Default is the
+            "current" network active in Cytoscape.
+        base_url (str): Ignore unless you need to specify a custom domain,
+            port or version to connect to the CyREST API. Default is http://127.0.0.1:1234
+            and the latest version of the CyREST API supported by this version of py4cytoscape.
+        chunk_size (int or None): most rows sent per call, as for ``load_table_data``
+        max_workers (int): most calls in flight at once, as for ``load_table_data``
+        progress (func or None): called as for ``load_table_data``
+        diagnostics (bool): True to return a dict describing the load, as for ``load_table_data``
+
+    Returns:
+        str: 'Success: Data loaded in <table name> table' ... or if diagnostics is True, a dict as for
+            ``load_table_data``
+
+    Raises:
+        HTTPError: if table or namespace or table doesn't exist in network
+        CyError: if network name or SUID doesn't exist, the keys don't match, a column has a type or values
+            Cytoscape can't store, or pyarrow isn't installed
+        requests.exceptions.RequestException: if can't connect to Cytoscape or Cytoscape returns an error
+
+    Examples:
+        >>> data = pa.table({'name': ['YDL194W', 'YDR277C'], 'hits': pa.array([1, 2], type=pa.int64())})
+        >>> load_table_arrow(data)
+        'Success: Data loaded in defaultnode table'
+        >>> load_table_arrow(pq.ParquetFile('scores.parquet').iter_batches(), data_key_column='id', chunk_size=100000)
+        'Success: Data loaded in defaultnode table'
+    """
+    _require_pyarrow()
+    net_suid = networks.get_network_suid(network, base_url=base_url)
+
+    if isinstance(data, (pa.Table, pa.RecordBatch)):
+        schema = data.schema
+        frames = _arrow_to_pandas(data)
+    else:
+        batches = iter(data)
+        first_batch = next(batches, None)
+        if first_batch is None:
+            raise CyError('Failed to load data. There are no record batches.')
+        schema = first_batch.schema
+        frames = (_arrow_to_pandas(batch) for batch in _chain_first(first_batch, batches))
+
+    # Create the columns Cytoscape doesn't have yet, with types matching the Arrow types, so load_table_data doesn't
+    # decide them from the dataframe's dtypes
+    tbl = namespace + table
+    existing_cols = _get_column_types(table, namespace, net_suid, base_url, columns=schema.names)
+    new_cols = [(field.name, _arrow_to_cytoscape_type(field)) for field in schema if not field.name in existing_cols]
+    for col_name, (col_type, is_list) in new_cols:
+        commands.cyrest_post(f'networks/{net_suid}/tables/{tbl}/columns',
+                             body={'name': col_name, 'type': col_type, 'list': is_list}, require_json=False,
+                             base_url=base_url)
+    if new_cols:
+        _invalidate_column_types(table, namespace, net_suid, base_url)
+
+    return load_table_data(frames, data_key_column=data_key_column, table=table, table_key_column=table_key_column,
+                           namespace=namespace, network=net_suid, base_url=base_url, chunk_size=chunk_size,
+                           max_workers=max_workers, progress=progress, diagnostics=diagnostics)
+
+
+@cy_log
+def export_table_parquet(filename, table='node', columns=None, namespace='default', network=None,
+                         base_url=DEFAULT_BASE_URL, *, overwrite_file=True):
+    """Saves node, edge or network table columns to a file in Parquet format.
+
+    The columns are fetched by ``get_table_arrow``, so they keep their Cytoscape types. If a sandbox is in use (e.g.,
+    for Notebook or remote execution), the file is written to the sandbox.
+
+    This function requires the ``pyarrow`` package (``pip install py4cytoscape[arrow]``).
+
+    Args:
+        filename (str): Full path or path relative to current working directory (or the sandbox), in addition to the
+            name of the file. Extension ".parquet" is added if it isn't already there.
+        table (str): Name of table, e.g., node (default), edge, network
+        columns (str or list or None): Names of columns to save as list object or comma-separated list; default is
+            all columns
+        namespace (str): Namespace of table. Default is "default".
+        network (SUID or str or None): Name or SUID of a network. Default is the
+            "current" network active in Cytoscape.
+        base_url (str): Ignore unless you need to specify a custom domain,
+            port or version to connect to the CyREST API. Default is http://127.0.0.1:1234
+            and the latest version of the CyREST API supported by this version of py4cytoscape.
+        overwrite_file (bool): False allows an error to be generated if the file already exists;
+            True allows it to be overwritten
+
+    Returns:
+        dict: {'file': <absolute path of file written>, 'rows': <rows written>, 'columns': <names of columns written>}
+
+    Raises:
+        HTTPError: if table or namespace doesn't exist in network
+        CyError: if network name or SUID doesn't exist, a column doesn't exist, the file exists and overwrite_file is
+            False, or pyarrow isn't installed
+        requests.exceptions.RequestException: if can't connect to Cytoscape or Cytoscape returns an error
+
+    Examples:
+        >>> export_table_parquet('galFiltered nodes')
+        {'file': 'C:\\Users\\CyDeveloper\\galFiltered nodes.parquet', 'rows': 330, 'columns': ['SUID', 'shared name', ...]}
+        >>> export_table_parquet('edge weights.parquet', table='edge', columns='name, weight', overwrite_file=False)
+        {'file': 'C:\\Users\\CyDeveloper\\edge weights.parquet', 'rows': 359, 'columns': ['SUID', 'name', 'weight']}
+    """
+    _require_pyarrow()
+    if not filename.endswith('.parquet'): filename += '.parquet'
+    arrow_table = get_table_arrow(table=table, columns=columns, namespace=namespace, network=network,
+                                  base_url=base_url)
+
+    if get_current_sandbox()[0]:
+        # Write the file locally, and then send it to the sandbox
+        local_file = _temp_file_name('.parquet')
+        try:
+            pq.write_table(arrow_table, local_file)
+            res = sandbox.sandbox_send_to(local_file, filename, overwrite=overwrite_file, base_url=base_url)
+        finally:
+            os.remove(local_file)
+        file = res['filePath']
+    else:
+        file = get_abs_sandbox_path(filename)
+        if os.path.exists(file) and not overwrite_file:
+            raise CyError(f'File "{file}" already exists ... table not saved.')
+        pq.write_table(arrow_table, file)
+
+    return {'file': file, 'rows': arrow_table.num_rows, 'columns': arrow_table.column_names}
+
+
+@cy_log
+def load_table_parquet(filename, data_key_column='name', table='node', table_key_column='name', namespace='default',
+                       network=None, base_url=DEFAULT_BASE_URL, *, columns=None, chunk_size=None, max_workers=1,
+                       progress=None, diagnostics=False):
+    """Loads a Parquet file into Cytoscape tables keyed by row.
+
+    The file is loaded by ``load_table_arrow``, so new columns are created with types matching the file's. If a
+    sandbox is in use (e.g., for Notebook or remote execution), the file is read from the sandbox. If ``chunk_size``
+    is given, the file is read a chunk at a time, so it needn't fit in memory all at once.
+
+    This function requires the ``pyarrow`` package (``pip install py4cytoscape[arrow]``).
+
+    Args:
+        filename (str): Full path or path relative to current working directory (or the sandbox), in addition to the
+            name of the file
+        data_key_column (str): name of file column to use as key; default is "name"
+        table (str): name of Cytoscape table to load data into, e.g., node, edge or network; default is "node"
+        table_key_column (str): name of Cytoscape table column to use as key; default is "name"
+        namespace (str): Namespace of table. Default is "default".
+        network (SUID or str or None): Name or SUID of a network. Default is the
+            "current" network active in Cytoscape.
+        base_url (str): Ignore unless you need to specify a custom domain,
+            port or version to connect to the CyREST API. Default is http://127.0.0.1:1234
+            and the latest version of the CyREST API supported by this version of py4cytoscape.
+        columns (list or None): names of file columns to load, which must include data_key_column; default is all
+        chunk_size (int or None): most rows read and sent at a time; None reads the whole file and sends it in one call
+        max_workers (int): most calls in flight at once, as for ``load_table_data``
+        progress (func or None): called as for ``load_table_data``
+        diagnostics (bool): True to return a dict describing the load, as for ``load_table_data``
+
+    Returns:
+        str: 'Success: Data loaded in <table name> table' ... or if diagnostics is True, a dict as for
+            ``load_table_data``
+
+    Raises:
+        HTTPError: if table or namespace or table doesn't exist in network
+        CyError: if network name or SUID doesn't exist, the file can't be read, the keys don't match, a column has a
+            type or values Cytoscape can't store, or pyarrow isn't installed
+        requests.exceptions.RequestException: if can't connect to Cytoscape or Cytoscape returns an error
+
+    Examples:
+        >>> load_table_parquet('galFiltered nodes.parquet')
+        'Success: Data loaded in defaultnode table'
+        >>> load_table_parquet('scores.parquet', data_key_column='id', columns=['id', 'score'], chunk_size=100000)
+        'Success: Data loaded in defaultnode table'
+    """
+    _require_pyarrow()
+    local_file = None
+    try:
+        # Nothing has been sent to Cytoscape yet, so make sure the sandbox is set up before deciding where the file is
+        if commands.do_initialize_sandbox(base_url=base_url)[0]:
+            # Fetch a copy of the file from the sandbox
+            local_file = _temp_file_name('.parquet')
+            sandbox.sandbox_get_from(filename, local_file, base_url=base_url)
+            file = local_file
+        else:
+            file = get_abs_sandbox_path(filename)
+
+        try:
+            parquet_file = pq.ParquetFile(file)
+        except (OSError, pa.ArrowException) as e:
+            raise CyError(f'Could not read Parquet file "{filename}": {e}')
+        if chunk_size:
+            data = parquet_file.iter_batches(batch_size=chunk_size, columns=columns)
+        else:
+            data = parquet_file.read(columns=columns)
+
+        return load_table_arrow(data, data_key_column=data_key_column, table=table, table_key_column=table_key_column,
+                                namespace=namespace, network=network, base_url=base_url, chunk_size=chunk_size,
+                                max_workers=max_workers, progress=progress, diagnostics=diagnostics)
+    finally:
+        if local_file: os.remove(local_file)
 
 
 @cy_log
@@ -551,12 +1084,13 @@ def map_table_column(column, species, map_from, map_to, force_single=True, table
 
     fs = 'true' if force_single else 'false'
 
-    all_cols = get_table_column_names(table, namespace, network, base_url=base_url)
+    all_cols = _get_column_types(table, namespace, net_suid, base_url, columns=[column])
     if not column in all_cols: raise CyError(f'Column "{column}" does not exist')
 
     res_map = commands.commands_post(
         f'idmapper map column columnName="{column}" forceSingle="{fs}" mapFrom="{map_from}" mapTo="{map_to}" species="{species}" table="{tbl}"',
         base_url=base_url)
+    _invalidate_column_types(table, namespace, net_suid, base_url)
     if res_map['new column'] == 'null ': raise CyError('No mappings returned')
     # TODO: Do we really mean to throw this result away?? R does ... if the 'new column' value returns null, something went wrong ... I added check
 
@@ -599,28 +1133,175 @@ def rename_table_column(column, new_name, table='node', namespace='default', net
     res = commands.cyrest_put(f'networks/{net_suid}/tables/{namespace}{table}/columns',
                               body={'oldName': column, 'newName': new_name},
                               base_url=base_url, require_json=False)
+    _invalidate_column_types(table, namespace, net_suid, base_url)
+    _invalidate_table_snapshots(table, namespace, net_suid, base_url, columns=[column])
     return res
 
 
-# TODO: Check to see if this is needed in RCy3
-def _nan_to_none(original_df, attr_dict_list):
-    # convert missing numbers from 'nan' to None, which will cause the JSON converter to properly emit null
-    # First, determine whether any floating point values are missing
-    if original_df.isnull().any().any():
-        # yes ... find out which rows contain null values
-        data_subset_nans = original_df.isnull()  # map out missing floating point in all cells
-        data_subset_nans_indexes = [True in set(data_subset_nans.loc[i, :]) for i in
-                                    data_subset_nans.index]  # find rows containing missing floating point
-        for has_missing, row_contents in zip(data_subset_nans_indexes, attr_dict_list):
-            # for each row in data_list, if it has missing values, find them and replace them with 'None'
-            # Note that this could not have been done with data_subset because it's a DataFrame, which only outputs 'nan'
-            if has_missing:
-                for key, value in row_contents.items():
-                    if type(value) is float and np.isnan(value): row_contents[key] = None
-    return attr_dict_list
+def _filter_table_data(data, data_key_column, table_keys, table_key_strs, table_key_column, require_match=True):
+    # Return the rows of data whose keys are in the Cytoscape table, ready to be sent to Cytoscape, along with the number
+    # of rows whose keys aren't in the table and a sample of those keys
+    if data_key_column == 'row.names':
+        data['row.names'] = data.index
+
+    if not data_key_column in data.columns:
+        raise CyError('Failed to load data. Please check data_key_column.', caller='load_table_data')
+
+    # find the keys that are in the Cytoscape table ... integer keys can be matched directly, but anything else is
+    # matched as a string, as Cytoscape would show it
+    keys = data[data_key_column]
+    if pd.api.types.is_integer_dtype(keys.dtype) and pd.api.types.is_integer_dtype(table_keys.dtype):
+        matched = keys.isin(table_keys).values
+    elif pd.api.types.infer_dtype(keys, skipna=False) == 'string':
+        matched = table_key_strs.get_indexer(keys) >= 0
+    else:
+        matched = table_key_strs.get_indexer(keys.astype(str)) >= 0
+    unmatched_count = len(matched) - int(matched.sum())
+    unmatched_sample = keys.iloc[np.flatnonzero(~matched)[:_UNMATCHED_KEY_SAMPLES]].tolist()
 
+    # verify that there is at least one key in the Cytoscape table that matches a key in the data
+    if require_match and unmatched_count == len(matched):
+        raise CyError(f'Provided table key column "{table_key_column}" and data key column "{data_key_column}" do not contain any matches, e.g., {unmatched_sample}',
+                      caller='load_table_data')
+
+    # create table containing columns present in data and already present in Cytoscape table
+    data_subset = data[matched] if unmatched_count else data
+
+    # look for elements that are lists (instead of scalars) and turn them into comma-separated strings.
+    # Note that CyREST doesn't accept lists or create columns of type list, but comma-separated strings is
+    # the best we can do for the user at this time. Only object columns can hold lists.
+    for col in data_subset.columns:
+        values = data_subset[col].values
+        if not pd.api.types.is_object_dtype(values.dtype) or \
+                pd.api.types.infer_dtype(values, skipna=False) in _SCALAR_INFERRED_DTYPES: continue
+        is_list = np.fromiter((isinstance(val, list) for val in values), dtype=bool, count=len(values))
+        if is_list.any():
+            values = values.copy()
+            values[is_list] = [','.join(val) for val in values[is_list]]
+            data_subset = data_subset.assign(**{col: values})  # leaves the caller's dataframe as it was
+
+    # TODO: Find out whether "factors" are an issue in Python, and why factors could be troublesome in R
+    # TODO: Verify that this gives the right answer for list of str, int, etc
+    return data_subset, unmatched_count, unmatched_sample
+
+_SCALAR_INFERRED_DTYPES = {'string', 'bytes', 'integer', 'floating', 'mixed-integer-float', 'boolean', 'empty'}  # no lists
+_UNMATCHED_KEY_SAMPLES = 10  # most unmatched keys reported by load_table_data
+
+def _require_pyarrow():
+    if pa is None:
+        raise CyError('This function requires the pyarrow package ... pip install py4cytoscape[arrow]')
+
+# Cytoscape column types and the Arrow types that hold them, made on first use because pyarrow is optional
+_ARROW_TYPES = {'Long': lambda: pa.int64(), 'Integer': lambda: pa.int32(), 'Double': lambda: pa.float64(),
+                'Boolean': lambda: pa.bool_(), 'String': lambda: pa.string()}
+
+def _cytoscape_to_arrow_type(col_type, list_type=None):
+    # Return the Arrow type for a Cytoscape column type ... CyREST gives list element types as listType
+    if col_type == 'List':
+        return pa.list_(_ARROW_TYPES.get(list_type, _ARROW_TYPES['String'])())
+    return _ARROW_TYPES.get(col_type, _ARROW_TYPES['String'])()
+
+def _arrow_to_cytoscape_type(field):
+    # Return (Cytoscape column type, is list) for an Arrow field, or raise CyError if Cytoscape can't store it
+    arrow_type, is_list = field.type, False
+    if pa.types.is_list(arrow_type) or pa.types.is_large_list(arrow_type):
+        arrow_type, is_list = arrow_type.value_type, True
+    if pa.types.is_dictionary(arrow_type):
+        arrow_type = arrow_type.value_type
+    if pa.types.is_int64(arrow_type) or pa.types.is_uint32(arrow_type) or pa.types.is_uint64(arrow_type):
+        return 'Long', is_list
+    if pa.types.is_integer(arrow_type):
+        return 'Integer', is_list
+    if pa.types.is_floating(arrow_type):
+        return 'Double', is_list
+    if pa.types.is_boolean(arrow_type):
+        return 'Boolean', is_list
+    if pa.types.is_string(arrow_type) or pa.types.is_large_string(arrow_type):
+        return 'String', is_list
+    raise CyError(f'Column "{field.name}" has type {field.type}, which Cytoscape tables cannot hold',
+                  caller='load_table_arrow')
+
+def _arrow_to_pandas(data):
+    # Convert an Arrow table or record batch to a dataframe one column at a time, so numeric columns without nulls
+    # are converted without copying, and integer and boolean columns with nulls keep their type (as Int64 or boolean)
+    # instead of becoming floats or objects
+    columns = {}
+    for name, column in zip(data.schema.names, data.columns):
+        _check_long_range(name, column)
+        if column.null_count and (pa.types.is_integer(column.type) or pa.types.is_boolean(column.type)):
+            columns[name] = column.to_pandas(types_mapper={pa.bool_(): pd.BooleanDtype()}.get
+                                             if pa.types.is_boolean(column.type) else lambda t: pd.Int64Dtype())
+        else:
+            columns[name] = column.to_pandas()
+    return pd.DataFrame(columns)
+
+def _check_long_range(name, column):
+    # Raise CyError if an unsigned 64-bit column (or list column) has values too large for a Cytoscape Long
+    values = column
+    if pa.types.is_list(values.type) or pa.types.is_large_list(values.type):
+        values = pc.list_flatten(values)
+    if pa.types.is_uint64(values.type) and (pc.max(values).as_py() or 0) > np.iinfo(np.int64).max:
+        raise CyError(f'Column "{name}" has values above {np.iinfo(np.int64).max}, which Cytoscape Long columns '
+                      f'cannot hold', caller='load_table_arrow')
+
+def _chain_first(first, rest):
+    # Yield first, and then everything in rest
+    yield first
+    yield from rest
+
+def _temp_file_name(suffix):
+    # Return the name of a new, empty temporary file
+    handle, file_name = tempfile.mkstemp(suffix=suffix)
+    os.close(handle)
+    return file_name
+
+_DONE_FUTURE = concurrent.futures.Future()  # stands in for a chunk that was sent without a worker
+_DONE_FUTURE.set_result(None)
 
 def _df_to_attr_dict_list(df):
     # convert whole data table to dictionary suitable for JSON encoding
-    data_list = df.to_dict(orient='records')
-    return _nan_to_none(df, data_list)
+    # Note that missing values (NaN) stay in the dictionary ... the JSON serializer sends them as null
+    return df.to_dict(orient='records')
+
+# For each dtype_backend, {Cytoscape column type: (NumPy dtype to fetch into, value for missing, final pandas dtype
+# or None to keep the NumPy dtype)}. Types not listed (e.g., String, List) are fetched as objects.
+#
+# The R version of get_table_columns replaces missing values with the constant NA, which doesn't exist in NumPy.
+# Pandas authority discusses this situation, but doesn't make a clear recommendation, so for NumPy dtypes we leave
+# None as None for non-numerics and nan for numerics. The pandas nullable dtypes use pd.NA throughout.
+# https://pandas.pydata.org/pandas-docs/stable/user_guide/missing_data.html
+_COLUMN_DTYPES = {
+    'numpy': {'Double': ('float64', np.nan, None),
+              'Long': ('int64', np.nan, None),  # becomes an object column if any value is missing
+              'Integer': ('int64', np.nan, None)},
+    'numpy_nullable': {'Double': ('float64', np.nan, 'Float64'),
+                       'Long': ('int64', None, 'Int64'),
+                       'Integer': ('int64', None, 'Int64'),
+                       'Boolean': ('bool', None, 'boolean'),
+                       'String': (object, None, 'string')},
+}
+
+def _get_column_types(table, namespace, net_suid, base_url, columns=None, refresh=False):
+    # Return {column name: type} for a table, cached for NETWORK_CACHE_SECS because mappings, filters and table reads
+    # all need it. The table is fetched again if refresh or if any of columns is missing, as the column may have been
+    # created since (e.g., by a command) ... so only deleted and renamed columns can be stale.
+    cache = commands._get_client(base_url).get_cache('columns', py4cytoscape_tuning.NETWORK_CACHE_SECS)
+    key = (net_suid, namespace or 'default', table)
+    col_types = None if refresh else cache.get(key)
+    if col_types is None or (columns is not None and not all(col in col_types for col in columns)):
+        res = commands.cyrest_get(f'networks/{net_suid}/tables/{namespace}{table}/columns', base_url=base_url)
+        col_types = cache[key] = {x['name']: x['type'] for x in res}
+    return col_types
+
+def _invalidate_column_types(table, namespace, net_suid, base_url):
+    # Call after any operation that creates, deletes or renames columns
+    commands._get_client(base_url).get_cache('columns').pop((net_suid, namespace or 'default', table), None)
+
+def _invalidate_table_snapshots(table, namespace, net_suid, base_url, columns=None):
+    # Discard sync_table_data's snapshots of a table that hold any of the columns (or all of its snapshots if columns
+    # is None). Call after any operation that changes the table's values or keys.
+    snapshots = commands._get_client(base_url).get_cache('table_snapshots')
+    for key in [key for key in snapshots if key[:3] == (net_suid, namespace or 'default', table)]:
+        if columns is None or key[3] in columns or \
+                not snapshots[key]['values'].columns.intersection(list(columns)).empty:
+            del snapshots[key]
@@ -24,6 +24,7 @@ import sys
 
 # Internal module imports
 from . import commands
+from . import networks
 
 # Internal module convenience imports
 from .exceptions import CyError
@@ -442,5 +443,6 @@ def merge_networks(sources=None,
         cmd_string += f' networkMergeMap="{",".join(record_list)}"'
 
     res = commands.commands_post(cmd_string, base_url=base_url)
+    networks._clear_network_cache(base_url)
 
     return res['SUID'] if 'SUID' in res else res
@@ -33,6 +33,12 @@ setuptools.setup(
         'chardet',
         'decorator'
     ],
+    extras_require={
+        'aio': ['aiohttp'],
+        'stream': ['ijson'],
+        'fast': ['orjson'],
+        'arrow': ['pyarrow']
+    },
     classifiers=[
         'Intended Audience :: Science/Research',
         'Intended Audience :: Developers',
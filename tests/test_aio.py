@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+
+""" Test functions in aio.py.
+"""
+
+"""License:
+    Copyright 2020 The Cytoscape Consortium
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+    documentation files (the "Software"), to deal in the Software without restriction, including without limitation
+    the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+    and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all copies or substantial portions
+    of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+    WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
+    OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+    OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+
+import unittest
+import asyncio
+import time
+from requests import RequestException
+
+from test_utils import *
+import py4cytoscape.aio as cyaio
+
+
+class AioTests(unittest.TestCase):
+    def setUp(self):
+        try:
+            close_session(False)
+        except:
+            pass
+
+    def tearDown(self):
+        pass
+
+    @print_entry_exit
+    def test_cyrest_get(self):
+        async def run():
+            try:
+                # Verify that many requests can be in flight at once and that results come back in order
+                res = await asyncio.gather(*[cyaio.cyrest_get(f'networks/{net_suid}/nodes/{suid}') for suid in node_suids])
+                self.assertListEqual([node['SUID'] for node in res], node_suids)
+
+                # Verify that a non-JSON result is returned when allowed, and rejected when not
+                self.assertEqual(await cyaio.cyrest_get('gc', require_json=False), '')
+                with self.assertRaises(ValueError):
+                    await cyaio.cyrest_get('gc')
+
+                # Verify that errors are reported the same way the synchronous functions report them
+                with self.assertRaises(CyError):
+                    await cyaio.cyrest_get(f'networks/{net_suid}/nodes/0')
+                with self.assertRaises(RequestException):
+                    await cyaio.cyrest_get('version', base_url='http://totallybogus')
+            finally:
+                await cyaio.close_sessions()
+
+        load_test_session()
+        net_suid = get_network_suid()
+        node_suids = list(get_table_columns('node', ['name']).index)
+        asyncio.run(run())
+
+    @print_entry_exit
+    def test_cyrest_post_put_delete(self):
+        async def run():
+            try:
+                # Verify that a view can be deleted, then created, then made current
+                self.assertEqual(await cyaio.cyrest_delete(f'networks/{net_suid}/views', require_json=False), '')
+                res = await cyaio.cyrest_post(f'networks/{net_suid}/views')
+                self.assertIn('networkViewSUID', res)
+                res = await cyaio.cyrest_put('networks/views/currentNetworkView', body={'networkViewSUID': res['networkViewSUID']})
+                self.assertDictEqual(res, {'data': {}, 'errors': []})
+            finally:
+                await cyaio.close_sessions()
+
+        load_test_session()
+        net_suid = get_network_suid()
+        asyncio.run(run())
+
+    @print_entry_exit
+    def test_commands_post(self):
+        async def run():
+            try:
+                res = await asyncio.gather(*[cyaio.commands_post(f'command echo message="{i}"') for i in range(20)])
+                self.assertListEqual(res, [[str(i)] for i in range(20)])
+                with self.assertRaises(CyError):
+                    await cyaio.commands_post('apps status app="bogusjunk"')
+            finally:
+                self.assertListEqual(await cyaio.close_sessions(), [DEFAULT_BASE_URL])
+
+        asyncio.run(run())
+
+    @print_entry_exit
+    def test_request_timeout(self):
+        async def run():
+            try:
+                # Verify that a per-call timeout interrupts a long command, as for the synchronous functions
+                with self.assertRaises(CyTimeoutError):
+                    await cyaio.commands_post('command sleep duration=3', timeout=1)
+                self.assertDictEqual(await cyaio.commands_post('command sleep duration=1', timeout=(5, 5)), {})
+
+                # Verify that a global timeout applies to calls that don't have their own
+                orig_timeout = set_request_timeout(5, 1)
+                try:
+                    with self.assertRaises(CyTimeoutError):
+                        await cyaio.cyrest_post('commands/command/sleep', body={'duration': 3})
+                    self.assertDictEqual(await cyaio.cyrest_post('commands/command/sleep', body={'duration': 2},
+                                                                 timeout=10), {'data': {}, 'errors': []})
+                finally:
+                    set_request_timeout(*orig_timeout)
+            finally:
+                await cyaio.close_sessions()
+
+        asyncio.run(run())
+
+        async def sleeps(count):
+            try:
+                return await asyncio.gather(*[cyaio.commands_post('command sleep duration=3') for i in range(count)])
+            finally:
+                await cyaio.close_sessions()
+
+        # Verify that a deadline set around the event loop limits all calls, and that a passed deadline fails at once
+        start = time.perf_counter()
+        with self.assertRaises(CyTimeoutError):
+            with deadline(1):
+                asyncio.run(sleeps(3))
+        self.assertLess(time.perf_counter() - start, 3)
+        with deadline(0.5):
+            time.sleep(1)
+            self.assertRaises(CyTimeoutError, asyncio.run, sleeps(1))
+
+        async def sleep_within(deadline_secs, duration):
+            with deadline(deadline_secs):
+                return await cyaio.commands_post(f'command sleep duration={duration}')
+
+        async def concurrent_sleeps():
+            try:
+                return await asyncio.gather(sleep_within(1, 3), sleep_within(10, 2), return_exceptions=True)
+            finally:
+                await cyaio.close_sessions()
+
+        # Verify that concurrent tasks each keep their own deadline
+        short_res, long_res = asyncio.run(concurrent_sleeps())
+        self.assertIsInstance(short_res, CyTimeoutError)
+        self.assertDictEqual(long_res, {})
+
+    @print_entry_exit
+    def test_set_connection_limit(self):
+        orig_limit = cyaio.set_connection_limit(5)
+        self.assertEqual(cyaio.set_connection_limit(orig_limit), 5)
+        self.assertRaises(CyError, cyaio.set_connection_limit, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
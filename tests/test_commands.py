@@ -22,6 +22,8 @@
 
 import unittest
 import json
+import time
+import numpy as np
 from requests import RequestException
 
 from test_utils import *
@@ -337,6 +339,257 @@ class CommandsTests(unittest.TestCase):
                   'http://127.0.0.1:1234/v1/commands/layout/force-directed',
                   {'defaultNodeMass': '1', 'file': 'C:\\file name'})
 
+    @print_entry_exit
+    def test_cyrest_batch(self):
+        # Initialization
+        load_test_session()
+        net_suid = get_network_suid()
+        node_suids = list(get_table_columns('node', ['name']).index)
+
+        # Verify that results come back in the order requested
+        res = cyrest_batch([('GET', f'networks/{net_suid}/nodes/{suid}') for suid in node_suids])
+        self.assertListEqual([node['SUID'] for node in res], node_suids)
+        res = cyrest_batch([('GET', 'gc'), ('POST', 'commands/command/echo', None, {'message': 'Hi there'})],
+                           require_json=False, max_workers=1)
+        self.assertEqual(res[0], '')
+        self.assertDictEqual(res[1], {'data': ['Hi there'], 'errors': []})
+        self.assertListEqual(cyrest_batch([]), [])
+
+        # Verify that errors are either raised or returned in place
+        self.assertRaises(CyError, cyrest_batch, [('GET', 'version'), ('GET', f'networks/{net_suid}/nodes/0')])
+        res = cyrest_batch([('GET', 'version'), ('GET', f'networks/{net_suid}/nodes/0')], return_errors=True)
+        self.assertIn('cytoscapeVersion', res[0])
+        self.assertIsInstance(res[1], CyError)
+        self.assertRaises(CyError, cyrest_batch, [('FETCH', 'version')])
+
+        # Verify that concurrency can be set
+        orig_max_workers = set_batch_concurrency(2)
+        self.assertEqual(set_batch_concurrency(orig_max_workers), 2)
+        self.assertRaises(CyError, set_batch_concurrency, 0)
+
+    @print_entry_exit
+    def test_cyrest_get_values(self):
+        # Initialization
+        load_test_session()
+        net_suid = get_network_suid()
+        df = get_table_columns('node', ['gal1RGexp', 'Degree'])
+
+        # Verify that columns come back as arrays of the requested type, whether or not the count is right
+        res = cyrest_get_values(f'networks/{net_suid}/tables/defaultnode/columns/SUID', dtype='int64')
+        self.assertEqual(res.dtype, np.int64)
+        self.assertListEqual(list(res), list(df.index))
+        res = cyrest_get_values(f'networks/{net_suid}/tables/defaultnode/columns/gal1RGexp', dtype='float64',
+                                count=3, missing=np.nan)
+        self.assertEqual(len(res), len(df.index))
+        self.assertListEqual(list(res), list(df['gal1RGexp']))
+        res = cyrest_get_values(f'networks/{net_suid}/tables/defaultnode/columns/Degree', dtype='int64',
+                                count=len(df.index))
+        self.assertListEqual(list(res), list(df['Degree']))
+
+        # Verify that a bad item path returns nothing, and that a bad column or non-JSON result is caught
+        res = cyrest_get_values(f'networks/{net_suid}/tables/defaultnode/columns/SUID', item_path='bogus.item')
+        self.assertEqual(len(res), 0)
+        self.assertRaises(ValueError, cyrest_get_values, 'gc')
+        self.assertRaises(CyError, cyrest_get_values, f'networks/{net_suid}/tables/defaultnode/columns/bogus')
+
+    @print_entry_exit
+    def test_retry_policy(self):
+        # Verify that calls aren't retried by default
+        self.assertEqual(get_retry_policy().max_attempts, 1)
+
+        # Verify that a failed connection is retried with the expected backoff before the error is raised
+        policy = RetryPolicy(max_attempts=3, backoff_base=0.2, backoff_cap=0.3, jitter=False)
+        self.assertEqual(policy.backoff(1), 0.2)
+        self.assertEqual(policy.backoff(2), 0.3)
+        start = time.perf_counter()
+        self.assertRaises(RequestException, cyrest_get, 'version', base_url='http://127.0.0.1:1/v1', retry_policy=policy)
+        self.assertGreaterEqual(time.perf_counter() - start, 0.5)
+
+        # Verify that POSTs are retried only when marked safe
+        self.assertFalse(policy.can_retry('POST', 1))
+        self.assertTrue(policy.can_retry('GET', 1))
+        self.assertFalse(policy.can_retry('GET', 3))
+        self.assertTrue(RetryPolicy(retry_post=True).can_retry('POST', 1))
+        start = time.perf_counter()
+        self.assertRaises(RequestException, cyrest_post, 'networks', base_url='http://127.0.0.1:1/v1', retry_policy=policy)
+        self.assertLess(time.perf_counter() - start, 0.2)
+
+        # Verify that a global policy applies to calls that don't have their own, and that calls still succeed
+        orig_policy = set_retry_policy(policy)
+        self.assertIs(get_retry_policy(), policy)
+        self.assertIn('cytoscapeVersion', cyrest_get('version'))
+        self.assertIs(set_retry_policy(orig_policy), policy)
+
+        # Verify that bad policies are caught
+        self.assertRaises(CyError, RetryPolicy, max_attempts=0)
+        self.assertRaises(CyError, RetryPolicy, backoff_base=-1)
+        self.assertRaises(CyError, set_retry_policy, 3)
+
+    @print_entry_exit
+    def test_request_timeout(self):
+        # Verify that calls wait forever by default, and that a per-call timeout interrupts a long command
+        self.assertTupleEqual(get_request_timeout(), (None, None))
+        self.assertRaises(CyTimeoutError, commands_post, 'command sleep duration=3', timeout=1)
+        self.assertDictEqual(commands_post('command sleep duration=1', timeout=(5, 5)), {})
+
+        # Verify that a global timeout applies to calls that don't have their own
+        orig_timeout = set_request_timeout(5, 1)
+        self.assertTupleEqual(get_request_timeout(), (5, 1))
+        self.assertRaises(CyTimeoutError, commands_get, 'command sleep duration=3')
+        self.assertListEqual(commands_get('command sleep duration=3', timeout=10), [])
+        self.assertTupleEqual(set_request_timeout(*orig_timeout), (5, 1))
+        self.assertRaises(CyError, set_request_timeout, 0)
+
+    @print_entry_exit
+    def test_deadline(self):
+        # Verify that a deadline covers all calls made in its block, and that a timeout is still a CyError
+        start = time.perf_counter()
+        with self.assertRaises(CyError):
+            with deadline(2):
+                commands_post('command sleep duration=1')
+                commands_post('command sleep duration=3')
+        self.assertLess(time.perf_counter() - start, 3)
+
+        # Verify that the earlier of two nested deadlines wins, and that a passed deadline fails immediately without
+        # starting a new read cache generation, since nothing was sent
+        with deadline(30):
+            with deadline(0.5):
+                time.sleep(1)
+                self.assertRaises(CyTimeoutError, cyrest_get, 'version')
+                generation = get_read_cache_info()['generation']
+                self.assertRaises(CyTimeoutError, commands_post, 'command echo message="hi"')
+                self.assertEqual(get_read_cache_info()['generation'], generation)
+            self.assertIn('cytoscapeVersion', cyrest_get('version'))
+
+        # Verify that cyrest_batch workers honor the caller's deadline
+        with deadline(1):
+            self.assertRaises(CyTimeoutError, cyrest_batch,
+                              [('POST', 'commands/command/sleep', None, {'duration': 3})] * 2)
+        self.assertRaises(CyError, deadline('bogus').__enter__)
+
+    @print_entry_exit
+    def test_json_serializer(self):
+        # Verify that NaN and NumPy values in a body are sent as JSON without any preparation
+        load_test_session()
+        net_suid = get_network_suid()
+        node_suids = list(get_table_columns('node', ['name']).index)
+        body = {'key': 'SUID', 'dataKey': 'SUID',
+                'data': [{'SUID': np.int64(node_suids[0]), 'jsonTest': np.float64(1.5)},
+                         {'SUID': np.int64(node_suids[1]), 'jsonTest': np.nan}]}
+        cyrest_put(f'networks/{net_suid}/tables/defaultnode', body=body, require_json=False)
+        df = get_table_columns('node', ['jsonTest'])
+        self.assertEqual(df['jsonTest'][node_suids[0]], 1.5)
+        self.assertTrue(np.isnan(df['jsonTest'][node_suids[1]]))
+
+        # Verify that a replacement serializer is used for every body until the default is restored
+        bodies = []
+        def serializer(body):
+            bodies.append(body)
+            return json.dumps(body)
+        orig_serializer = set_json_serializer(serializer)
+        try:
+            self.assertDictEqual(cyrest_post('commands/command/echo', body={'message': 'Hi there'}),
+                                 {'data': ['Hi there'], 'errors': []})
+            self.assertListEqual(commands_post('command echo message="Hi there"'), ['Hi there'])
+            self.assertEqual(len(bodies), 2)
+            self.assertDictEqual(bodies[0], {'message': 'Hi there'})
+        finally:
+            self.assertIs(set_json_serializer(orig_serializer), serializer)
+        self.assertRaises(CyError, set_json_serializer, 'bogus')
+
+    @print_entry_exit
+    def test_client(self):
+        # Verify that there is one client per base_url, and that it calls the same Cytoscape as the functions do
+        client = get_client()
+        self.assertIs(get_client(DEFAULT_BASE_URL), client)
+        self.assertIsNot(get_client('http://127.0.0.1:1235/v1'), client)
+        self.assertEqual(client.base_url, DEFAULT_BASE_URL)
+        self.assertDictEqual(client.cyrest_get('version'), cyrest_get('version'))
+        self.assertListEqual(client.commands_post('command echo message="Hi there"'), ['Hi there'])
+
+        # Verify that resetting a client closes its session, and that the next call works anyway
+        client.reset()
+        self.assertFalse(get_session_info()['active'])
+        self.assertIn('cytoscapeVersion', client.cyrest_get('version'))
+        self.assertTrue(get_session_info()['active'])
+
+        # Verify that a client for a Cytoscape that isn't there fails the same way the functions do
+        self.assertRaises(RequestException, get_client('http://127.0.0.1:1/v1').cyrest_get, 'version')
+
+    @print_entry_exit
+    def test_session_pool(self):
+        # Verify that the pool size can be changed and that changing it closes existing sessions
+        orig_pool_size = set_session_pool_size(4)
+        self.assertEqual(get_session_pool_size(), 4)
+        self.assertFalse(get_session_info()['active'])
+        self.assertRaises(CyError, set_session_pool_size, 0)
+
+        # Verify that repeated calls reuse a single connection
+        for i in range(10):
+            cyrest_get('version')
+        info = get_session_info()
+        self.assertTrue(info['active'])
+        self.assertEqual(info['pool_size'], 4)
+        self.assertGreaterEqual(info['requests'], 10)
+        self.assertGreaterEqual(info['pool_hits'], 9)
+        self.assertEqual(info['pool_hits'] + info['pool_misses'], info['requests'])
+
+        # Verify that resetting sessions closes only the requested ones
+        self.assertListEqual(reset_sessions('http://totallybogus'), [])
+        self.assertListEqual(reset_sessions(), [DEFAULT_BASE_URL])
+        self.assertFalse(get_session_info()['active'])
+
+        set_session_pool_size(orig_pool_size)
+
+    @print_entry_exit
+    def test_read_cache(self):
+        # Initialization
+        load_test_session()
+        orig_max_bytes = set_read_cache_size()
+        try:
+            # Verify that repeated reads come from the cache, and that each caller gets its own copy
+            styles = get_visual_style_names()
+            info = get_read_cache_info()
+            styles.append('bogus')
+            self.assertNotIn('bogus', get_visual_style_names())
+            self.assertEqual(get_read_cache_info()['generation'], info['generation'])
+            self.assertGreaterEqual(info['entries'], 1)
+
+            # Verify that a cached read survives read-only commands and layout lookups, which don't change the model
+            commands_post('network list')
+            commands_post(f'network get attribute network="SUID:{get_network_suid()}" namespace="default" '
+                          f'columnList="SUID"')
+            commands_get('node list')
+            cyrest_get('apply/layouts')
+            self.assertEqual(get_read_cache_info()['generation'], info['generation'])
+            self.assertListEqual(get_visual_style_names(), styles[:-1])
+            self.assertEqual(get_read_cache_info()['entries'], info['entries'])
+
+            # Verify that a change made through py4cytoscape starts a new generation, so the change is seen
+            copy_visual_style('default', 'xReadCache')
+            self.assertGreater(get_read_cache_info()['generation'], info['generation'])
+            self.assertIn('xReadCache', get_visual_style_names())
+            delete_visual_style('xReadCache')
+            self.assertNotIn('xReadCache', get_visual_style_names())
+
+            # Verify that fresh reads bypass the cache but refill it
+            with fresh_reads():
+                self.assertListEqual(sorted(get_visual_style_names()), sorted(styles[:-1]))
+            self.assertGreaterEqual(get_read_cache_info()['entries'], 1)
+
+            # Verify that the cache stays within its size, and that closing the session empties it
+            set_read_cache_size(0)
+            get_visual_style_names()
+            self.assertEqual(get_read_cache_info()['entries'], 0)
+            self.assertEqual(get_read_cache_info()['bytes'], 0)
+            set_read_cache_size(orig_max_bytes)
+            get_visual_style_names()
+            close_session(False)
+            self.assertEqual(get_read_cache_info()['entries'], 0)
+            self.assertRaises(CyError, set_read_cache_size, -1)
+        finally:
+            set_read_cache_size(orig_max_bytes)
+
     def _check_cy_result(self, actual_res, expected_res, allow_subset=False):
         if type(expected_res) is dict:
             self.assertDictEqual(actual_res, expected_res)
@@ -21,6 +21,11 @@
 """
 
 import unittest
+import os
+import json
+import tempfile
+import threading
+import http.server
 
 from test_utils import *
 
@@ -132,6 +137,64 @@ class CyNDExTests(unittest.TestCase):
         sub_selected_nodes = get_selected_nodes(network=sub_fetched_galFiltered_suid)
         self.assertSetEqual(set(sub_selected_nodes), set(sub_all_node_names))
 
+    @print_entry_exit
+    def test_import_network_from_ndex_cache(self):
+        # Initialization ... stand in for NDEx with a local server that offers galFiltered as a CX file, so that
+        # this test needs no NDEx account or internet connection
+        load_test_session()
+        all_node_names = get_all_nodes()
+        work_dir = tempfile.mkdtemp()
+        cx_file = os.path.join(work_dir, 'galFiltered.cx')
+        export_network(cx_file, type='CX')
+        close_session(False)
+
+        requests_seen = []
+        modification_time = [1]
+        class StandInNDEx(http.server.BaseHTTPRequestHandler):
+            def do_GET(self):
+                requests_seen.append(self.path)
+                if self.path == '/v2/network/galFiltered-uuid/summary':
+                    content = json.dumps({'externalId': 'galFiltered-uuid', 'modificationTime': modification_time[0]}).encode()
+                elif self.path == '/v2/network/galFiltered-uuid':
+                    with open(cx_file, 'rb') as file: content = file.read()
+                else:
+                    self.send_error(404); return
+                self.send_response(200)
+                self.send_header('Content-Length', str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+            def log_message(self, *args): pass
+        server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), StandInNDEx)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        ndex_url = f'http://127.0.0.1:{server.server_port}'
+
+        orig_cache = set_ndex_cache(os.path.join(work_dir, 'cache'))
+        try:
+            # Verify that the first import downloads the network, and the second uses the cached copy
+            suid = import_network_from_ndex('galFiltered-uuid', ndex_url=ndex_url)
+            self.assertSetEqual(set(get_all_nodes(suid)), set(all_node_names))
+            self.assertEqual(requests_seen.count('/v2/network/galFiltered-uuid'), 1)
+            suid = import_network_from_ndex('galFiltered-uuid', ndex_url=ndex_url)
+            self.assertSetEqual(set(get_all_nodes(suid)), set(all_node_names))
+            self.assertEqual(requests_seen.count('/v2/network/galFiltered-uuid'), 1)
+            self.assertEqual(get_ndex_cache_info()['networks'], 1)
+
+            # Verify that a modified network is downloaded again, and that the cache stays within its size
+            modification_time[0] = 2
+            import_network_from_ndex('galFiltered-uuid', ndex_url=ndex_url)
+            self.assertEqual(requests_seen.count('/v2/network/galFiltered-uuid'), 2)
+            set_ndex_cache(os.path.join(work_dir, 'cache'), max_bytes=os.path.getsize(cx_file) + 1)
+            self.assertEqual(get_ndex_cache_info()['networks'], 1)
+
+            # Verify that a network NDEx doesn't have is caught, and that the cache can be emptied
+            self.assertRaises(CyError, import_network_from_ndex, 'bogus-uuid', ndex_url=ndex_url)
+            self.assertEqual(clear_ndex_cache(), 1)
+            self.assertEqual(get_ndex_cache_info()['bytes'], 0)
+            self.assertRaises(CyError, set_ndex_cache, work_dir, max_bytes=0)
+        finally:
+            set_ndex_cache(*orig_cache)
+            server.shutdown()
+
     @print_entry_exit
     def test_import_network_from_ndex(self):
         # TODO: Find out how to test accessKey
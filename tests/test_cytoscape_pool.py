@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+
+""" Test functions in cytoscape_pool.py.
+"""
+
+"""License:
+    Copyright 2020 The Cytoscape Consortium
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+    documentation files (the "Software"), to deal in the Software without restriction, including without limitation
+    the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+    and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all copies or substantial portions
+    of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+    WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
+    OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+    OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+
+import unittest
+import time
+import json
+import threading
+import http.server
+from requests import RequestException
+
+from test_utils import *
+
+_BOGUS_BASE_URL = 'http://127.0.0.1:1/v1'  # nothing listens here, so this instance is always down
+
+
+class CytoscapePoolTests(unittest.TestCase):
+    def setUp(self):
+        try:
+            close_session(False)
+        except:
+            pass
+
+    def tearDown(self):
+        pass
+
+    @print_entry_exit
+    def test_submit_and_map(self):
+        def echo(message, base_url):
+            return commands_post(f'command echo message="{message}"', base_url=base_url)[0]
+
+        with CytoscapePool([DEFAULT_BASE_URL]) as pool:
+            # Verify that results come back through futures and in argument order
+            self.assertEqual(pool.submit(echo, 'Hi there').result(), 'Hi there')
+            self.assertListEqual(list(pool.map(echo, [str(i) for i in range(10)])), [str(i) for i in range(10)])
+
+            # Verify that a job's own error is passed back without taking the instance out of service
+            self.assertIsInstance(pool.submit(commands_post, 'apps status app="bogusjunk"').exception(), CyError)
+            status = pool.get_status()[0]
+            self.assertTrue(status['healthy'])
+            self.assertEqual(status['completed'], 11)
+            self.assertEqual(status['failed'], 1)
+
+        # Verify that a pool that's shut down doesn't take new jobs, and that bad pools are caught
+        self.assertRaises(CyError, pool.submit, echo, 'Hi there')
+        self.assertRaises(CyError, CytoscapePool, [])
+        self.assertRaises(CyError, CytoscapePool, [DEFAULT_BASE_URL, DEFAULT_BASE_URL])
+        self.assertRaises(CyError, CytoscapePool, [DEFAULT_BASE_URL], max_attempts=0)
+
+    @print_entry_exit
+    def test_failover(self):
+        def version(base_url):
+            return cytoscape_version_info(base_url=base_url)['apiVersion']
+
+        # Verify that an instance that's down runs no jobs, and all jobs go to the instance that's up
+        with CytoscapePool([_BOGUS_BASE_URL, DEFAULT_BASE_URL], health_check_secs=1) as pool:
+            self.assertListEqual([pool.submit(version).result() for i in range(5)], ['v1'] * 5)
+            bogus_status, good_status = pool.get_status()
+            self.assertFalse(bogus_status['healthy'])
+            self.assertEqual(bogus_status['completed'], 0)
+            self.assertEqual(good_status['completed'], 5)
+
+        # Verify that jobs waiting for an instance that never comes up fail when the pool shuts down
+        pool = CytoscapePool([_BOGUS_BASE_URL], health_check_secs=1)
+        future = pool.submit(version)
+        time.sleep(2)
+        self.assertFalse(future.done())
+        pool.shutdown()
+        self.assertIsInstance(future.exception(), CyError)
+
+        # Verify that a job that fails to connect everywhere it's tried fails with the connection error
+        with CytoscapePool([DEFAULT_BASE_URL], max_attempts=2) as pool:
+            self.assertIsInstance(pool.submit(lambda base_url: cyrest_get('version', base_url=_BOGUS_BASE_URL)).exception(),
+                                  RequestException)
+
+    @print_entry_exit
+    def test_failover_on_timeout(self):
+        # Initialization ... stand in for a hung Cytoscape with a local server that answers version checks (so it
+        # passes its health checks) but takes too long to answer anything else
+        slow_paths = []
+        class StandInHungCytoscape(http.server.BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path == '/v1/version':
+                    content = json.dumps({'apiVersion': 'v1', 'cytoscapeVersion': '3.9.1'}).encode()
+                else:
+                    slow_paths.append(self.path)
+                    time.sleep(3)
+                    content = b'[]'
+                try:
+                    self.send_response(200)
+                    self.send_header('Content-Length', str(len(content)))
+                    self.end_headers()
+                    self.wfile.write(content)
+                except ConnectionError:
+                    pass  # the caller gave up waiting
+            def log_message(self, *args): pass
+        server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), StandInHungCytoscape)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        hung_base_url = f'http://127.0.0.1:{server.server_port}/v1'
+
+        def network_list(base_url):
+            return cyrest_get('networks', base_url=base_url, timeout=(5, 1))
+
+        try:
+            # Verify that a job that times out is tried again, and fails with the timeout once it runs out of tries
+            with CytoscapePool([hung_base_url], max_attempts=2, health_check_secs=1) as pool:
+                self.assertIsInstance(pool.submit(network_list).exception(), CyTimeoutError)
+                self.assertEqual(len(slow_paths), 2)
+                self.assertEqual(pool.get_status()[0]['failed'], 1)
+
+            # Verify that jobs that time out on the hung instance move to the instance that answers
+            expected = network_list(DEFAULT_BASE_URL)
+            with CytoscapePool([hung_base_url, DEFAULT_BASE_URL], health_check_secs=30) as pool:
+                self.assertListEqual([future.result() for future in [pool.submit(network_list) for i in range(4)]],
+                                     [expected] * 4)
+                hung_status, good_status = pool.get_status()
+                self.assertEqual(hung_status['completed'], 0)
+                self.assertEqual(good_status['completed'], 4)
+        finally:
+            server.shutdown()
+
+
+if __name__ == '__main__':
+    unittest.main()
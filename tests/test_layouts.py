@@ -227,6 +227,30 @@ class LayoutsTests(unittest.TestCase):
         self.assertRaises(CyError, set_layout_properties, 'boguslayout', {})
         self.assertRaises(CyError, set_layout_properties, 'force-directed', {'bogusparam': 666})
 
+        # Verify that a bad property keeps the good ones from being set, too
+        self.assertRaises(CyError, set_layout_properties, 'force-directed',
+                          {'defaultSpringLength': NEW_DEFAULT_SPRING_LENGTH, 'bogusparam': 666})
+        self.assertEqual(get_layout_property_value('force-directed', 'defaultSpringLength'),
+                         orig_default_spring_length)
+
+    @print_entry_exit
+    def test_layout_metadata_cache(self):
+        # Verify that layout names and property types are the same whether fetched or cached, and that callers can't
+        # change the cached copies
+        layout_names = get_layout_names()
+        layout_names.append('boguslayout')
+        self.assertNotIn('boguslayout', get_layout_names())
+        self.assertSetEqual(set(get_layout_name_mapping().values()), set(get_layout_names()))
+        property_names = get_layout_property_names('force-directed')
+        property_names.append('bogusparam')
+        self.assertNotIn('bogusparam', get_layout_property_names('force-directed'))
+        self.assertEqual(get_layout_property_type('force-directed', 'defaultSpringLength'), 'double')
+
+        # Verify that the metadata is fetched again, unchanged, after a session change empties the cache
+        close_session(False)
+        self.assertListEqual(get_layout_names(), layout_names[:-1])
+        self.assertListEqual(get_layout_property_names('force-directed'), property_names[:-1])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -25,6 +25,7 @@ from requests import HTTPError
 import time
 import pathlib
 from test_utils import *
+from py4cytoscape import py4cytoscape_tuning
 
 
 class NetworkViewsTests(unittest.TestCase):
@@ -63,6 +64,56 @@ class NetworkViewsTests(unittest.TestCase):
 
         self.assertRaises(CyError, get_network_views, 'bogus network')
 
+    @print_entry_exit
+    def test_get_network_views_cache(self):
+        # Initialization
+        load_test_session()
+        gal_filtered_suid = get_network_suid()
+        gal_filtered_view_suid = get_network_views()[0]
+
+        # Verify that cached view SUIDs stay correct as networks and sessions come and go
+        self.assertEqual(get_network_views(gal_filtered_suid), [gal_filtered_view_suid])
+        self.assertEqual(get_network_view_suid(gal_filtered_view_suid), gal_filtered_view_suid)
+        clone_suid = clone_network()
+        self.assertNotEqual(get_network_views(clone_suid), [gal_filtered_view_suid])
+        delete_network(clone_suid)
+        self.assertRaises(CyError, get_network_views, clone_suid)
+
+        load_test_session()
+        self.assertNotEqual(get_network_views(), [gal_filtered_view_suid])
+        self.assertRaises(CyError, get_network_view_suid, gal_filtered_view_suid)
+
+        # Verify that a view deleted by a direct CyREST call isn't still reported from the cache
+        self.assertEqual(len(get_network_views()), 1)
+        cyrest_delete(f'networks/{get_network_suid()}/views', require_json=False)
+        self.assertRaises(CyError, get_network_views)
+
+    @print_entry_exit
+    def test_get_network_views_cache_bypasses(self):
+        # Initialization
+        load_test_session()
+        node_names = list(get_table_columns(columns='name')['name'])[:40]
+        orig_cache_secs = py4cytoscape_tuning.NETWORK_CACHE_SECS
+        set_network_cache_secs(600)  # so cached lookups don't expire during the loop
+        set_node_color_bypass(node_names[0], '#FF0000')  # look up the network, view and names once
+
+        # Verify that each bypass after the first lookups costs a single PUT, as bypasses don't drop the cached view
+        client = get_client()
+        requester = client.get_requester()
+        calls = []
+        def counting_requester(method, url, **kwargs):
+            calls.append((method, url))
+            return requester(method, url, **kwargs)
+        client._requester = counting_requester
+        try:
+            for node_name in node_names:
+                set_node_color_bypass(node_name, '#00FF00')
+        finally:
+            client._requester = requester
+            set_network_cache_secs(orig_cache_secs)
+        self.assertEqual(len(calls), len(node_names))
+        self.assertTrue(all(method == 'PUT' for method, url in calls))
+
 
     @print_entry_exit
     def test_get_network_view_suid(self):
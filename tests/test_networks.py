@@ -29,6 +29,7 @@ import re
 import os
 
 from test_utils import *
+from py4cytoscape import py4cytoscape_tuning
 
 
 class NetworkTests(unittest.TestCase):
@@ -133,7 +134,42 @@ class NetworkTests(unittest.TestCase):
         self.assertEqual(get_network_suid('galFiltered.sif'), res)
         self.assertEqual(get_network_suid(res), res)
 
-    
+    @print_entry_exit
+    def test_get_network_suid_cache(self):
+        # Initialization
+        load_test_session()
+        orig_suid = get_network_suid('galFiltered.sif')
+
+        # Verify that networks created, renamed, made current and deleted are seen right away, despite the cache
+        clone_suid = clone_network()
+        self.assertEqual(get_network_suid(clone_suid), clone_suid)
+        rename_network('clone', network=clone_suid)
+        self.assertEqual(get_network_suid('clone'), clone_suid)
+        set_current_network(orig_suid)
+        self.assertEqual(get_network_suid(), orig_suid)
+        set_current_network('clone')
+        self.assertEqual(get_network_suid(), clone_suid)
+        delete_network(clone_suid)
+        self.assertRaises(CyError, get_network_suid, 'clone')
+        self.assertRaises(CyError, get_network_suid, clone_suid)
+
+        # Verify that a new session forgets the old session's networks
+        close_session(False)
+        self.assertRaises(CyError, get_network_suid, orig_suid)
+
+        # Verify that a network changed outside of py4cytoscape is seen once the cache expires
+        load_test_session()
+        orig_suid = get_network_suid('galFiltered.sif')
+        orig_secs = py4cytoscape_tuning.NETWORK_CACHE_SECS
+        try:
+            set_network_cache_secs(0)
+            commands_post(f'network rename name="renamed" sourceNetwork="SUID:{orig_suid}"')
+            self.assertEqual(get_network_suid('renamed'), orig_suid)
+            self.assertRaises(CyError, get_network_suid, 'galFiltered.sif')
+        finally:
+            set_network_cache_secs(orig_secs)
+
+
     @print_entry_exit
     def test_get_network_name(self):
         self.assertRaises(CyError, get_network_name, '')
@@ -141,7 +177,7 @@ class NetworkTests(unittest.TestCase):
         # Initialization
         load_test_session()
         self.assertRaises(CyError, get_network_name, 'bad title')
-        self.assertRaises(IndexError, get_network_name, 500)  # bad SUID
+        self.assertRaises(CyError, get_network_name, 500)  # bad SUID
 
         res = get_network_name()
         self.assertIsInstance(res, str)
@@ -161,6 +197,16 @@ class NetworkTests(unittest.TestCase):
         # Verify that all networks are present (in any order)
         self.assertSetEqual(set(get_network_list()), set(['yeastHighQuality.sif', 'galFiltered.sif']))
 
+        # Verify that networks added, renamed and deleted are seen, and that networks sharing a name resolve
+        clone_suid = clone_network('galFiltered.sif')
+        self.assertEqual(len(get_network_list()), 3)
+        rename_network('galFiltered.sif', network=clone_suid)
+        self.assertEqual(get_network_list().count('galFiltered.sif'), 2)
+        self.assertIn(get_network_suid('galFiltered.sif'), cyrest_get('networks'))
+        self.assertEqual(get_network_name(clone_suid), 'galFiltered.sif')
+        delete_network(clone_suid)
+        self.assertSetEqual(set(get_network_list()), set(['yeastHighQuality.sif', 'galFiltered.sif']))
+
         # Verify that when there are no networks, no networks are returned
         delete_all_networks()
         self.assertListEqual(get_network_list(), [])
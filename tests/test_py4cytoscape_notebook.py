@@ -0,0 +1,318 @@
+# -*- coding: utf-8 -*-
+
+""" Test functions in py4cytoscape_notebook.py.
+"""
+
+"""License:
+    Copyright 2020 The Cytoscape Consortium
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+    documentation files (the "Software"), to deal in the Software without restriction, including without limitation
+    the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+    and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all copies or substantial portions
+    of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+    WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
+    OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+    OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+
+import unittest
+import json
+import time
+import queue
+import random
+import threading
+import requests
+import http.server
+import numpy as np
+from urllib.parse import urlparse
+
+from test_utils import *
+from py4cytoscape import py4cytoscape_notebook, py4cytoscape_sandbox, commands
+
+
+class StandInBridge:
+    # Stands in for Jupyter-Bridge and the browser behind it, so remote execution can be tested without either. Each
+    # request queued on the channel is answered by browser(http_request), which returns (status, reason, text) or
+    # raw bytes to send as the whole reply. Replies are handed out in the order they're made by dequeue_reply, which
+    # waits up to dequeue_wait seconds for one before answering 408 as Jupyter-Bridge does.
+
+    def __init__(self, browser, reply_delay=0, dequeue_wait=0.5, reject_early_dequeue=False):
+        self.browser = browser
+        self.reply_delay = reply_delay  # seconds the browser takes to reply, or a function of the request
+        self.dequeue_wait = dequeue_wait
+        self.reject_early_dequeue = reject_early_dequeue  # True to answer 400 to a dequeue with nothing queued
+        self.drop_replies = False  # True to take a reply off the queue and then hang up instead of sending it
+        self.queue_status = 200  # status to answer queue_request with
+        self.requests = []  # requests queued, in order
+        self.dequeues = 0
+        self._replies = queue.Queue()
+        self._outstanding = 0
+        self._lock = threading.Lock()
+
+        bridge = self
+        class Handler(http.server.BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            def do_POST(self):
+                http_request = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))))
+                if bridge.queue_status != 200:
+                    self._send(bridge.queue_status, b'Bridge is broken'); return
+                with bridge._lock:
+                    bridge.requests.append(http_request)
+                    bridge._outstanding += 1
+                delay = bridge.reply_delay(http_request) if callable(bridge.reply_delay) else bridge.reply_delay
+                threading.Timer(delay, bridge._reply, args=(http_request,)).start()
+                self._send(200, b'')
+            def do_GET(self):
+                with bridge._lock:
+                    bridge.dequeues += 1
+                    nothing_queued = bridge._outstanding == 0 and bridge._replies.empty()
+                if bridge.reject_early_dequeue and nothing_queued:
+                    self._send(400, b'Nothing queued on channel'); return
+                try:
+                    reply = bridge._replies.get(timeout=bridge.dequeue_wait)
+                except queue.Empty:
+                    self._send(408, b''); return
+                if bridge.drop_replies:
+                    self.close_connection = True; return
+                self._send(200, reply)
+            def _send(self, status, content):
+                self.send_response(status)
+                self.send_header('Content-Length', str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+            def log_message(self, *args): pass
+        self._server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        self.url = f'http://127.0.0.1:{self._server.server_port}'
+
+    def _reply(self, http_request):
+        reply = self.browser(http_request)
+        if not isinstance(reply, bytes):
+            status, reason, text = reply
+            reply = json.dumps({'status': status, 'reason': reason, 'text': text}).encode('utf-8')
+        with self._lock:
+            self._outstanding -= 1
+            self._replies.put(reply)
+
+    def shutdown(self):
+        self._server.shutdown()
+
+
+def cytoscape_browser(routes):
+    # Return a stand-in browser that answers requests for the routes ({(method, path): JSON reply}) the way Cytoscape
+    # would, along with the requests needed to set up the default sandbox
+    routes = dict(routes)
+    routes[('POST', '/v1/commands/filetransfer/setSandbox')] = {'data': {'sandboxPath': '/sandbox'}, 'errors': []}
+    routes[('GET', '/v1/version')] = {'apiVersion': 'v1', 'cytoscapeVersion': '3.9.1'}
+    def browser(http_request):
+        key = (http_request['command'], urlparse(http_request['url']).path)
+        if key in routes:
+            return 200, 'OK', json.dumps(routes[key])
+        return 404, 'Not Found', ''
+    return browser
+
+
+class NotebookTests(unittest.TestCase):
+    def setUp(self):
+        # Send all calls through a stand-in Jupyter-Bridge, as if running in a remote notebook
+        self.orig_notebook_is_running = py4cytoscape_notebook.set_notebook_is_running(True)
+        self.orig_running_remote = py4cytoscape_notebook._running_remote
+        self.orig_bridge_url = py4cytoscape_notebook._JUPYTER_BRIDGE_URL
+        self.orig_channel = py4cytoscape_notebook._CHANNEL
+        self.orig_overlap = py4cytoscape_notebook._bridge_overlap
+        self.orig_overlap_refusals = py4cytoscape_notebook._bridge_overlap_refusals
+        py4cytoscape_notebook.running_remote(True)
+        py4cytoscape_notebook._CHANNEL = 'test-channel'
+        py4cytoscape_sandbox.reset_default_sandbox()
+        commands.get_client().reset()
+        self.bridges = []
+
+    def tearDown(self):
+        for bridge in self.bridges:
+            bridge.shutdown()
+        py4cytoscape_notebook.set_notebook_is_running(self.orig_notebook_is_running)
+        py4cytoscape_notebook._running_remote = self.orig_running_remote
+        py4cytoscape_notebook._JUPYTER_BRIDGE_URL = self.orig_bridge_url
+        py4cytoscape_notebook._CHANNEL = self.orig_channel
+        py4cytoscape_notebook._bridge_overlap = self.orig_overlap
+        py4cytoscape_notebook._bridge_overlap_refusals = self.orig_overlap_refusals
+        py4cytoscape_notebook._bridge_stray_wait = None
+        py4cytoscape_sandbox.reset_default_sandbox()
+        commands.get_client().reset()
+
+    def start_bridge(self, browser, **kwargs):
+        bridge = StandInBridge(browser, **kwargs)
+        py4cytoscape_notebook._JUPYTER_BRIDGE_URL = bridge.url
+        self.bridges.append(bridge)
+        return bridge
+
+    @print_entry_exit
+    def test_cyrest_get_values_remote(self):
+        rows = [{'SUID': 1, 'name': 'A', 'score': 1.5}, {'SUID': 2, 'name': 'B'}, {'SUID': 3, 'name': 'C', 'score': 3.5}]
+        bridge = self.start_bridge(cytoscape_browser({
+            ('GET', '/v1/networks'): [52],
+            ('GET', '/v1/networks/52/tables/defaultnode/columns'): [{'name': 'SUID', 'type': 'Long'},
+                                                                    {'name': 'name', 'type': 'String'},
+                                                                    {'name': 'score', 'type': 'Double'}],
+            ('GET', '/v1/networks/52/tables/defaultnode'): {'SUID': 52, 'rows': rows},
+            ('GET', '/v1/networks/52/tables/defaultnode/columns/SUID'): {'name': 'SUID', 'values': [1, 2, 3]},
+            ('GET', '/v1/networks/52/tables/defaultnode/columns/score'): {'name': 'score', 'values': [1.5, None, 3.5]},
+        }))
+
+        # Verify that a streamed read works over Jupyter-Bridge, where the whole reply arrives at once
+        values = cyrest_get_values('networks/52/tables/defaultnode/columns/score', dtype='float64', missing=np.nan)
+        self.assertTrue(np.array_equal(values, [1.5, np.nan, 3.5], equal_nan=True))
+        self.assertListEqual(list(cyrest_get_values('networks/52/tables/defaultnode/columns/SUID', dtype='int64')),
+                             [1, 2, 3])
+
+        # Verify that tables can be read both ways, which both stream their reads
+        for bulk in [True, False]:
+            table = get_table_columns(columns=['score'], network=52, bulk=bulk)
+            self.assertListEqual(list(table.index), [1, 2, 3])
+            self.assertTrue(np.array_equal(table['score'].values, [1.5, np.nan, 3.5], equal_nan=True))
+        self.assertTrue(all(http_request['url'].startswith(DEFAULT_BASE_URL) for http_request in bridge.requests))
+
+    @print_entry_exit
+    def test_remote_per_client(self):
+        # Stand in for a Cytoscape that answers directly at its own URL
+        class Handler(http.server.BaseHTTPRequestHandler):
+            def do_GET(self):
+                content = json.dumps({'apiVersion': 'v1', 'cytoscapeVersion': '3.9.1'}).encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Length', str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+            def log_message(self, *args): pass
+        server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        local_url = f'http://127.0.0.1:{server.server_port}/v1'
+
+        # Verify that each client decides for itself whether its Cytoscape is reached through Jupyter-Bridge, so the
+        # default client's answer doesn't decide it for another instance
+        try:
+            self.start_bridge(cytoscape_browser({('GET', '/v1/networks'): [52]}))
+            self.assertTrue(commands.get_client().is_remote())
+            self.assertFalse(commands.get_client(local_url).is_remote())
+            self.assertListEqual(cyrest_get('networks'), [52])
+            self.assertTrue(commands.get_client().is_remote())
+        finally:
+            commands.get_client(local_url).reset()
+            server.shutdown()
+
+    @print_entry_exit
+    def test_timeout_remote(self):
+        bridge = self.start_bridge(cytoscape_browser({('GET', '/v1/networks'): [52]}),
+                                   reply_delay=lambda http_request: 1.5 if http_request['url'].endswith('/networks') else 0)
+
+        # Verify that timeouts don't apply through Jupyter-Bridge, so a slow reply still goes to the call that asked
+        self.assertListEqual(cyrest_get('networks', timeout=0.5), [52])
+        orig_timeout = set_request_timeout(0.5, 0.5)
+        try:
+            self.assertListEqual(cyrest_get('networks'), [52])
+        finally:
+            set_request_timeout(*orig_timeout)
+
+        # Verify that a deadline doesn't cut short a call waiting for its reply, but stops calls once it has passed
+        with deadline(0.5):
+            self.assertListEqual(cyrest_get('networks'), [52])
+            requests_queued = len(bridge.requests)
+            self.assertRaises(CyTimeoutError, cyrest_get, 'networks')
+        self.assertEqual(len(bridge.requests), requests_queued)
+
+    @print_entry_exit
+    def test_decode_reply(self):
+        # Verify that a reply declared or found to be UTF-8 is decoded as such, and that others are detected
+        text = '{"text": "Caf\u00e9 na\u00efve r\u00e9sum\u00e9 \u00e0 la carte, d\u00e9j\u00e0 vu"}'
+        self.assertEqual(py4cytoscape_notebook._decode_reply(text.encode('utf-8'), 'UTF-8'), text)
+        self.assertEqual(py4cytoscape_notebook._decode_reply(text.encode('utf-8'), 'utf8'), text)
+        self.assertEqual(py4cytoscape_notebook._decode_reply(text.encode('utf-8')), text)
+        self.assertEqual(py4cytoscape_notebook._decode_reply(text.encode('utf-16'), None), text)
+        self.assertEqual(py4cytoscape_notebook._decode_reply(b'{"a": "\xff"}', 'utf-8'), '{"a": "\ufffd"}')
+
+    @print_entry_exit
+    def test_bridge_replies(self):
+        # Answer each request with its own path, so a reply handed to the wrong call would be noticed
+        setup_browser = cytoscape_browser({})
+        def browser(http_request):
+            path = urlparse(http_request['url']).path
+            if path == '/v1/unreachable':
+                return 0, 'Could not contact Cytoscape', ''
+            elif path == '/v1/garbled':
+                return b'\x00\xff not a reply'
+            elif path == '/v1/missing':
+                return 404, 'Not Found', ''
+            elif path.startswith('/v1/echo/'):
+                return 200, 'OK', json.dumps({'path': path})
+            return setup_browser(http_request)
+        def echo(name, **kwargs):
+            return cyrest_get(f'echo/{name}', **kwargs)['path']
+
+        # Verify that a reply slower than Jupyter-Bridge's wait is still picked up, after waiting again
+        bridge = self.start_bridge(browser, reply_delay=lambda http_request: 1.2 if 'slow' in http_request['url'] else 0,
+                                   dequeue_wait=0.3)
+        self.assertEqual(echo('first'), '/v1/echo/first')
+        dequeues = bridge.dequeues
+        self.assertEqual(echo('slow'), '/v1/echo/slow')
+        self.assertGreaterEqual(bridge.dequeues - dequeues, 3)
+        self.assertTrue(py4cytoscape_notebook._bridge_overlap)  # waiting early for replies was accepted
+
+        # Verify that calls from several threads each get their own reply when replies take varying times
+        bridge.reply_delay = lambda http_request: random.uniform(0, 0.2)
+        results = {}
+        def call(i):
+            results[i] = echo(f'thread{i}')
+        threads = [threading.Thread(target=call, args=(i,)) for i in range(8)]
+        for thread in threads: thread.start()
+        for thread in threads: thread.join()
+        self.assertDictEqual(results, {i: f'/v1/echo/thread{i}' for i in range(8)})
+
+        # Verify that error replies are reported, and that the call after each one still gets its own reply
+        for bad_request in ['unreachable', 'garbled', 'missing']:
+            self.assertRaises(requests.exceptions.HTTPError, cyrest_get, bad_request)
+            self.assertEqual(echo(f'after_{bad_request}'), f'/v1/echo/after_{bad_request}')
+
+        # Verify that a failure to queue a request is reported without sitting out the early wait for its reply, and
+        # that the early wait doesn't take the next call's reply
+        bridge.queue_status = 500
+        bridge.dequeue_wait = 5
+        start = time.perf_counter()
+        self.assertRaises(requests.exceptions.HTTPError, echo, 'unqueued')
+        self.assertLess(time.perf_counter() - start, 2)
+        bridge.queue_status = 200
+        bridge.dequeue_wait = 0.3
+        self.assertEqual(echo('after_unqueued'), '/v1/echo/after_unqueued')
+        self.assertNotIn('/v1/echo/unqueued', [urlparse(http_request['url']).path for http_request in bridge.requests])
+
+        # Verify that an early wait that fails after taking the reply is reported instead of waiting again forever, and
+        # that waiting early isn't given up because of it
+        bridge.drop_replies = True
+        self.assertRaises(requests.exceptions.HTTPError, echo, 'dropped')
+        bridge.drop_replies = False
+        self.assertEqual(echo('after_dropped'), '/v1/echo/after_dropped')
+        self.assertTrue(py4cytoscape_notebook._bridge_overlap)
+
+    @print_entry_exit
+    def test_bridge_rejects_early_dequeue(self):
+        # Verify that a Jupyter-Bridge that won't wait for a reply before its request is queued is detected once it
+        # has refused several times in a row (but not after one refusal), and that calls then wait after queueing and
+        # still get their own replies
+        bridge = self.start_bridge(cytoscape_browser({('GET', '/v1/networks'): [52],
+                                                      ('GET', '/v1/networks/count'): {'count': 1}}),
+                                   reply_delay=0.1)
+        self.assertListEqual(cyrest_get('networks'), [52])  # sets up the sandbox, too
+        bridge.reject_early_dequeue = True
+        self.assertListEqual(cyrest_get('networks'), [52])
+        self.assertTrue(py4cytoscape_notebook._bridge_overlap)
+        for i in range(3):
+            self.assertListEqual(cyrest_get('networks'), [52])
+            self.assertDictEqual(cyrest_get('networks/count'), {'count': 1})
+        self.assertFalse(py4cytoscape_notebook._bridge_overlap)
+
+
+if __name__ == '__main__':
+    unittest.main()
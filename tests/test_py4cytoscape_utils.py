@@ -21,6 +21,7 @@
 """
 
 import unittest
+import time
 from test_utils import *
 
 class Py4cytoscapeUtilsTests(unittest.TestCase):
@@ -275,6 +276,72 @@ class Py4cytoscapeUtilsTests(unittest.TestCase):
 
         self.assertEqual(edge_name_to_edge_suid(edge_names[0], unique_list=False), [suids[0]]) # try just a single node name, list declared non-unique
 
+    @print_entry_exit
+    def test_name_index(self):
+        # Initialization
+        load_test_session()
+        self.assertEqual(refresh_name_index(), get_node_count())
+        self.assertEqual(refresh_name_index('edge'), get_edge_count())
+        self.assertRaises(CyError, refresh_name_index, 'network')
+        suid_orig = node_name_to_node_suid('YGR009C')[0]
+
+        # Verify that nodes and edges added by py4cytoscape are translated right away
+        new_suid = add_cy_nodes(['new node'])[0]['SUID']
+        self.assertEqual(node_name_to_node_suid('new node'), [new_suid])
+        self.assertEqual(node_suid_to_node_name(new_suid), ['new node'])
+        dup_suid = add_cy_nodes(['YGR009C'], skip_duplicate_names=False)[0]['SUID']
+        self.assertSetEqual(set(node_name_to_node_suid(['YGR009C', 'YGR009C'], unique_list=True)), {suid_orig, dup_suid})
+        new_edge_suid = add_cy_edges(['new node', 'YGR009C'])[0]['SUID']
+        self.assertEqual(edge_name_to_edge_suid(edge_suid_to_edge_name(new_edge_suid)), [new_edge_suid])
+
+        # Verify that deleted nodes are forgotten right away
+        select_nodes([new_suid])
+        delete_selected_nodes()
+        self.assertRaises(CyError, node_name_to_node_suid, 'new node')
+        self.assertRaises(CyError, node_suid_to_node_name, new_suid)
+        self.assertRaises(CyError, edge_suid_to_edge_name, new_edge_suid)
+
+        # Verify that a node renamed outside of py4cytoscape is seen after invalidating the index
+        cyrest_put(f'networks/{get_network_suid()}/tables/defaultnode', body={'key': 'SUID', 'dataKey': 'SUID', 'data': [{'SUID': dup_suid, 'name': 'renamed'}]}, require_json=False)
+        invalidate_name_index()
+        self.assertEqual(node_name_to_node_suid('renamed'), [dup_suid])
+
+    @print_entry_exit
+    def test_name_translation_scaling(self):
+        # Initialization
+        load_test_session()
+        suid_name_map = get_table_columns(columns='name')['name']
+        node_suid_to_node_name(suid_name_map.index[0])  # build name index before translating
+
+        # Verify that translating 1k, 10k and 100k names and SUIDs gives the right answers
+        for size in [1000, 10000, 100000]:
+            names = list(suid_name_map.sample(size, replace=True, random_state=0))
+            suids = list(suid_name_map.index.to_series().sample(size, replace=True, random_state=0))
+            res = node_name_to_node_suid(names, unique_list=False)
+            self.assertEqual(len(res), size)
+            self.assertEqual(node_name_to_node_suid(suids), suids)
+            self.assertEqual(node_suid_to_node_name(suids), [suid_name_map[suid] for suid in suids])
+
+    @unittest.skipUnless(run_benchmarks(), 'Benchmarks run only if PY4CYTOSCAPE_RUN_BENCHMARKS=TRUE')
+    @print_entry_exit
+    def test_name_translation_benchmark(self):
+        # Initialization
+        load_test_session()
+        suid_name_map = get_table_columns(columns='name')['name']
+        node_suid_to_node_name(suid_name_map.index[0])  # build name index so only translation is timed
+
+        # Time translation of 1k, 10k and 100k names and SUIDs ... time should grow about linearly with list size, so
+        # allow 10x that before failing, which still catches quadratic growth
+        timings = {}
+        for size in [1000, 10000, 100000]:
+            names = list(suid_name_map.sample(size, replace=True, random_state=0))
+            suids = list(suid_name_map.index.to_series().sample(size, replace=True, random_state=0))
+            start = time.perf_counter()
+            node_name_to_node_suid(names, unique_list=False)
+            node_suid_to_node_name(suids)
+            timings[size] = time.perf_counter() - start
+            print(f'Translated {size} names and SUIDs in {timings[size]:.4f} secs')
+        self.assertLess(timings[100000], 1000 * max(timings[1000], 0.001))
 
 
     @print_entry_exit
@@ -288,5 +355,25 @@ class Py4cytoscapeUtilsTests(unittest.TestCase):
         self.assertRaises(CyError, verify_supported_versions, cytoscape='4.0')
         self.assertRaises(AttributeError, verify_supported_versions, cytoscape='complete trash')
 
+    @print_entry_exit
+    def test_get_cytoscape_capabilities(self):
+        # Verify that capabilities follow the Cytoscape version
+        at_least_39 = check_supported_versions(cytoscape='3.9') is None
+        res = get_cytoscape_capabilities()
+        self.assertSetEqual(set(res), {'filter_apply_flag', 'filter_regex', 'filter_settled_selection'})
+        for capability in res.values():
+            self.assertEqual(capability, at_least_39)
+
+        # Verify that versions are fetched only once per connection, and again after a ping
+        client = get_client()
+        versions = client.get_versions()
+        self.assertIn('cytoscapeVersion', versions)
+        client.get_cache('versions')['versions'] = {'apiVersion': 'v1', 'cytoscapeVersion': '3.6.0'}
+        self.assertEqual(get_cytoscape_capabilities(), res)  # capabilities were already worked out
+        self.assertIsNotNone(check_supported_versions(cytoscape='3.9'))
+        cytoscape_ping()
+        self.assertEqual(client.get_versions(), versions)
+        self.assertEqual(get_cytoscape_capabilities(), res)
+
 if __name__ == '__main__':
     unittest.main()
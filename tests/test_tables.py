@@ -21,9 +21,14 @@ import numpy as np
     OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 """
 
+import os
 import unittest
 import pandas as df
 from requests import HTTPError
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
 
 from test_utils import *
 
@@ -107,6 +112,32 @@ class TablesTests(unittest.TestCase):
         self.assertRaises(CyError, get_table_columns, table='bogustable', columns='boguscolumn')
         self.assertRaises(CyError, get_table_columns, network='bogus')
 
+    @print_entry_exit
+    def test_get_table_columns_bulk(self):
+        # Initialization
+        load_test_session()
+
+        # Verify that fetching the whole table at once returns the same data as fetching each column
+        for table in ['node', 'edge', 'network']:
+            bulk_df = get_table_columns(table=table, bulk=True)
+            column_df = get_table_columns(table=table, bulk=False)
+            df.testing.assert_frame_equal(bulk_df.sort_index(), column_df.sort_index())
+        bulk_df = get_table_columns(columns=['gal1RGexp', 'Stress'], bulk=True)
+        self.assertListEqual(list(bulk_df.columns), ['gal1RGexp', 'Stress'])
+        self.assertEqual(len(bulk_df.index), get_node_count())
+
+        # Verify that nullable dtypes are used on request, and they hold the same values
+        nullable_df = get_table_columns(dtype_backend='numpy_nullable')
+        self.assertEqual(str(nullable_df['Stress'].dtype), 'Int64')
+        self.assertEqual(str(nullable_df['gal1RGexp'].dtype), 'Float64')
+        self.assertEqual(str(nullable_df['selected'].dtype), 'boolean')
+        self.assertEqual(str(nullable_df['name'].dtype), 'string')
+        numpy_df = get_table_columns()
+        self.assertListEqual(list(nullable_df['Stress'].astype('int64')), list(numpy_df['Stress']))
+        self.assertListEqual(list(nullable_df['name'].astype(object)), list(numpy_df['name']))
+
+        self.assertRaises(CyError, get_table_columns, dtype_backend='bogus')
+
     
     @print_entry_exit
     def test_get_table_value(self):
@@ -329,7 +360,172 @@ class TablesTests(unittest.TestCase):
         self.assertRaises(CyError, load_table_data, data, namespace='bogus')
         self.assertRaises(CyError, load_table_data, data, network='bogus')
 
-    
+    @print_entry_exit
+    def test_load_table_data_chunked(self):
+        # Initialization
+        load_test_session()
+        node_names = list(get_table_columns(columns='name')['name'])
+        data = df.DataFrame(data={'id': node_names, 'chunkInt': range(len(node_names)),
+                                  'chunkFloat': [i / 2 for i in range(len(node_names))]})
+
+        # Verify that loading in chunks, in parallel, gives the same table as loading all at once, with progress noted
+        progress = []
+        res = load_table_data(data, data_key_column='id', chunk_size=50, max_workers=3,
+                              progress=lambda rows, total: progress.append((rows, total)))
+        self.assertEqual(res, 'Success: Data loaded in defaultnode table')
+        self.assertEqual(len(progress), (len(node_names) + 49) // 50)
+        self.assertTupleEqual(progress[-1], (len(node_names), len(node_names)))
+        self.assertEqual(get_table_column_types()['chunkInt'], 'Integer')
+        self.assertEqual(get_table_column_types()['chunkFloat'], 'Double')
+        chunked_df = get_table_columns(columns=['name', 'chunkInt', 'chunkFloat'])
+        delete_table_column('chunkInt')
+        delete_table_column('chunkFloat')
+        load_table_data(data, data_key_column='id')
+        whole_df = get_table_columns(columns=['name', 'chunkInt', 'chunkFloat'])
+        df.testing.assert_frame_equal(chunked_df.sort_index(), whole_df.sort_index())
+
+        # Verify that an iterator of dataframes loads, and that it's an error only if none of them match
+        progress = []
+        res = load_table_data((data.iloc[start:start + 100] for start in range(0, len(data), 100)),
+                              data_key_column='id', chunk_size=30,
+                              progress=lambda rows, total: progress.append((rows, total)))
+        self.assertEqual(res, 'Success: Data loaded in defaultnode table')
+        self.assertTupleEqual(progress[-1], (len(node_names), None))
+        self.assertRaises(CyError, load_table_data, iter([df.DataFrame(data={'id': ['bogus'], 'chunkInt': [1]})]),
+                          data_key_column='id')
+
+        self.assertRaises(CyError, load_table_data, data, data_key_column='id', chunk_size=0)
+        self.assertRaises(CyError, load_table_data, data, data_key_column='id', max_workers=0)
+
+    @print_entry_exit
+    def test_load_table_data_diagnostics(self):
+        # Initialization
+        load_test_session()
+
+        # Verify that rows whose keys aren't in the table are counted and sampled, and that lists become strings
+        data = df.DataFrame(data={'id': ['YDL194W', 'YDR277C', 'New1', 'New2'],
+                                  'listcol': [['a', 'b'], 'c', ['d'], 'e'], 'intcol': [1, 2, 3, 4]})
+        res = load_table_data(data, data_key_column='id', diagnostics=True)
+        self.assertDictEqual(res, {'message': 'Success: Data loaded in defaultnode table', 'rows_loaded': 2,
+                                   'rows_unmatched': 2, 'unmatched_keys': ['New1', 'New2']})
+        self.assertEqual(get_table_value('node', 'YDL194W', 'listcol'), 'a,b')
+        self.assertEqual(get_table_value('node', 'YDR277C', 'listcol'), 'c')
+        self.assertListEqual(list(data['listcol']), [['a', 'b'], 'c', ['d'], 'e'])  # caller's data is left as it was
+
+        # Verify that integer keys match the table's integer keys
+        suids = list(get_table_columns(columns='SUID')['SUID'])[:3]
+        res = load_table_data(df.DataFrame(data={'SUID': suids + [-1], 'suidcol': [1, 2, 3, 4]}),
+                              data_key_column='SUID', table_key_column='SUID', diagnostics=True)
+        self.assertEqual(res['rows_loaded'], 3)
+        self.assertListEqual(res['unmatched_keys'], [-1])
+
+
+    @print_entry_exit
+    def test_sync_table_data(self):
+        # Initialization
+        load_test_session()
+        node_names = list(get_table_columns(columns='name')['name'])
+        scores = df.DataFrame(data={'id': node_names + ['bogus'], 'syncScore': [i / 3 for i in range(len(node_names) + 1)]})
+
+        # Verify that the first sync loads every matching row, and that a repeat sync loads nothing
+        res = sync_table_data(scores, data_key_column='id')
+        self.assertEqual(res['message'], 'Success: Data loaded in defaultnode table')
+        self.assertEqual(res['rows_changed'], len(node_names))
+        self.assertListEqual(res['columns_changed'], ['syncScore'])
+        self.assertEqual(res['rows_unmatched'], 1)
+        self.assertListEqual(res['unmatched_keys'], ['bogus'])
+        res = sync_table_data(scores, data_key_column='id')
+        self.assertEqual(res['message'], 'Success: No changes to defaultnode table')
+        self.assertEqual(res['rows_unchanged'], len(node_names))
+
+        # Verify that only changed values are loaded, and that they land in Cytoscape
+        scores.loc[[0, 5], 'syncScore'] = [100.0, 105.0]
+        res = sync_table_data(scores, data_key_column='id')
+        self.assertEqual(res['rows_changed'], 2)
+        self.assertEqual(res['cells_changed'], 2)
+        self.assertEqual(get_table_value('node', node_names[5], 'syncScore'), 105.0)
+
+        # Verify that a change made some other way is noticed, because the snapshot is fetched again
+        load_table_data(df.DataFrame(data={'id': [node_names[1]], 'syncScore': [-1.0]}), data_key_column='id')
+        res = sync_table_data(scores, data_key_column='id')
+        self.assertEqual(res['rows_changed'], 1)
+        self.assertEqual(get_table_value('node', node_names[1], 'syncScore'), scores.loc[1, 'syncScore'])
+
+        # Verify that writes to other columns don't cost a new snapshot, so the next sync fetches no table values and
+        # sends only the changed value
+        load_table_data(df.DataFrame(data={'id': node_names, 'syncOther': range(len(node_names))}), data_key_column='id')
+        set_node_color_bypass(node_names[0], '#FF0000')
+        scores.loc[2, 'syncScore'] = 102.0
+        client = get_client()
+        requester = client.get_requester()
+        calls = []
+        def counting_requester(method, url, **kwargs):
+            calls.append((method, url))
+            return requester(method, url, **kwargs)
+        client._requester = counting_requester
+        try:
+            res = sync_table_data(scores, data_key_column='id')
+        finally:
+            client._requester = requester
+        self.assertEqual(res['cells_changed'], 1)
+        table_calls = [method for method, url in calls if '/tables/defaultnode' in url and not url.endswith('/columns')]
+        self.assertListEqual(table_calls, ['PUT'])
+        self.assertEqual(get_table_value('node', node_names[2], 'syncScore'), 102.0)
+
+        self.assertRaises(CyError, sync_table_data, scores, data_key_column='bogus')
+
+    @unittest.skipIf(pa is None, 'pyarrow is not installed')
+    @print_entry_exit
+    def test_table_arrow(self):
+        # Initialization
+        load_test_session()
+
+        # Verify that each Cytoscape type becomes the matching Arrow type, and that values match get_table_columns
+        arrow_table = get_table_arrow(columns=['name', 'Degree', 'Stress', 'gal1RGexp', 'IsSingleNode'])
+        self.assertListEqual(arrow_table.column_names, ['SUID', 'name', 'Degree', 'Stress', 'gal1RGexp', 'IsSingleNode'])
+        self.assertEqual(arrow_table.schema.field('SUID').type, pa.int64())
+        self.assertEqual(arrow_table.schema.field('Degree').type, pa.int32())
+        self.assertEqual(arrow_table.schema.field('gal1RGexp').type, pa.float64())
+        self.assertEqual(arrow_table.schema.field('IsSingleNode').type, pa.bool_())
+        self.assertEqual(arrow_table.schema.field('name').type, pa.string())
+        column_df = get_table_columns(columns=['name', 'Degree'])
+        arrow_df = arrow_table.to_pandas().set_index('SUID')
+        self.assertDictEqual(dict(zip(arrow_df['name'], arrow_df['Degree'])), dict(zip(column_df['name'], column_df['Degree'])))
+        bulk_table = get_table_arrow(columns=['name', 'Degree', 'Stress', 'gal1RGexp', 'IsSingleNode'], bulk=True)
+        self.assertTrue(bulk_table.sort_by('SUID').equals(arrow_table.sort_by('SUID')))
+        self.assertRaises(CyError, get_table_arrow, columns='bogus')
+
+        # Verify that new columns are created with the Arrow types, including lists, and that nulls stay missing
+        names = arrow_table.column('name').to_pylist()[:3]
+        data = pa.table({'name': names, 'arrowLong': pa.array([1, None, 3], type=pa.int64()),
+                         'arrowInt': pa.array([1, 2, 3], type=pa.int16()),
+                         'arrowList': pa.array([['a', 'b'], [], None], type=pa.list_(pa.string()))})
+        self.assertEqual(load_table_arrow(data), 'Success: Data loaded in defaultnode table')
+        types = get_table_column_types()
+        self.assertEqual(types['arrowLong'], 'Long')
+        self.assertEqual(types['arrowInt'], 'Integer')
+        self.assertEqual(types['arrowList'], 'List')
+        self.assertEqual(get_table_value('node', names[0], 'arrowLong'), 1)
+        loaded = get_table_arrow(columns=['name', 'arrowLong', 'arrowList']).to_pandas().set_index('name')
+        self.assertTrue(df.isna(loaded.loc[names[1], 'arrowLong']))
+        self.assertListEqual(list(loaded.loc[names[0], 'arrowList']), ['a', 'b'])
+        self.assertRaises(CyError, load_table_arrow, pa.table({'name': names, 'bad': pa.array([1, 2, 3], type=pa.date32())}))
+        self.assertRaises(CyError, load_table_arrow,
+                          pa.table({'name': names, 'arrowBig': pa.array([2 ** 63, None, 1], type=pa.uint64())}))
+        self.assertNotIn('arrowBig', get_table_column_names())  # rejected before any column was created
+
+        # Verify that tables go to and from Parquet files, with types kept and read in chunks on request
+        res = export_table_parquet('test_nodes', columns=['name', 'Degree', 'arrowList'])
+        parquet_file = res['file']
+        self.assertTrue(parquet_file.endswith('test_nodes.parquet'))
+        self.assertListEqual(res['columns'], ['SUID', 'name', 'Degree', 'arrowList'])
+        self.assertRaises(CyError, export_table_parquet, 'test_nodes', overwrite_file=False)
+        delete_table_column('arrowList')
+        res = load_table_parquet('test_nodes.parquet', columns=['name', 'arrowList'], chunk_size=100, diagnostics=True)
+        self.assertEqual(res['rows_loaded'], get_node_count())
+        self.assertEqual(get_table_column_types()['arrowList'], 'List')
+        os.remove(parquet_file)
+
     @print_entry_exit
     def test_map_table_column(self):
         # Initialization
@@ -384,6 +580,33 @@ class TablesTests(unittest.TestCase):
         self.assertRaises(CyError, rename_table_column, 'AverageShortestPathLength', 'xAveragex',
                           table='bogus')
 
+    @print_entry_exit
+    def test_column_type_cache(self):
+        # Initialization
+        load_test_session()
+
+        # Verify that columns created, renamed and deleted after the column types are cached are seen right away
+        self.assertFalse(table_column_exists('xCached', 'node'))
+        load_table_data(df.DataFrame(data={'id': ['YDL194W'], 'xCached': [1.5]}), data_key_column='id')
+        self.assertTrue(table_column_exists('xCached', 'node'))
+        self.assertEqual(get_table_value('node', 'YDL194W', 'xCached'), 1.5)
+        set_node_size_mapping('xCached', [1.0, 2.0], [20, 80], mapping_type='c', style_name='default')
+
+        rename_table_column('xCached', 'xRenamed')
+        self.assertFalse(table_column_exists('xCached', 'node'))
+        self.assertTrue(table_column_exists('xRenamed', 'node'))
+        self.assertRaises(CyError, set_node_size_mapping, 'xCached', [1.0, 2.0], [20, 80], mapping_type='c',
+                          style_name='default')
+
+        delete_table_column('xRenamed')
+        self.assertFalse(table_column_exists('xRenamed', 'node'))
+        self.assertNotIn('xRenamed', get_table_column_types())
+
+        # Verify that the visual property names are cached but can't be changed by the caller
+        vp_names = get_visual_property_names()
+        vp_names.append('BOGUS')
+        self.assertNotIn('BOGUS', get_visual_property_names())
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -60,6 +60,9 @@ def clean_session_file(session_filename):
 def skip_for_ui():
     return os.environ.get('PY4CYTOSCAPE_SKIP_UI_TESTS', 'FALSE').upper() == 'TRUE'
 
+def run_benchmarks():
+    return os.environ.get('PY4CYTOSCAPE_RUN_BENCHMARKS', 'FALSE').upper() == 'TRUE'
+
 def show_test_progress():
     return os.environ.get('PY4CYTOSCAPE_SHOW_TEST_PROGRESS', 'TRUE').upper() == 'TRUE'
 